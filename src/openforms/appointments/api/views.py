@@ -28,6 +28,7 @@ from openforms.submissions.api.permissions import (
 )
 from openforms.submissions.models import Submission
 
+from .. import caching
 from ..exceptions import AppointmentDeleteFailed, CancelAppointmentFailed
 from ..models import Appointment, AppointmentsConfig
 from ..utils import delete_appointment_for_submission, get_plugin
@@ -120,7 +121,7 @@ class ProductsListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-products", span_type="app.appointments.get_products"
         ):
-            return plugin.get_available_products(**kwargs)
+            return caching.get_available_products(plugin, **kwargs)
 
 
 @extend_schema(
@@ -154,7 +155,7 @@ class LocationsListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-locations", span_type="app.appointments.get_locations"
         ):
-            return plugin.get_locations(products)
+            return caching.get_locations(plugin, products)
 
 
 @extend_schema(
@@ -194,7 +195,7 @@ class DatesListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-dates", span_type="app.appointments.get_dates"
         ):
-            dates = plugin.get_dates(products, location)
+            dates = caching.get_dates(plugin, products, location)
         return [{"date": date} for date in dates]
 
 
@@ -243,7 +244,7 @@ class TimesListView(ListMixin, APIView):
         with elasticapm.capture_span(
             name="get-available-times", span_type="app.appointments.get_times"
         ):
-            times = plugin.get_times(products, location, date)
+            times = caching.get_times(plugin, products, location, date)
         return [{"time": time} for time in times]
 
 
@@ -0,0 +1,135 @@
+"""
+Short-lived, shared cache of the availability information of the appointment plugins.
+
+Many citizens browse the same products, locations, dates and times, which the plugins
+retrieve from the remote appointment system on every call. The results of
+:meth:`BasePlugin.get_available_products`, :meth:`BasePlugin.get_locations`,
+:meth:`BasePlugin.get_dates` and :meth:`BasePlugin.get_times` are cached for a
+(configurable) short time in the shared cache instead, regardless of the plugin.
+
+Concurrent cache misses for the same call are coalesced - one process calls the plugin
+while the others wait for the result to appear in the cache. Creating or deleting an
+appointment invalidates the cached information of the plugin, see :func:`invalidate`.
+"""
+
+import logging
+import time
+import uuid
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from typing import Callable, Literal, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import empty
+
+from openforms.utils.cache import get_digest
+
+from .base import BasePlugin, Location, Product
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "appointments-availability"
+CACHE_KEY_VERSION = 1
+
+# how long (in seconds) the process calling the plugin may take before other processes
+# stop waiting for it, and how often they check for the result
+LOCK_TIMEOUT = 10
+POLL_INTERVAL = 0.05
+
+CallType = Literal["products", "locations", "dates", "times"]
+
+T = TypeVar("T")
+
+
+class _Encoder(DjangoJSONEncoder):
+    def default(self, o):
+        if is_dataclass(o):
+            return asdict(o)
+        return super().default(o)
+
+
+def _get_generation(plugin: BasePlugin) -> str:
+    key = f"{CACHE_KEY_PREFIX}|{plugin.identifier}|generation"
+    if (generation := cache.get(key)) is None:
+        cache.add(key, uuid.uuid4().hex, timeout=None)
+        generation = cache.get(key)
+    return generation
+
+
+def get_cache_key(plugin: BasePlugin, call: CallType, arguments: list) -> str:
+    """
+    Build a deterministic cache key for the result of a plugin call.
+    """
+    digest = get_digest(arguments, encoder=_Encoder)
+    generation = _get_generation(plugin)
+    return (
+        f"{CACHE_KEY_PREFIX}|{plugin.identifier}|v{CACHE_KEY_VERSION}|{generation}|"
+        f"{call}|{digest}"
+    )
+
+
+def invalidate(plugin: BasePlugin) -> None:
+    """
+    Discard all the cached availability information of the plugin.
+    """
+    key = f"{CACHE_KEY_PREFIX}|{plugin.identifier}|generation"
+    cache.set(key, uuid.uuid4().hex, timeout=None)
+
+
+def _get_or_call(
+    plugin: BasePlugin, call: CallType, func: Callable[..., T], *args, **kwargs
+) -> T:
+    timeout = settings.APPOINTMENTS_CACHE_TIMEOUTS[call]
+    if not timeout:
+        return func(*args, **kwargs)
+
+    cache_key = get_cache_key(plugin, call, [args, kwargs])
+    value = cache.get(cache_key, empty)
+    if value is not empty:
+        return value
+
+    lock_key = f"{cache_key}|lock"
+    locked = cache.add(lock_key, True, timeout=LOCK_TIMEOUT)
+    if not locked:
+        # another process is calling the plugin, wait for its result
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+            value = cache.get(cache_key, empty)
+            if value is not empty:
+                return value
+            if cache.get(lock_key) is None:  # the other process failed
+                break
+
+    logger.debug("Calling plugin %s for %s (%s)", plugin.identifier, call, cache_key)
+    try:
+        value = func(*args, **kwargs)
+        cache.set(cache_key, value, timeout=timeout)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return value
+
+
+def get_available_products(plugin: BasePlugin, **kwargs) -> list[Product]:
+    return _get_or_call(plugin, "products", plugin.get_available_products, **kwargs)
+
+
+def get_locations(
+    plugin: BasePlugin, products: list[Product] | None = None
+) -> list[Location]:
+    return _get_or_call(plugin, "locations", plugin.get_locations, products)
+
+
+def get_dates(
+    plugin: BasePlugin, products: list[Product], location: Location, **kwargs
+) -> list[date]:
+    return _get_or_call(plugin, "dates", plugin.get_dates, products, location, **kwargs)
+
+
+def get_times(
+    plugin: BasePlugin, products: list[Product], location: Location, day: date
+) -> list[datetime]:
+    return _get_or_call(plugin, "times", plugin.get_times, products, location, day)
@@ -14,6 +14,7 @@ import elasticapm
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
+from . import caching
 from .base import BasePlugin, CustomerDetails, Location, Product
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
@@ -59,6 +60,7 @@ def book(appointment: Appointment, remarks: str = "") -> str:
         customer,
         remarks=remarks,
     )
+    caching.invalidate(plugin)
     appointment_info = AppointmentInfo.objects.create(
         status=AppointmentDetailsStatus.success,
         appointment_id=appointment_id,
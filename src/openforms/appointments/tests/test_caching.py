@@ -0,0 +1,113 @@
+import threading
+from datetime import date
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.utils.tests.cache import clear_caches
+
+from .. import caching
+from ..base import Location, Product
+
+TIMEOUTS = {"products": 60, "locations": 60, "dates": 60, "times": 60}
+
+
+def _get_plugin(identifier: str = "demo") -> Mock:
+    plugin = Mock()
+    plugin.identifier = identifier
+    plugin.get_available_products.return_value = [Product(identifier="1", name="A")]
+    plugin.get_dates.return_value = [date(2024, 1, 1)]
+    return plugin
+
+
+@override_settings(APPOINTMENTS_CACHE_TIMEOUTS=TIMEOUTS)
+class AvailabilityCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+
+    def test_results_are_cached(self):
+        plugin = _get_plugin()
+
+        first = caching.get_available_products(plugin, location_id="1")
+        second = caching.get_available_products(plugin, location_id="1")
+
+        self.assertEqual(first, [Product(identifier="1", name="A")])
+        self.assertEqual(second, first)
+        plugin.get_available_products.assert_called_once_with(location_id="1")
+
+    def test_cache_key_depends_on_arguments_and_plugin(self):
+        plugin, other_plugin = _get_plugin(), _get_plugin("other")
+        products = [Product(identifier="1", name="A")]
+        location = Location(identifier="1", name="Hoofdkantoor")
+
+        caching.get_dates(plugin, products, location)
+        caching.get_dates(plugin, products, Location(identifier="2", name="Bijkantoor"))
+        caching.get_dates(other_plugin, products, location)
+
+        self.assertEqual(plugin.get_dates.call_count, 2)
+        other_plugin.get_dates.assert_called_once()
+
+    def test_invalidate(self):
+        plugin, other_plugin = _get_plugin(), _get_plugin("other")
+        caching.get_available_products(plugin)
+        caching.get_available_products(other_plugin)
+
+        caching.invalidate(plugin)
+
+        caching.get_available_products(plugin)
+        caching.get_available_products(other_plugin)
+        self.assertEqual(plugin.get_available_products.call_count, 2)
+        other_plugin.get_available_products.assert_called_once()
+
+    @override_settings(APPOINTMENTS_CACHE_TIMEOUTS={**TIMEOUTS, "products": 0})
+    def test_cache_disabled_per_call_type(self):
+        plugin = _get_plugin()
+
+        caching.get_available_products(plugin)
+        caching.get_available_products(plugin)
+        caching.get_dates(plugin, [], None)
+        caching.get_dates(plugin, [], None)
+
+        self.assertEqual(plugin.get_available_products.call_count, 2)
+        plugin.get_dates.assert_called_once()
+
+    def test_errors_are_not_cached(self):
+        plugin = _get_plugin()
+        plugin.get_available_products.side_effect = [ValueError("Boom"), []]
+
+        with self.assertRaisesMessage(ValueError, "Boom"):
+            caching.get_available_products(plugin)
+
+        self.assertEqual(caching.get_available_products(plugin), [])
+
+    @patch.object(caching, "POLL_INTERVAL", 0.01)
+    def test_concurrent_calls_are_coalesced(self):
+        plugin = _get_plugin()
+        started, proceed = threading.Event(), threading.Event()
+
+        def get_available_products():
+            started.set()
+            proceed.wait(timeout=5)
+            return [Product(identifier="1", name="A")]
+
+        plugin.get_available_products.side_effect = get_available_products
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(caching.get_available_products(plugin))
+        )
+        thread.start()
+        started.wait(timeout=5)
+
+        # the second call must wait for the result of the first one
+        waiting = threading.Thread(
+            target=lambda: results.append(caching.get_available_products(plugin))
+        )
+        waiting.start()
+        proceed.set()
+        thread.join(timeout=5)
+        waiting.join(timeout=5)
+
+        plugin.get_available_products.assert_called_once()
+        self.assertEqual(results, [[Product(identifier="1", name="A")]] * 2)
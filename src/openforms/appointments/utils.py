@@ -14,6 +14,7 @@ from openforms.forms.models import Form, FormStep
 from openforms.logging import logevent
 from openforms.submissions.models import Submission
 
+from . import caching
 from .base import BasePlugin, Customer, Location, Product
 from .constants import AppointmentDetailsStatus
 from .exceptions import (
@@ -148,6 +149,7 @@ def book_appointment_for_submission(submission: Submission) -> None:
         appointment_id = plugin.create_appointment(
             [product], location, start_at, appointment_client
         )
+        caching.invalidate(plugin)
         appointment_info = AppointmentInfo.objects.create(
             status=AppointmentDetailsStatus.success,
             appointment_id=appointment_id,
@@ -243,6 +245,7 @@ def delete_appointment_for_submission(submission: Submission, plugin=None) -> No
 
     try:
         plugin.delete_appointment(appointment_info.appointment_id)
+        caching.invalidate(plugin)
         appointment_info.cancel()
     except AppointmentDeleteFailed as e:
         logevent.appointment_cancel_failure(appointment_info, plugin, e)
@@ -15,6 +15,7 @@ from openforms.submissions.utils import remove_submission_from_session
 
 from ..constants import FORM_AUTH_SESSION_KEY, REGISTRATOR_SUBJECT_SESSION_KEY
 from ..registry import register
+from ..signals import authentication_logout
 from .serializers import AuthPluginSerializer
 
 
@@ -68,6 +69,8 @@ class SubmissionLogoutView(GenericAPIView):
                 plugin = register[submission.auth_info.plugin]
                 plugin.logout(request)
 
+            authentication_logout.send(sender=self.__class__, request=request)
+
             if not submission.auth_info.attribute_hashed:
                 submission.auth_info.hash_identifying_attributes()
 
@@ -80,6 +80,13 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", "openforms"),
         "HOST": config("DB_HOST", "localhost"),
         "PORT": config("DB_PORT", 5432),
+        # Keep the connections open between requests/tasks. Set to 0 to close the
+        # connection at the end of every request/task.
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=0),
+        "CONN_HEALTH_CHECKS": config("DB_CONN_HEALTH_CHECKS", default=True),
+        # Server-side cursors don't work with the transaction pooling mode of
+        # PgBouncer.
+        "DISABLE_SERVER_SIDE_CURSORS": config("DB_PGBOUNCER", default=False),
     }
 }
 
@@ -274,6 +281,7 @@ MIDDLEWARE = [
     # note: UpdateCSPMiddleware sets data on the **response** for use by RateLimitedCSPMiddleware, so has to come after
     "openforms.utils.middleware.UpdateCSPMiddleware",
     "openforms.middleware.CanNavigateBetweenStepsMiddleware",
+    "openforms.logging.middleware.BufferedAuditLogMiddleware",
 ]
 
 ROOT_URLCONF = "openforms.urls"
@@ -598,6 +606,49 @@ TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
 # Zip files for file exports: after how long should they be deleted
 FORMS_EXPORT_REMOVED_AFTER_DAYS = config("FORMS_EXPORT_REMOVED_AFTER_DAYS", default=7)
 
+# Compile the JSON logic expressions of logic rules into Python callables (cached
+# in-process) rather than interpreting them on every evaluation.
+LOGIC_COMPILE_EXPRESSIONS = config("LOGIC_COMPILE_EXPRESSIONS", default=True)
+
+# Maximum number of independent service fetch/DMN logic actions that are evaluated
+# concurrently. Set to 1 to evaluate them one after the other.
+LOGIC_MAX_CONCURRENT_ACTIONS = config("LOGIC_MAX_CONCURRENT_ACTIONS", default=4)
+
+# Number of submissions that are processed per query/transaction by the data removal
+# tasks.
+DATA_REMOVAL_CHUNK_SIZE = config("DATA_REMOVAL_CHUNK_SIZE", default=500)
+# Maximum number of submissions deleted per second by the data removal task, to spread
+# the load on the database. Set to 0 to disable.
+DATA_REMOVAL_RATE_LIMIT = config("DATA_REMOVAL_RATE_LIMIT", default=0)
+
+# Collect the audit log entries created during a request or task and write them with
+# a single query at the end, instead of one query per entry.
+AUDITLOG_BUFFERED = config("AUDITLOG_BUFFERED", default=False)
+
+# Documents larger than this size are base64 encoded while they are sent to the
+# Documenten API or StUF-ZDS, instead of in memory before sending the request.
+DOCUMENT_STREAMING_THRESHOLD = config(
+    "DOCUMENT_STREAMING_THRESHOLD", default="1M", cast=Filesize()
+)
+
+# Time (in seconds) to keep the parsed WSDL of a SOAP service in memory, so that the
+# SOAP clients don't download and parse the WSDL again for every request. Set to 0 to
+# disable.
+SOAP_WSDL_CACHE_TIMEOUT = config("SOAP_WSDL_CACHE_TIMEOUT", default=60 * 60)
+
+# Time (in seconds) to cache the availability information retrieved through the
+# appointment plugins, per type of call. Set to 0 to disable.
+APPOINTMENTS_CACHE_TIMEOUTS = {
+    "products": config("APPOINTMENTS_PRODUCTS_CACHE_TIMEOUT", default=5 * 60),
+    "locations": config("APPOINTMENTS_LOCATIONS_CACHE_TIMEOUT", default=5 * 60),
+    "dates": config("APPOINTMENTS_DATES_CACHE_TIMEOUT", default=60),
+    "times": config("APPOINTMENTS_TIMES_CACHE_TIMEOUT", default=30),
+}
+
+# Time (in seconds) to cache the prefill values for the other submissions started in
+# the same session. Disabled (0) by default.
+PREFILL_CACHE_TIMEOUT = config("PREFILL_CACHE_TIMEOUT", default=0)
+
 # a custom default timeout for the requests library, added via monkeypatch in
 # :mod:`openforms.setup`. Value is in seconds.
 DEFAULT_TIMEOUT_REQUESTS = config("DEFAULT_TIMEOUT_REQUESTS", default=10.0)
@@ -858,6 +909,10 @@ ELASTIC_APM = {
     "SERVICE_NAME": f"Open Forms - {ENVIRONMENT}",
     "SECRET_TOKEN": config("ELASTIC_APM_SECRET_TOKEN", "default"),
     "SERVER_URL": ELASTIC_APM_SERVER_URL,
+    "METRICS_SETS": [
+        "elasticapm.metrics.sets.cpu.CPUMetricSet",
+        "openforms.utils.db_metrics.ConnectionMetricSet",
+    ],
 }
 if not ELASTIC_APM_SERVER_URL:
     ELASTIC_APM["ENABLED"] = False
@@ -1,11 +1,18 @@
+import json
 from base64 import b64encode
 from typing import BinaryIO, Literal, TypeAlias
 
+from django.conf import settings
 from django.core.files.base import ContentFile
 
 from zgw_consumers.nlx import NLXClient
 
 from openforms.translations.utils import to_iso639_2b
+from openforms.utils.api_clients import (
+    Base64StreamingBody,
+    get_base64_placeholder,
+    get_content_size,
+)
 from openforms.utils.date import get_today
 
 DocumentStatus: TypeAlias = Literal[
@@ -34,8 +41,8 @@ class DocumentenClient(NLXClient):
     ):
         assert author, "author must be a non-empty string"
         today = get_today()
-        file_content = content.read()
-        base64_body = b64encode(file_content).decode()
+        size = get_content_size(content)
+        placeholder = get_base64_placeholder()
         data = {
             "informatieobjecttype": informatieobjecttype,
             "bronorganisatie": bronorganisatie,
@@ -44,21 +51,28 @@ class DocumentenClient(NLXClient):
             "auteur": author,
             "taal": to_iso639_2b(language),
             "formaat": format,
-            "inhoud": base64_body,
+            "inhoud": placeholder,
             "status": status,
             "bestandsnaam": filename,
             "ontvangstdatum": received_date,
             "beschrijving": description,
             "indicatieGebruiksrecht": False,
-            "bestandsomvang": (
-                content.size if hasattr(content, "size") else len(file_content)
-            ),
+            "bestandsomvang": size,
         }
 
         if vertrouwelijkheidaanduiding:
             data["vertrouwelijkheidaanduiding"] = vertrouwelijkheidaanduiding
 
-        response = self.post("enkelvoudiginformatieobjecten", json=data)
+        if size > settings.DOCUMENT_STREAMING_THRESHOLD:
+            # encode the content while sending, instead of loading it in memory
+            response = self.post(
+                "enkelvoudiginformatieobjecten",
+                data=Base64StreamingBody(json.dumps(data), content, placeholder),
+                headers={"Content-Type": "application/json"},
+            )
+        else:
+            data["inhoud"] = b64encode(content.read()).decode()
+            response = self.post("enkelvoudiginformatieobjecten", json=data)
         response.raise_for_status()
 
         return response.json()
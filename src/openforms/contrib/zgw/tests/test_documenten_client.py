@@ -0,0 +1,63 @@
+import json
+from base64 import b64encode
+from io import BytesIO
+
+from django.test import SimpleTestCase, override_settings
+
+import requests_mock
+
+from ..clients import DocumentenClient
+
+
+@requests_mock.Mocker()
+class DocumentenClientTests(SimpleTestCase):
+    def _create_document(self, content: bytes, title: str = "Attachment"):
+        client = DocumentenClient(base_url="https://documenten.nl/api/v1/")
+        with client:
+            return client.create_document(
+                informatieobjecttype="https://catalogi.nl/api/v1/informatieobjecttypen/1",
+                bronorganisatie="000000000",
+                title=title,
+                author="Aanvrager",
+                language="nl",
+                format="application/pdf",
+                content=BytesIO(content),
+                status="definitief",
+                filename="attachment.pdf",
+            )
+
+    def test_create_document(self, m):
+        m.post("https://documenten.nl/api/v1/enkelvoudiginformatieobjecten", json={})
+
+        self._create_document(b"content")
+
+        data = m.last_request.json()
+        self.assertEqual(data["inhoud"], "Y29udGVudA==")
+        self.assertEqual(data["bestandsomvang"], 7)
+
+    @override_settings(DOCUMENT_STREAMING_THRESHOLD=10)
+    def test_create_large_document_is_streamed(self, m):
+        m.post("https://documenten.nl/api/v1/enkelvoudiginformatieobjecten", json={})
+        content = b"x" * 1000
+
+        self._create_document(content)
+
+        request = m.last_request
+        body = b"".join(request.body)
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.headers["Content-Length"], str(len(body)))
+        data = json.loads(body)
+        self.assertEqual(data["inhoud"], b64encode(content).decode())
+        self.assertEqual(data["bestandsomvang"], 1000)
+        self.assertEqual(data["titel"], "Attachment")
+
+    @override_settings(DOCUMENT_STREAMING_THRESHOLD=10)
+    def test_streamed_document_with_placeholder_like_title(self, m):
+        m.post("https://documenten.nl/api/v1/enkelvoudiginformatieobjecten", json={})
+        content = b"x" * 1000
+
+        self._create_document(content, title="__base64_content__")
+
+        data = json.loads(b"".join(m.last_request.body))
+        self.assertEqual(data["inhoud"], b64encode(content).decode())
+        self.assertEqual(data["titel"], "__base64_content__")
@@ -1,18 +1,59 @@
-import itertools
 import logging
+import time
 from datetime import timedelta
+from functools import partial
 
+from django.conf import settings
+from django.db import transaction
 from django.db.models import F
 
 from openforms.celery import app
 from openforms.submissions.constants import RegistrationStatuses
 from openforms.submissions.models import Submission
+from openforms.submissions.query import SubmissionQuerySet
+from openforms.utils.files import defer_file_deletes
+from openforms.utils.tasks import delete_files
 
 from .constants import RemovalMethods
 
 logger = logging.getLogger(__name__)
 
 
+def _delete_in_chunks(queryset: SubmissionQuerySet) -> int:
+    """
+    Delete the submissions in the queryset in chunks.
+
+    Every chunk is deleted in its own transaction, which limits the number of related
+    objects loaded in memory and the time locks are held. The chunks are taken in
+    primary key order - if the task is interrupted, the chunks that were deleted stay
+    deleted and the next run continues with the remaining submissions. The files of
+    the deleted records are removed by a separate task.
+    """
+    chunk_size = settings.DATA_REMOVAL_CHUNK_SIZE
+    rate_limit = settings.DATA_REMOVAL_RATE_LIMIT
+    ids = queryset.order_by("pk").values_list("pk", flat=True)
+
+    start = time.monotonic()
+    num_deleted = 0
+    last_pk = 0
+    while chunk := list(ids.filter(pk__gt=last_pk)[:chunk_size]):
+        last_pk = chunk[-1]
+        with defer_file_deletes() as files, transaction.atomic():
+            Submission.objects.filter(pk__in=chunk).delete()
+        if files:
+            transaction.on_commit(partial(delete_files.delay, files))
+        num_deleted += len(chunk)
+        logger.debug("Deleted %s submissions up to ID %s", num_deleted, last_pk)
+
+        if rate_limit:
+            # wait until the deleted number of submissions is within the limit
+            delay = num_deleted / rate_limit - (time.monotonic() - start)
+            if delay > 0:
+                time.sleep(delay)
+
+    return num_deleted
+
+
 @app.task(ignore_result=True)
 def delete_submissions():
     logger.debug("Deleting submissions")
@@ -28,7 +69,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s successful submissions", successful_submissions_to_delete.count()
     )
-    successful_submissions_to_delete.delete()
+    _delete_in_chunks(successful_submissions_to_delete)
 
     incomplete_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "incomplete_submissions_removal_limit",
@@ -44,7 +85,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s incomplete submissions", incomplete_submissions_to_delete.count()
     )
-    incomplete_submissions_to_delete.delete()
+    _delete_in_chunks(incomplete_submissions_to_delete)
 
     errored_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "errored_submissions_removal_limit",
@@ -58,7 +99,7 @@ def delete_submissions():
     logger.info(
         "Deleting %s errored submissions", errored_submissions_to_delete.count()
     )
-    errored_submissions_to_delete.delete()
+    _delete_in_chunks(errored_submissions_to_delete)
 
     other_submissions_to_delete = Submission.objects.annotate_removal_fields(
         "all_submissions_removal_limit"
@@ -69,7 +110,7 @@ def delete_submissions():
         "Deleting %s other submissions regardless of registration",
         other_submissions_to_delete.count(),
     )
-    other_submissions_to_delete.delete()
+    _delete_in_chunks(other_submissions_to_delete)
 
 
 @app.task(ignore_result=True)
@@ -122,9 +163,28 @@ def make_sensitive_data_anonymous() -> None:
         errored_submissions.count(),
     )
 
-    for submission in itertools.chain(
-        successful_submissions.iterator(),
-        incomplete_submissions.iterator(),
-        errored_submissions.iterator(),
+    start = time.monotonic()
+    num_anonymized = 0
+    for queryset in (
+        successful_submissions,
+        incomplete_submissions,
+        errored_submissions,
     ):
-        submission.remove_sensitive_data()
+        # process the submissions in chunks to keep the transactions short
+        ids = queryset.order_by("pk").values_list("pk", flat=True)
+        last_pk = 0
+        while chunk := list(
+            ids.filter(pk__gt=last_pk)[: settings.DATA_REMOVAL_CHUNK_SIZE]
+        ):
+            last_pk = chunk[-1]
+            num_anonymized += Submission.objects.filter(
+                pk__in=chunk
+            ).remove_sensitive_data()
+
+    duration = time.monotonic() - start
+    logger.info(
+        "Anonymized %s submissions in %.2f seconds (%.1f submissions per second)",
+        num_anonymized,
+        duration,
+        num_anonymized / duration if duration else num_anonymized,
+    )
@@ -1,10 +1,12 @@
 from datetime import timedelta
+from unittest.mock import patch
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase, tag
+from django.test import TestCase, override_settings, tag
 from django.utils import timezone
 
 from freezegun import freeze_time
+from privates.test import temp_private_root
 
 from openforms.config.models import GlobalConfiguration
 from openforms.forms.models.form_step import FormStep
@@ -18,10 +20,14 @@ from openforms.submissions.constants import (
     SubmissionValueVariableSources,
 )
 from openforms.submissions.models import Submission, SubmissionValueVariable
+from openforms.submissions.query import SubmissionQuerySet
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
+    SubmissionFileAttachmentFactory,
+    SubmissionReportFactory,
     SubmissionStepFactory,
 )
+from openforms.utils.tasks import delete_files
 
 from ..constants import RemovalMethods
 from ..tasks import delete_submissions, make_sensitive_data_anonymous
@@ -375,6 +381,87 @@ class DeleteSubmissionsTask(TestCase):
             submission_to_be_deleted.refresh_from_db()
 
 
+@temp_private_root()
+@override_settings(DATA_REMOVAL_CHUNK_SIZE=2)
+class ChunkedDeleteSubmissionsTask(TestCase):
+    def _create_expired_submissions(self, count: int) -> list[Submission]:
+        config = GlobalConfiguration.get_solo()
+        before_limit = timezone.now() - timedelta(
+            days=config.successful_submissions_removal_limit + 1
+        )
+        with freeze_time(before_limit):
+            return SubmissionFactory.create_batch(count, registration_success=True)
+
+    def test_submissions_deleted_in_chunks(self):
+        self._create_expired_submissions(5)
+        recent_submission = SubmissionFactory.create(registration_success=True)
+
+        with patch.object(
+            Submission.objects, "filter", wraps=Submission.objects.filter
+        ) as mock_filter:
+            delete_submissions()
+
+        chunks = [
+            call.kwargs["pk__in"]
+            for call in mock_filter.call_args_list
+            if "pk__in" in call.kwargs
+        ]
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 1])
+        self.assertEqual(list(Submission.objects.all()), [recent_submission])
+
+    def test_files_removed_by_separate_task(self):
+        submission = self._create_expired_submissions(1)[0]
+        step = SubmissionStepFactory.create(submission=submission)
+        attachment = SubmissionFileAttachmentFactory.create(submission_step=step)
+        report = SubmissionReportFactory.create(submission=submission)
+        storage = attachment.content.storage
+
+        with (
+            patch("openforms.data_removal.tasks.delete_files.delay") as mock_delay,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            delete_submissions()
+
+        self.assertFalse(Submission.objects.exists())
+        mock_delay.assert_called_once()
+        files = mock_delay.call_args.args[0]
+        self.assertCountEqual(
+            files,
+            [
+                (
+                    "submissions.SubmissionFileAttachment",
+                    "content",
+                    attachment.content.name,
+                ),
+                ("submissions.SubmissionReport", "content", report.content.name),
+            ],
+        )
+        # the files are only deleted by the task
+        self.assertTrue(storage.exists(attachment.content.name))
+        self.assertTrue(storage.exists(report.content.name))
+
+        delete_files(files)
+
+        self.assertFalse(storage.exists(attachment.content.name))
+        self.assertFalse(storage.exists(report.content.name))
+
+    @override_settings(DATA_REMOVAL_RATE_LIMIT=1)
+    def test_rate_limit(self):
+        self._create_expired_submissions(3)
+
+        with (
+            patch("openforms.data_removal.tasks.time.monotonic", return_value=0),
+            patch("openforms.data_removal.tasks.time.sleep") as mock_sleep,
+        ):
+            delete_submissions()
+
+        self.assertFalse(Submission.objects.exists())
+        # one second per deleted submission
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list], [2.0, 3.0]
+        )
+
+
 class MakeSensitiveDataAnonymousTask(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -1311,3 +1398,56 @@ class MakeSensitiveDataAnonymousTask(TestCase):
                 "This is also not sensitive",
             )
             self.assertTrue(submission_to_be_anonymous._is_cleaned)
+
+    @override_settings(DATA_REMOVAL_CHUNK_SIZE=2)
+    def test_submissions_anonymized_in_chunks(self):
+        config = GlobalConfiguration.get_solo()
+        other_form = FormFactory.create(
+            successful_submissions_removal_method=RemovalMethods.make_anonymous,
+        )
+        self._add_form_steps(other_form)
+        submissions = [
+            SubmissionFactory.create(registration_success=True, form=form)
+            for form in [self.form] * 3 + [other_form]
+        ]
+        for submission in submissions:
+            # Passing created_on to the factory create method does not work
+            submission.created_on = timezone.now() - timedelta(
+                days=config.successful_submissions_removal_limit + 1
+            )
+            submission.save()
+            SubmissionStepFactory.create(
+                data={"textFieldSensitive": "This is sensitive"},
+                form_step=submission.form.formstep_set.all()[0],
+                submission=submission,
+            )
+
+        with (
+            patch(
+                "openforms.submissions.query.SubmissionQuerySet.remove_sensitive_data",
+                autospec=True,
+                side_effect=SubmissionQuerySet.remove_sensitive_data,
+            ) as mock_remove,
+            self.assertLogs("openforms.data_removal.tasks", level="INFO") as logs,
+        ):
+            make_sensitive_data_anonymous()
+
+        chunks = [
+            sorted(call.args[0].values_list("pk", flat=True))
+            for call in mock_remove.call_args_list
+        ]
+        # the chunks are taken in primary key order, regardless of the form
+        self.assertEqual(
+            chunks,
+            [
+                [submissions[0].pk, submissions[1].pk],
+                [submissions[2].pk, submissions[3].pk],
+            ],
+        )
+        self.assertFalse(
+            SubmissionValueVariable.objects.filter(
+                key="textFieldSensitive", value="This is sensitive"
+            ).exists()
+        )
+        self.assertEqual(Submission.objects.filter(_is_cleaned=True).count(), 4)
+        self.assertIn("Anonymized 4 submissions", logs.output[-1])
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable
 
 from openforms.plugins.plugin import AbstractBasePlugin
 
@@ -48,6 +48,21 @@ class BasePlugin(ABC, AbstractBasePlugin):
         """
         raise NotImplementedError()
 
+    def get_evaluator(
+        self, definition_id: str, *, version: str = ""
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        """
+        Prepare the evaluation of the decision definition.
+
+        The returned callable is invoked with the input data, possibly in another
+        thread - plugins that need database access (e.g. to load their configuration)
+        to evaluate a decision definition must override this method to do that up
+        front.
+        """
+        return lambda input_values: self.evaluate(
+            definition_id, version=version, input_values=input_values
+        )
+
     def get_decision_definition_versions(
         self, definition_id: str
     ) -> list[DecisionDefinitionVersion]:
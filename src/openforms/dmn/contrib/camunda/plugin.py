@@ -1,6 +1,6 @@
 import json
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from django.utils.translation import gettext_lazy as _
 
@@ -9,6 +9,7 @@ import simplejson  # dependency pulled in via mail-parser...
 from django_camunda.client import Camunda, get_client
 from django_camunda.dmn import evaluate_dmn, get_dmn_parser
 from django_camunda.dmn.datastructures import DMNIntrospectionResult
+from django_camunda.models import CamundaConfig
 
 from ...base import BasePlugin, DecisionDefinition, DecisionDefinitionVersion
 from ...registry import register
@@ -73,9 +74,13 @@ class Plugin(BasePlugin):
 
     @staticmethod
     def evaluate(
-        definition_id: str, *, version: str = "", input_values: dict[str, Any]
+        definition_id: str,
+        *,
+        version: str = "",
+        input_values: dict[str, Any],
+        config: CamundaConfig | None = None,
     ) -> dict[str, Any]:
-        with get_client() as client:
+        with get_client(config) as client:
             camunda_id = _get_decision_definition_id(client, definition_id, version)
             try:
                 result = evaluate_dmn(
@@ -89,6 +94,15 @@ class Plugin(BasePlugin):
                 return {}
         return result
 
+    def get_evaluator(
+        self, definition_id: str, *, version: str = ""
+    ) -> Callable[[dict[str, Any]], dict[str, Any]]:
+        # load the configuration now, the evaluation may happen in a worker thread
+        config = CamundaConfig.get_solo()
+        return lambda input_values: self.evaluate(
+            definition_id, version=version, input_values=input_values, config=config
+        )
+
     @staticmethod
     def get_decision_definition_versions(
         definition_id: str,
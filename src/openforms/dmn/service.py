@@ -2,12 +2,12 @@
 Public Python API for the DMN module.
 """
 
-from typing import Any
+from typing import Any, Callable
 
 from .base import BasePlugin
 from .registry import register
 
-__all__ = ["evaluate_dmn", "VariablesMapping"]
+__all__ = ["evaluate_dmn", "get_dmn_evaluator", "VariablesMapping"]
 
 VariablesMapping = dict[str, Any]
 
@@ -33,3 +33,24 @@ def evaluate_dmn(
     """
     plugin: BasePlugin = register[plugin_id]
     return plugin.evaluate(definition_id, version=version, input_values=input_values)
+
+
+def get_dmn_evaluator(
+    plugin_id: str, definition_id: str, *, version: str = ""
+) -> Callable[[VariablesMapping], VariablesMapping]:
+    """
+    Prepare the evaluation of the decision definition using the specified plugin.
+
+    The plugin and its configuration are resolved in the calling thread, the returned
+    callable only performs the evaluation and can safely be invoked in a worker
+    thread.
+
+    :arg plugin_id: identifier of the plugin to use for evaluation
+    :arg definition_id: identifier of the decision definition to evaluate
+    :arg version: optional version of the definition to evaluate, see
+      :func:`evaluate_dmn`.
+    :returns: A callable taking the input variables mapping and returning the output
+      variables mapping.
+    """
+    plugin: BasePlugin = register[plugin_id]
+    return plugin.get_evaluator(definition_id, version=version)
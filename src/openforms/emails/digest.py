@@ -2,11 +2,23 @@ import logging
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from itertools import groupby
 from typing import Iterable
 
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Q
+from django.contrib.postgres.aggregates import ArrayAgg, BoolOr
+from django.db.models import (
+    BooleanField,
+    Count,
+    ExpressionWrapper,
+    IntegerField,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+)
+from django.db.models.fields.json import KeyTextTransform
+from django.db.models.functions import Cast
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -161,80 +173,112 @@ def collect_failed_emails(since: datetime) -> Iterable[FailedEmail]:
     return failed_emails
 
 
+def _submission_form_id() -> Subquery:
+    # the log entries refer to the submission with a generic relation
+    return Subquery(
+        Submission.objects.filter(
+            pk=Cast(OuterRef("object_id"), output_field=IntegerField())
+        ).values("form_id")[:1]
+    )
+
+
+def _has_errors() -> BoolOr:
+    return BoolOr(
+        ExpressionWrapper(
+            Q(extra_data__error__isnull=False) & ~Q(extra_data__error=""),
+            output_field=BooleanField(),
+        )
+    )
+
+
 def collect_failed_registrations(
     since: datetime,
 ) -> list[FailedRegistration]:
-    logs = TimelineLogProxy.objects.filter(
-        timestamp__gt=since,
-        extra_data__log_event="registration_failure",
-    ).order_by("timestamp")
-
-    form_sorted_logs = sorted(logs, key=lambda x: x.content_object.form.admin_name)
-
-    grouped_logs = groupby(form_sorted_logs, key=lambda log: log.content_object.form)
-
-    failed_registrations = []
-    for form, submission_logs in grouped_logs:
-        logs = list(submission_logs)
-        timestamps = []
-        has_errors = False
-
-        for log in logs:
-            timestamps.append(log.timestamp)
-            has_errors = has_errors or bool(log.extra_data.get("error"))
-
-        failed_registrations.append(
-            FailedRegistration(
-                form_name=form.name,
-                failed_submissions_counter=len(logs),
-                initial_failure_at=min(timestamps),
-                last_failure_at=max(timestamps),
-                admin_link=get_filtered_submission_admin_url(
-                    form.id, filter_retry=True, registration_time="24hAgo"
-                ),
-                has_errors=has_errors,
-            )
+    failures = (
+        TimelineLogProxy.objects.filter(
+            content_type=ContentType.objects.get_for_model(Submission),
+            timestamp__gt=since,
+        )
+        .filter_event("registration_failure")
+        .annotate(form_id=_submission_form_id())
+        .filter(form_id__isnull=False)
+        .values("form_id")
+        .annotate(
+            counter=Count("pk"),
+            initial_failure_at=Min("timestamp"),
+            last_failure_at=Max("timestamp"),
+            has_errors=_has_errors(),
+        )
+        .order_by()
+    )
+    failures = list(failures)
+    forms = Form.objects.in_bulk([failure["form_id"] for failure in failures])
+
+    failed_registrations = [
+        FailedRegistration(
+            form_name=forms[failure["form_id"]].name,
+            failed_submissions_counter=failure["counter"],
+            initial_failure_at=failure["initial_failure_at"],
+            last_failure_at=failure["last_failure_at"],
+            admin_link=get_filtered_submission_admin_url(
+                failure["form_id"], filter_retry=True, registration_time="24hAgo"
+            ),
+            has_errors=bool(failure["has_errors"]),
         )
+        for failure in sorted(
+            failures, key=lambda failure: forms[failure["form_id"]].admin_name
+        )
+    ]
 
     return failed_registrations
 
 
 def collect_failed_prefill_plugins(since: datetime) -> list[FailedPrefill]:
-    logs = TimelineLogProxy.objects.filter(
-        timestamp__gt=since,
-        extra_data__log_event__in=[
-            "prefill_retrieve_empty",
-            "prefill_retrieve_failure",
-        ],
-    ).order_by("extra_data__plugin_label")
-
-    grouped_logs = groupby(logs, key=lambda x: x.extra_data["plugin_label"])
-
-    failed_prefill_plugins = []
-    for prefill_plugin, submission_logs in grouped_logs:
-        logs = list(submission_logs)
-
-        timestamps = []
-        forms = set()
-        submission_ids = []
-        has_errors = False
-
-        for log in logs:
-            timestamps.append(log.timestamp)
-            forms.add(log.content_object.form.admin_name)
-            submission_ids.append(log.object_id)
-            has_errors = has_errors or bool(log.extra_data.get("error"))
-
-        failed_prefill_plugins.append(
-            FailedPrefill(
-                plugin_label=prefill_plugin,
-                form_names=sorted(forms),
-                submission_ids=submission_ids,
-                initial_failure_at=min(timestamps),
-                last_failure_at=max(timestamps),
-                has_errors=has_errors,
-            )
+    failures = (
+        TimelineLogProxy.objects.filter(
+            content_type=ContentType.objects.get_for_model(Submission),
+            timestamp__gt=since,
+            extra_data__log_event__in=[
+                "prefill_retrieve_empty",
+                "prefill_retrieve_failure",
+            ],
+        )
+        .annotate(
+            plugin_label=KeyTextTransform("plugin_label", "extra_data"),
+            form_id=_submission_form_id(),
         )
+        .values("plugin_label")
+        .annotate(
+            form_ids=ArrayAgg("form_id", distinct=True),
+            submission_ids=ArrayAgg("object_id", ordering="timestamp"),
+            initial_failure_at=Min("timestamp"),
+            last_failure_at=Max("timestamp"),
+            has_errors=_has_errors(),
+        )
+        .order_by("plugin_label")
+    )
+    failures = list(failures)
+    forms = Form.objects.in_bulk(
+        {form_id for failure in failures for form_id in failure["form_ids"]}
+    )
+
+    failed_prefill_plugins = [
+        FailedPrefill(
+            plugin_label=failure["plugin_label"],
+            form_names=sorted(
+                {
+                    forms[form_id].admin_name
+                    for form_id in failure["form_ids"]
+                    if form_id in forms
+                }
+            ),
+            submission_ids=failure["submission_ids"],
+            initial_failure_at=failure["initial_failure_at"],
+            last_failure_at=failure["last_failure_at"],
+            has_errors=bool(failure["has_errors"]),
+        )
+        for failure in failures
+    ]
 
     return failed_prefill_plugins
 
@@ -173,6 +173,47 @@ class FailedRegistrationsTests(TestCase):
         self.assertEqual(failed_registrations[0].failed_submissions_counter, 2)
         self.assertEqual(failed_registrations[1].failed_submissions_counter, 1)
 
+    def test_failed_registrations_are_aggregated_per_form(self):
+        form_1 = FormFactory.create(name="B form", internal_name="")
+        form_2 = FormFactory.create(name="Public name", internal_name="A form")
+        submission_1 = SubmissionFactory.create(form=form_1, registration_failed=True)
+        submission_2 = SubmissionFactory.create(form=form_2, registration_failed=True)
+
+        with freeze_time("2023-01-02T08:00:00+01:00"):
+            logevent.registration_failure(submission_1, RegistrationFailed("Boom"))
+        with freeze_time("2023-01-02T09:00:00+01:00"):
+            logevent.registration_failure(submission_1, RegistrationFailed(""))
+        with freeze_time("2023-01-02T10:00:00+01:00"):
+            logevent.registration_failure(submission_2, RegistrationFailed(""))
+        # log entries of deleted submissions are ignored
+        deleted_submission = SubmissionFactory.create(registration_failed=True)
+        logevent.registration_failure(deleted_submission, RegistrationFailed("Boom"))
+        deleted_submission.delete()
+
+        with self.assertNumQueries(2):
+            failed_registrations = collect_failed_registrations(
+                since=datetime(2023, 1, 1, 14, 30, 0).replace(tzinfo=utc)
+            )
+
+        # sorted by admin name
+        self.assertEqual(
+            [registration.form_name for registration in failed_registrations],
+            ["Public name", "B form"],
+        )
+        registration_2, registration_1 = failed_registrations
+        self.assertEqual(registration_1.failed_submissions_counter, 2)
+        self.assertEqual(
+            registration_1.initial_failure_at,
+            datetime(2023, 1, 2, 7, 0, 0).replace(tzinfo=utc),
+        )
+        self.assertEqual(
+            registration_1.last_failure_at,
+            datetime(2023, 1, 2, 8, 0, 0).replace(tzinfo=utc),
+        )
+        self.assertTrue(registration_1.has_errors)
+        self.assertEqual(registration_2.failed_submissions_counter, 1)
+        self.assertFalse(registration_2.has_errors)
+
     def test_timestamp_constraint_returns_no_results(self):
         form = FormFactory.create()
         submission = SubmissionFactory.create(form=form, registration_failed=True)
@@ -227,6 +268,58 @@ class FailedPrefillTests(TestCase):
         self.assertEqual(failed_plugins[0].failed_submissions_counter, 2)
         self.assertEqual(failed_plugins[1].failed_submissions_counter, 1)
 
+    def test_prefill_plugin_failures_are_aggregated_per_plugin(self):
+        hc_plugin = prefill_register["haalcentraal"]
+        stufbg_plugin = prefill_register["stufbg"]
+        form_1 = FormFactory.create(name="B form")
+        form_2 = FormFactory.create(name="Public name", internal_name="A form")
+        submission_1 = SubmissionFactory.create(form=form_1)
+        submission_2 = SubmissionFactory.create(form=form_2)
+        submission_3 = SubmissionFactory.create(form=form_1)
+
+        with freeze_time("2023-01-02T08:00:00+01:00"):
+            logevent.prefill_retrieve_empty(
+                submission_1, hc_plugin, ["burgerservicenummer"]
+            )
+        with freeze_time("2023-01-02T09:00:00+01:00"):
+            logevent.prefill_retrieve_failure(
+                submission_2, hc_plugin, NoServiceConfigured("No service")
+            )
+        with freeze_time("2023-01-02T10:00:00+01:00"):
+            logevent.prefill_retrieve_empty(
+                submission_3, hc_plugin, ["burgerservicenummer"]
+            )
+            logevent.prefill_retrieve_empty(
+                submission_3, stufbg_plugin, ["burgerservicenummer"]
+            )
+
+        with self.assertNumQueries(2):
+            failed_plugins = collect_failed_prefill_plugins(
+                since=datetime(2023, 1, 2, 2, 0, 0).replace(tzinfo=utc)
+            )
+
+        self.assertEqual(len(failed_plugins), 2)
+        # sorted by plugin label
+        hc_failure, stufbg_failure = failed_plugins
+        self.assertEqual(hc_failure.plugin_label, str(hc_plugin.verbose_name))
+        self.assertEqual(hc_failure.form_names, ["A form", "B form"])
+        self.assertEqual(
+            hc_failure.submission_ids,
+            [str(submission_1.pk), str(submission_2.pk), str(submission_3.pk)],
+        )
+        self.assertEqual(
+            hc_failure.initial_failure_at,
+            datetime(2023, 1, 2, 7, 0, 0).replace(tzinfo=utc),
+        )
+        self.assertEqual(
+            hc_failure.last_failure_at,
+            datetime(2023, 1, 2, 9, 0, 0).replace(tzinfo=utc),
+        )
+        self.assertTrue(hc_failure.has_errors)
+        self.assertEqual(stufbg_failure.form_names, ["B form"])
+        self.assertEqual(stufbg_failure.submission_ids, [str(submission_3.pk)])
+        self.assertFalse(stufbg_failure.has_errors)
+
     def test_timestamp_constraint_returns_no_results(self):
         hc_plugin = prefill_register["haalcentraal"]
 
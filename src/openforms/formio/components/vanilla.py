@@ -410,6 +410,10 @@ class File(BasePlugin[FileComponent]):
             required=required,
         )
 
+    def has_static_serializer_field(self, component: FileComponent) -> bool:
+        # the default file types can be changed in the global configuration
+        return not component.get("useConfigFiletypes")
+
 
 @register("textarea")
 class TextArea(BasePlugin[Component]):
@@ -1,11 +1,13 @@
 import re
-from collections import UserDict
+import threading
+from collections import OrderedDict, UserDict
 from collections.abc import Hashable
-from typing import Iterator, cast
+from dataclasses import dataclass
+from typing import Iterator, TypeAlias, cast
 
 from glom import PathAccessError, assign, glom
 
-from openforms.typing import DataMapping, JSONValue
+from openforms.typing import DataMapping, JSONObject, JSONValue
 
 from .typing import Component, EditGridComponent, FormioConfiguration
 from .utils import flatten_by_path, is_visible_in_frontend, iter_components
@@ -14,6 +16,9 @@ from .utils import flatten_by_path, is_visible_in_frontend, iter_components
 
 RE_PATH = re.compile(r"(components|columns|rows)\.([0-9]+)")
 
+# number of configuration indices to keep in the process-wide cache
+CONFIGURATION_INDEX_CACHE_SIZE = 1024
+
 
 def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Component]:
     """
@@ -35,12 +40,168 @@ def _get_editgrid_component_map(component: EditGridComponent) -> dict[str, Compo
     return component_map
 
 
+# number of components and the number of components in each column
+NodeShape: TypeAlias = tuple[int, tuple[int, ...]]
+
+
+def _get_shape(node: Component | FormioConfiguration) -> NodeShape:
+    """
+    Describe the direct children of a node in the configuration tree.
+    """
+    columns = node.get("columns")
+    return (
+        len(node.get("components") or ()),
+        (
+            tuple(len(column.get("components") or ()) for column in columns)
+            if isinstance(columns, list)
+            else ()
+        ),
+    )
+
+
+def _resolve(configuration: FormioConfiguration, bits: tuple[str | int, ...]):
+    node = configuration
+    for bit in bits:
+        node = node[bit]
+    return node
+
+
+@dataclass(frozen=True)
+class IndexedComponent:
+    path: str
+    bits: tuple[str | int, ...]
+    key: str
+    type: str
+    shape: NodeShape
+
+
+@dataclass(frozen=True)
+class FormioConfigurationIndex:
+    """
+    Immutable index of the components in a Formio configuration.
+
+    The index only describes the structure of the configuration - where each
+    component is located - and not the components themselves, so it can be shared
+    between (mutable) copies of the same configuration. Binding it to a configuration
+    restores the component maps of :class:`FormioConfigurationWrapper` without
+    walking the entire configuration tree again.
+    """
+
+    root_shape: NodeShape
+    # depth-first ordered, the same order as :attr:`FormioConfigurationWrapper.flattened_by_path`
+    components: tuple[IndexedComponent, ...]
+    # key in the component map -> position in ``components``
+    component_map: dict[str, int]
+
+    @classmethod
+    def from_wrapper(
+        cls, wrapper: "FormioConfigurationWrapper"
+    ) -> "FormioConfigurationIndex | None":
+        """
+        Build the index from the (already computed) wrapper data structures.
+
+        :returns: ``None`` if the configuration can't be described by an index, e.g.
+          because components are reachable that aren't part of the flattened paths.
+        """
+        positions: dict[int, int] = {}
+        components = []
+        for position, (path, component) in enumerate(wrapper.flattened_by_path.items()):
+            positions[id(component)] = position
+            components.append(
+                IndexedComponent(
+                    path=path,
+                    bits=tuple(
+                        int(bit) if bit.isdigit() else bit for bit in path.split(".")
+                    ),
+                    key=component.get("key"),
+                    type=component.get("type"),
+                    shape=_get_shape(component),
+                )
+            )
+
+        component_map = {}
+        for key, component in wrapper.component_map.items():
+            if (position := positions.get(id(component))) is None:
+                return None
+            component_map[key] = position
+
+        return cls(
+            root_shape=_get_shape(wrapper.configuration),
+            components=tuple(components),
+            component_map=component_map,
+        )
+
+    def bind(
+        self, configuration: FormioConfiguration
+    ) -> tuple[dict[str, Component], dict[str, Component]] | None:
+        """
+        Look up the indexed components in the provided configuration.
+
+        :returns: The component map and the components flattened by path, or ``None``
+          if the structure of the configuration doesn't match the index.
+        """
+        if _get_shape(configuration) != self.root_shape:
+            return None
+
+        resolved: list[Component] = []
+        flattened_by_path: dict[str, Component] = {}
+        try:
+            for indexed in self.components:
+                component = _resolve(configuration, indexed.bits)
+                if (
+                    component.get("key") != indexed.key
+                    or component.get("type") != indexed.type
+                    or _get_shape(component) != indexed.shape
+                ):
+                    return None
+                resolved.append(component)
+                flattened_by_path[indexed.path] = component
+        except (KeyError, IndexError, TypeError, AttributeError):
+            return None
+
+        component_map = {
+            key: resolved[position] for key, position in self.component_map.items()
+        }
+        return component_map, flattened_by_path
+
+
+_index_cache: OrderedDict[Hashable, FormioConfigurationIndex] = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def _get_cached_index(cache_key: Hashable) -> FormioConfigurationIndex | None:
+    with _index_cache_lock:
+        index = _index_cache.get(cache_key)
+        if index is not None:
+            _index_cache.move_to_end(cache_key)
+        return index
+
+
+def _set_cached_index(cache_key: Hashable, index: FormioConfigurationIndex) -> None:
+    with _index_cache_lock:
+        _index_cache[cache_key] = index
+        _index_cache.move_to_end(cache_key)
+        while len(_index_cache) > CONFIGURATION_INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+
+
+def clear_configuration_index_cache() -> None:
+    with _index_cache_lock:
+        _index_cache.clear()
+
+
 class FormioConfigurationWrapper:
     """
     Wrap around the Formio configuration dictionary for further processing.
 
     This datastructure caches the internal datastructure to optimize mutations of the
     formio configuration.
+
+    When a ``cache_key`` is provided, the structure of the configuration is looked up
+    in (and stored to) a process-wide cache of :class:`FormioConfigurationIndex`
+    instances. The index is validated against the wrapped configuration, so a
+    configuration with a different structure for the same key is never served stale
+    component maps.
     """
 
     _configuration: FormioConfiguration
@@ -48,12 +209,33 @@ class FormioConfigurationWrapper:
     _cached_component_map: dict[str, Component] | None = None
     _flattened_by_path: None | dict[str, Component] = None
     _reverse_flattened: None | dict[str, str] = None
-
-    def __init__(self, configuration: FormioConfiguration):
+    # node path -> (node, parent node path), parents are ordered before their children
+    _visibility_tree: None | dict[str, tuple[JSONObject, str | None]] = None
+
+    def __init__(
+        self,
+        configuration: FormioConfiguration,
+        cache_key: Hashable | None = None,
+    ):
         self._configuration = configuration
+        self._cache_key = cache_key
+
+    def _load_from_cache(self) -> None:
+        cache_key, self._cache_key = self._cache_key, None
+        index = _get_cached_index(cache_key)
+        if index is not None and (bound := index.bind(self._configuration)):
+            self._cached_component_map, self._flattened_by_path = bound
+            return
+
+        index = FormioConfigurationIndex.from_wrapper(self)
+        if index is not None:
+            _set_cached_index(cache_key, index)
 
     @property
     def component_map(self) -> dict[str, Component]:
+        if self._cache_key is not None:
+            self._load_from_cache()
+
         if self._cached_component_map is None:
             self._cached_component_map = {}
 
@@ -118,6 +300,9 @@ class FormioConfigurationWrapper:
 
     @property
     def flattened_by_path(self) -> dict[str, Component]:
+        if self._cache_key is not None:
+            self._load_from_cache()
+
         if self._flattened_by_path is None:
             self._flattened_by_path = flatten_by_path(self.configuration)
         return self._flattened_by_path
@@ -131,15 +316,57 @@ class FormioConfigurationWrapper:
             }
         return self._reverse_flattened
 
+    @property
+    def visibility_tree(self) -> dict[str, tuple[JSONObject, str | None]]:
+        """
+        Map the path of every node (component or column) to the node and its parent.
+
+        The tree is built once, so that the visibility of a component can be resolved
+        by following the parent pointers rather than resolving every ancestor path.
+        """
+        if self._visibility_tree is None:
+            tree: dict[str, tuple[JSONObject, str | None]] = {}
+            for config_path, component in self.flattened_by_path.items():
+                path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
+                parent_path = None
+                for depth in range(len(path_bits)):
+                    path = ".".join(path_bits[: depth + 1])
+                    if path not in tree:
+                        node = (
+                            component
+                            if path == config_path
+                            else cast(JSONObject, glom(self.configuration, path))
+                        )
+                        tree[path] = (node, parent_path)
+                    parent_path = path
+            self._visibility_tree = tree
+        return self._visibility_tree
+
     def is_visible_in_frontend(self, key: str, values: DataMapping) -> bool:
-        config_path = self.reverse_flattened[key]
-        path_bits = [".".join(bit) for bit in RE_PATH.findall(config_path)]
-        nodes = []  # leftmost is root, rightmost is leaf
-        for depth in range(len(path_bits)):
-            path = ".".join(path_bits[: depth + 1])
-            component = cast(Component, glom(self.configuration, path))
-            nodes.append(component)
-        return all(is_visible_in_frontend(node, values) for node in nodes)
+        path: str | None = self.reverse_flattened[key]
+        tree = self.visibility_tree
+        while path is not None:
+            node, path = tree[path]
+            if not is_visible_in_frontend(cast(Component, node), values):
+                return False
+        return True
+
+    def get_visibility(self, values: DataMapping) -> dict[str, bool]:
+        """
+        Determine the frontend visibility of all components for the given values.
+
+        The (conditional) visibility of every node is evaluated at most once and
+        shared with its descendants - components nested inside a hidden parent are
+        hidden without evaluating their own conditionals.
+
+        :returns: A mapping of component key to whether the component is visible.
+        """
+        visibility: dict[str, bool] = {}
+        for path, (node, parent_path) in self.visibility_tree.items():
+            visibility[path] = (
+                parent_path is None or visibility[parent_path]
+            ) and is_visible_in_frontend(cast(Component, node), values)
+        return {key: visibility[path] for key, path in self.reverse_flattened.items()}
 
 
 class FormioData(UserDict):
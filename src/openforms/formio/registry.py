@@ -109,6 +109,16 @@ class BasePlugin(Generic[ComponentT], AbstractBasePlugin):
         # validation which is common for most components.
         return serializers.JSONField(required=required, allow_null=True)
 
+    def has_static_serializer_field(self, component: ComponentT) -> bool:
+        """
+        Indicate whether the serializer field only depends on the component definition.
+
+        Serializer fields are cached per component definition - plugins building
+        fields that depend on other state (like the global configuration) must return
+        ``False`` to opt out.
+        """
+        return True
+
 
 class ComponentRegistry(BaseRegistry[BasePlugin]):
     module = "formio_components"
@@ -213,6 +223,16 @@ class ComponentRegistry(BaseRegistry[BasePlugin]):
         component_plugin = self[component_type]
         return component_plugin.build_serializer_field(component)
 
+    def has_static_serializer_field(self, component: Component) -> bool:
+        """
+        Check if the serializer field for the component may be cached.
+        """
+        if (component_type := component["type"]) not in self:
+            component_type = "default"
+
+        component_plugin = self[component_type]
+        return component_plugin.has_static_serializer_field(component)
+
 
 # Sentinel to provide the default registry. You can easily instantiate another
 # :class:`Registry` object to use as dependency injection in tests.
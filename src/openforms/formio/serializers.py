@@ -8,13 +8,17 @@ https://github.com/formio/formio.js/blob/4.13.x/src/validator/Validator.js.
 
 from __future__ import annotations
 
+import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import TYPE_CHECKING, TypeAlias
 
 from glom import assign, glom
 from rest_framework import serializers
 
 from openforms.typing import DataMapping, JSONObject
+from openforms.utils.cache import get_digest
 
 from .datastructures import FormioConfigurationWrapper
 from .typing import Component
@@ -51,11 +55,13 @@ class StepDataSerializer(serializers.Serializer):
         # can't use FormioData yet because of is_visible_in_frontend
         values: DataMapping = self.initial_data
 
+        # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
+        # is a broader issue, but also manifests here.
+        visibility = config_wrapper.get_visibility(values)
+
         # loop over all components and delegate application to the registry
         for component in iter_components(configuration, recurse_into_editgrid=False):
-            # XXX: is_visible_in_frontend does not understand editgrid at all yet, which
-            # is a broader issue, but also manifests here.
-            is_visible = config_wrapper.is_visible_in_frontend(component["key"], values)
+            is_visible = visibility[component["key"]]
 
             # we don't have to do anything when the component is visible, regular
             # validation rules apply
@@ -140,24 +146,128 @@ def dict_to_serializer(
     return serializer
 
 
-def build_serializer(
-    components: list[Component], register: ComponentRegistry, **kwargs
-) -> StepDataSerializer:
+SERIALIZER_CACHE_SIZE = 256
+
+# Compiled serializer fields, keyed by the registry and the digest of the component
+# definitions. The cached field instances are never bound to a serializer, they are
+# copied for every serializer that is built.
+_fields_cache: OrderedDict[
+    tuple[ComponentRegistry, str], dict[str, FieldOrNestedFields]
+] = OrderedDict()
+_fields_cache_lock = threading.Lock()
+
+
+def _get_cached_fields(
+    cache_key: tuple[ComponentRegistry, str],
+) -> dict[str, FieldOrNestedFields] | None:
+    with _fields_cache_lock:
+        fields = _fields_cache.get(cache_key)
+        if fields is not None:
+            _fields_cache.move_to_end(cache_key)
+        return fields
+
+
+def _set_cached_fields(
+    cache_key: tuple[ComponentRegistry, str], fields: dict[str, FieldOrNestedFields]
+) -> None:
+    with _fields_cache_lock:
+        _fields_cache[cache_key] = fields
+        _fields_cache.move_to_end(cache_key)
+        while len(_fields_cache) > SERIALIZER_CACHE_SIZE:
+            _fields_cache.popitem(last=False)
+
+
+def clear_serializer_cache() -> None:
+    with _fields_cache_lock:
+        _fields_cache.clear()
+
+
+def _get_fields_cache_key(
+    components: list[Component], register: ComponentRegistry
+) -> tuple[ComponentRegistry, str] | None:
+    try:
+        # plain JSON only - e.g. lazy translations must not be part of the key
+        digest = get_digest(components, encoder=json.JSONEncoder)
+    except (TypeError, ValueError):  # not a plain JSON structure
+        return None
+    # the registry itself is part of the key (rather than its ``id()``), which keeps
+    # it alive while it's cached
+    return (register, digest)
+
+
+def _copy_field(field: serializers.Field) -> serializers.Field:
+    # Re-instantiate the field from its initialization arguments, like DRF does for
+    # the declared fields of serializer classes. The arguments are treated as
+    # immutable, except for nested fields (like the ``child`` of list fields) which
+    # are bound to their parent and thus must be copied too.
+    kwargs = {
+        key: _copy_field(value) if isinstance(value, serializers.Field) else value
+        for key, value in field._kwargs.items()
+    }
+    copy = field.__class__(*field._args, **kwargs)
+    # nested serializers may have fields that were added after initialization
+    if isinstance(field, serializers.Serializer):
+        for name, nested_field in field.fields.items():
+            copy.fields[name] = _copy_field(nested_field)
+    return copy
+
+
+def _copy_fields(
+    fields: dict[str, FieldOrNestedFields],
+) -> dict[str, FieldOrNestedFields]:
+    return {
+        bit: _copy_fields(field) if isinstance(field, dict) else _copy_field(field)
+        for bit, field in fields.items()
+    }
+
+
+def _compile_fields(
+    config: JSONObject, register: ComponentRegistry
+) -> tuple[dict[str, FieldOrNestedFields], bool]:
     """
-    Translate a sequence of Formio.js component definitions into a serializer.
+    Build the (nested) serializer fields for the components.
 
-    This recursively builds up the serializer fields for each (nested) component and
-    puts them into a serializer instance ready for validation.
+    :returns: The fields and whether they can be cached - the latter is not the case
+      when any field depends on state other than the component definition.
     """
     fields: dict[str, FieldOrNestedFields] = {}
+    cacheable = True
 
-    config: JSONObject = {"components": components}
     for component in iter_components(config, recurse_into_editgrid=False):
         if is_layout_component(component):
             continue
 
         field = register.build_serializer_field(component)
         assign(obj=fields, path=component["key"], val=field, missing=dict)
+        cacheable = cacheable and register.has_static_serializer_field(component)
+
+    return fields, cacheable
+
+
+def build_serializer(
+    components: list[Component], register: ComponentRegistry, **kwargs
+) -> StepDataSerializer:
+    """
+    Translate a sequence of Formio.js component definitions into a serializer.
+
+    This recursively builds up the serializer fields for each (nested) component and
+    puts them into a serializer instance ready for validation.
+
+    The serializer fields are compiled once for a given set of component definitions
+    and cached (in-process). Only the hidden state, which depends on the submitted
+    data, is applied to every serializer that is built.
+    """
+    config: JSONObject = {"components": components}
+
+    cache_key = _get_fields_cache_key(components, register)
+    compiled = _get_cached_fields(cache_key) if cache_key is not None else None
+    if compiled is not None:
+        fields = _copy_fields(compiled)
+    else:
+        fields, cacheable = _compile_fields(config, register)
+        if cache_key is not None and cacheable:
+            # keep pristine copies around, the fields in use get bound and mutated
+            _set_cached_fields(cache_key, _copy_fields(fields))
 
     serializer = dict_to_serializer(fields, **kwargs)
     serializer.apply_hidden_state(config, fields)
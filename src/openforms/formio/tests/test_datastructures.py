@@ -1,8 +1,16 @@
+from copy import deepcopy
 from unittest import TestCase
+from unittest.mock import patch
 
 from openforms.formio.typing import Component, EditGridComponent
 
-from ..datastructures import FormioConfiguration, FormioConfigurationWrapper, FormioData
+from ..datastructures import (
+    FormioConfiguration,
+    FormioConfigurationWrapper,
+    FormioData,
+    clear_configuration_index_cache,
+)
+from ..utils import is_visible_in_frontend
 
 
 class FormioDataTests(TestCase):
@@ -147,3 +155,183 @@ class FormioConfigurationWrapperTests(TestCase):
             config_wrapper["outerEditgrid.innerEditgrid.innerTextfield"],
             inner_textfield,
         )
+
+    def test_visibility_of_nested_components(self):
+        config: FormioConfiguration = {
+            "components": [
+                {"type": "textfield", "key": "trigger", "label": "Trigger"},
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "conditional": {"show": False, "when": "trigger", "eq": "hide"},
+                    "components": [
+                        {
+                            "type": "columns",
+                            "key": "columns",
+                            "columns": [
+                                {
+                                    "components": [
+                                        {
+                                            "type": "textfield",
+                                            "key": "nested",
+                                            "label": "Nested",
+                                        }
+                                    ]
+                                }
+                            ],
+                        },
+                        {
+                            "type": "textfield",
+                            "key": "hiddenNested",
+                            "label": "Hidden nested",
+                            "hidden": True,
+                        },
+                    ],
+                },
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(config)
+
+        for trigger, expected in (
+            (
+                "show",
+                {
+                    "trigger": True,
+                    "fieldset": True,
+                    "columns": True,
+                    "nested": True,
+                    "hiddenNested": False,
+                },
+            ),
+            (
+                "hide",
+                {
+                    "trigger": True,
+                    "fieldset": False,
+                    "columns": False,
+                    "nested": False,
+                    "hiddenNested": False,
+                },
+            ),
+        ):
+            values = {"trigger": trigger}
+            with self.subTest(trigger=trigger):
+                self.assertEqual(config_wrapper.get_visibility(values), expected)
+                for key, is_visible in expected.items():
+                    self.assertEqual(
+                        config_wrapper.is_visible_in_frontend(key, values), is_visible
+                    )
+
+    def test_visibility_evaluates_each_node_once(self):
+        config: FormioConfiguration = {
+            "components": [
+                {
+                    "type": "fieldset",
+                    "key": "fieldset",
+                    "label": "Fieldset",
+                    "components": [
+                        {"type": "textfield", "key": f"field{index}", "label": "Field"}
+                        for index in range(5)
+                    ],
+                }
+            ]
+        }
+        config_wrapper = FormioConfigurationWrapper(config)
+
+        with patch(
+            "openforms.formio.datastructures.is_visible_in_frontend",
+            wraps=is_visible_in_frontend,
+        ) as mock_is_visible:
+            visibility = config_wrapper.get_visibility({})
+
+        self.assertEqual(len(visibility), 6)
+        self.assertEqual(mock_is_visible.call_count, 6)
+
+
+class CachedConfigurationIndexTests(TestCase):
+    configuration: FormioConfiguration = {
+        "components": [
+            {
+                "type": "fieldset",
+                "key": "fieldset",
+                "label": "Fieldset",
+                "components": [{"type": "textfield", "key": "text", "label": "Text"}],
+            },
+            {
+                "type": "columns",
+                "key": "columns",
+                "columns": [
+                    {"components": [{"type": "number", "key": "num", "label": "Num"}]},
+                    {"components": []},
+                ],
+            },
+            {
+                "type": "editgrid",
+                "key": "editgrid",
+                "label": "Repeating group",
+                "components": [{"type": "email", "key": "email", "label": "Email"}],
+            },
+        ]
+    }
+
+    def setUp(self):
+        super().setUp()
+
+        clear_configuration_index_cache()
+        self.addCleanup(clear_configuration_index_cache)
+
+    def test_index_is_reused_for_same_structure(self):
+        FormioConfigurationWrapper(
+            deepcopy(self.configuration), cache_key="key"
+        ).component_map
+        config = deepcopy(self.configuration)
+        # changing component properties does not affect the index
+        config["components"][0]["components"][0]["label"] = "Other label"
+        wrapper = FormioConfigurationWrapper(config, cache_key="key")
+
+        with patch("openforms.formio.datastructures.flatten_by_path") as mock_flatten:
+            component_map = wrapper.component_map
+
+        mock_flatten.assert_not_called()
+        uncached_wrapper = FormioConfigurationWrapper(config)
+        self.assertEqual(
+            list(component_map.keys()), list(uncached_wrapper.component_map.keys())
+        )
+        for key, component in component_map.items():
+            with self.subTest(key=key):
+                self.assertIs(component, uncached_wrapper[key])
+        self.assertEqual(wrapper["text"]["label"], "Other label")
+        self.assertEqual(wrapper.flattened_by_path, uncached_wrapper.flattened_by_path)
+        self.assertEqual(wrapper.reverse_flattened, uncached_wrapper.reverse_flattened)
+
+    def test_changed_structure_is_not_served_from_cache(self):
+        FormioConfigurationWrapper(
+            deepcopy(self.configuration), cache_key="key"
+        ).component_map
+        config = deepcopy(self.configuration)
+        config["components"][1]["columns"][1]["components"].append(
+            {"type": "textfield", "key": "added", "label": "Added"}
+        )
+        config["components"][0]["components"][0]["key"] = "renamed"
+
+        wrapper = FormioConfigurationWrapper(config, cache_key="key")
+
+        self.assertIn("added", wrapper)
+        self.assertIn("renamed", wrapper)
+        self.assertNotIn("text", wrapper)
+        self.assertEqual(
+            wrapper.reverse_flattened["added"], "components.1.columns.1.components.0"
+        )
+
+    def test_mutations_are_not_shared(self):
+        wrapper1 = FormioConfigurationWrapper(
+            deepcopy(self.configuration), cache_key="key"
+        )
+        wrapper1["text"]["label"] = "Mutated"
+        wrapper2 = FormioConfigurationWrapper(
+            deepcopy(self.configuration), cache_key="key"
+        )
+
+        self.assertEqual(wrapper2["text"]["label"], "Text")
+        self.assertIsNot(wrapper1["editgrid.email"], wrapper2["editgrid.email"])
@@ -1,10 +1,14 @@
+from unittest.mock import patch
+
 from django.test import SimpleTestCase
 
-from rest_framework.serializers import ValidationError
+from rest_framework.serializers import ListField, ValidationError
 
 from openforms.submissions.tests.factories import SubmissionFactory
 from openforms.typing import JSONObject, JSONValue
 
+from ..registry import register
+from ..serializers import clear_serializer_cache
 from ..service import build_serializer
 from ..typing import Component, RadioComponent, TextFieldComponent
 
@@ -104,3 +108,101 @@ class GenericValidationTests(SimpleTestCase):
         self.assertIn("nested", detail["parent"])
         err_code = detail["parent"]["nested"][0].code
         self.assertEqual(err_code, "max_length")
+
+
+class SerializerCachingTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_serializer_cache()
+        self.addCleanup(clear_serializer_cache)
+
+    def test_fields_are_compiled_once(self):
+        components: list[Component] = [
+            {"type": "textfield", "key": "textfield", "label": "Text"},
+            {"type": "number", "key": "number", "label": "Number"},
+        ]
+
+        with patch.object(
+            register,
+            "build_serializer_field",
+            wraps=register.build_serializer_field,
+        ) as mock_build_field:
+            serializer1 = build_serializer(components, data={})
+            serializer2 = build_serializer(components, data={})
+
+        self.assertEqual(mock_build_field.call_count, 2)
+        # every serializer gets its own field instances
+        self.assertIsNot(serializer1.fields["number"], serializer2.fields["number"])
+        self.assertIs(serializer2.fields["number"].parent, serializer2)
+
+    def test_hidden_state_applied_per_serializer(self):
+        components: list[Component] = [
+            {"type": "checkbox", "key": "toggle", "label": "Toggle"},
+            {
+                "type": "textfield",
+                "key": "textfield",
+                "label": "Text",
+                "validate": {"required": True},
+                "conditional": {"show": True, "when": "toggle", "eq": True},
+            },
+        ]
+
+        hidden_serializer = build_serializer(components, data={"toggle": False})
+        visible_serializer = build_serializer(components, data={"toggle": True})
+
+        self.assertTrue(hidden_serializer.is_valid())
+        self.assertFalse(visible_serializer.is_valid())
+        self.assertIn("textfield", visible_serializer.errors)
+
+    def test_nested_fields_are_bound_to_their_copy(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "textfield",
+            "label": "Text",
+            "multiple": True,
+        }
+
+        build_serializer([component], data={})
+        serializer = build_serializer([component], data={})
+
+        field = serializer.fields["textfield"]
+        assert isinstance(field, ListField)
+        self.assertIs(field.child.parent, field)
+
+    def test_changed_configuration_is_compiled_again(self):
+        component: TextFieldComponent = {
+            "type": "textfield",
+            "key": "textfield",
+            "label": "Text",
+            "validate": {"maxLength": 5},
+        }
+        build_serializer([component], data={})
+        component["validate"]["maxLength"] = 2
+
+        serializer = build_serializer([component], data={"textfield": "foo"})
+
+        self.assertFalse(serializer.is_valid())
+
+    def test_fields_depending_on_global_configuration_are_not_cached(self):
+        component: Component = {
+            "type": "file",
+            "key": "file",
+            "label": "File",
+            "useConfigFiletypes": True,
+        }
+        with (
+            patch(
+                "openforms.formio.components.vanilla.GlobalConfiguration.get_solo"
+            ) as mock_get_solo,
+            patch.object(
+                register,
+                "build_serializer_field",
+                wraps=register.build_serializer_field,
+            ) as mock_build_field,
+        ):
+            mock_get_solo.return_value.form_upload_default_file_types = []
+            build_serializer([component], data={})
+            build_serializer([component], data={})
+
+        self.assertEqual(mock_build_field.call_count, 2)
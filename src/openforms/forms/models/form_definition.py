@@ -159,7 +159,11 @@ class FormDefinition(models.Model):
     def configuration_wrapper(self) -> "FormioConfigurationWrapper":
         from openforms.formio.service import FormioConfigurationWrapper
 
-        return FormioConfigurationWrapper(self.configuration)
+        # the structure of the configuration is cached process-wide, the wrapper
+        # itself (and the configuration) remain specific to this instance so that it
+        # can be safely mutated.
+        cache_key = (self._meta.label, self.pk) if self.pk else None
+        return FormioConfigurationWrapper(self.configuration, cache_key=cache_key)
 
     def iter_components(self, configuration=None, recursive=True, **kwargs):
         if configuration is None:
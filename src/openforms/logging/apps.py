@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class LoggingAppConfig(AppConfig):
     name = "openforms.logging"
     verbose_name = _("Logging")
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
@@ -0,0 +1,123 @@
+"""
+Buffered writing of the audit log entries.
+
+By default, every :mod:`openforms.logging.logevent` call inserts its log entry
+immediately. With ``settings.AUDITLOG_BUFFERED`` enabled, the log entries created
+during a request or Celery task are collected and inserted with a single (batched)
+query at the end of the request/task instead.
+
+The buffered entries respect the database transactions - entries created inside a
+transaction are only added to the buffer when the transaction commits and are
+discarded when it's rolled back, just like the immediate inserts would be. The entries
+are written in the order they were created, with the time they were created.
+"""
+
+from __future__ import annotations
+
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Iterator
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from .models import TimelineLogProxy
+
+BATCH_SIZE = 500
+
+_buffer: ContextVar[LogBuffer | None] = ContextVar("audit_log_buffer", default=None)
+
+
+@dataclass
+class LogBuffer:
+    entries: list[tuple[int, TimelineLogProxy]] = field(default_factory=list)
+    _counter: Iterator[int] = field(default_factory=itertools.count)
+    _token: Token | None = None
+
+    def add(self, log_entry: TimelineLogProxy) -> None:
+        # the timestamp is normally set when the record is inserted
+        log_entry.timestamp = timezone.now()
+        position = next(self._counter)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(partial(self._append, position, log_entry))
+        else:
+            self._append(position, log_entry)
+
+    def _append(self, position: int, log_entry: TimelineLogProxy) -> None:
+        self.entries.append((position, log_entry))
+
+    def flush(self) -> None:
+        from .models import TimelineLogProxy
+
+        entries, self.entries = self.entries, []
+        # entries created inside a transaction are only added on commit
+        log_entries = [log_entry for _, log_entry in sorted(entries)]
+        timestamps = [log_entry.timestamp for log_entry in log_entries]
+        TimelineLogProxy.objects.bulk_create(log_entries, batch_size=BATCH_SIZE)
+        # ``auto_now_add`` replaces the timestamps with the time of the insert, restore
+        # the time the entries were created
+        for log_entry, timestamp in zip(log_entries, timestamps):
+            log_entry.timestamp = timestamp
+        TimelineLogProxy.objects.bulk_update(
+            log_entries, ["timestamp"], batch_size=BATCH_SIZE
+        )
+
+
+def add_to_buffer(log_entry: TimelineLogProxy) -> bool:
+    """
+    Add the (unsaved) log entry to the active buffer.
+
+    :returns: ``False`` if no log entries are buffered, and the caller must save the
+      log entry.
+    """
+    buffer = _buffer.get()
+    if buffer is None:
+        return False
+    buffer.add(log_entry)
+    return True
+
+
+def start_buffer() -> LogBuffer | None:
+    """
+    Start buffering the log entries, if enabled.
+
+    :returns: The started buffer, to be passed to :func:`flush_buffer`. ``None`` if
+      buffering is disabled or a buffer is already active - the log entries are then
+      added to the active buffer.
+    """
+    if not settings.AUDITLOG_BUFFERED or _buffer.get() is not None:
+        return None
+    buffer = LogBuffer()
+    buffer._token = _buffer.set(buffer)
+    return buffer
+
+
+def flush_buffer(buffer: LogBuffer) -> None:
+    """
+    Stop buffering and write the log entries of the buffer.
+    """
+    assert buffer._token is not None, "The buffer was not started"
+    _buffer.reset(buffer._token)
+    buffer._token = None
+    # the entries of the transaction are added to the buffer when it commits
+    transaction.on_commit(buffer.flush)
+
+
+@contextmanager
+def buffered_audit_log() -> Iterator[None]:
+    """
+    Buffer the log entries created inside the block, if enabled.
+
+    Nested blocks share the buffer of the outermost block.
+    """
+    buffer = start_buffer()
+    try:
+        yield
+    finally:
+        if buffer is not None:
+            flush_buffer(buffer)
@@ -41,6 +41,7 @@ def _create_log(
         return
 
     # import locally or we'll get "AppRegistryNotReady: Apps aren't loaded yet."
+    from openforms.logging.buffer import add_to_buffer
     from openforms.logging.models import TimelineLogProxy
 
     if extra_data is None:
@@ -63,12 +64,14 @@ def _create_log(
         #   save it on the TimelineLogProxy model
         user = None
 
-    log_entry = TimelineLogProxy.objects.create(
+    log_entry = TimelineLogProxy(
         content_object=object,
         template=f"logging/events/{event}.txt",
         extra_data=extra_data,
         user=user,
     )
+    if not add_to_buffer(log_entry):
+        log_entry.save()
     # logger.debug('Logged event in %s %s %s', event, object._meta.object_name, object.pk)
     return log_entry
 
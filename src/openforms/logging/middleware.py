@@ -0,0 +1,20 @@
+from django.http import HttpRequest
+
+from openforms.typing import RequestHandler
+
+from .buffer import buffered_audit_log
+
+
+class BufferedAuditLogMiddleware:
+    """
+    Write the audit log entries created during the request in a single query.
+
+    Only has an effect with ``settings.AUDITLOG_BUFFERED`` enabled.
+    """
+
+    def __init__(self, get_response: RequestHandler):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest):
+        with buffered_audit_log():
+            return self.get_response(request)
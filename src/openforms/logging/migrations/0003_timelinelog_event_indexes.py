@@ -0,0 +1,36 @@
+from django.db import migrations
+
+# The timeline log model is provided by django-timeline-logger, so the indexes for the
+# log event (used by the daily digest and admin filters) and the AVG tag (used by the
+# AVG log admin) are managed here as expression/partial indexes on its table.
+# They are created concurrently to not lock the (large) log table during the upgrade.
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("logging", "0002_avgtimelinelogproxy"),
+        ("timeline_logger", "0006_auto_20220413_0749"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS logging_timelinelog_event_idx "
+                "ON timeline_logger_timelinelog "
+                "((extra_data -> 'log_event'), timestamp);"
+            ),
+            reverse_sql=(
+                "DROP INDEX CONCURRENTLY IF EXISTS logging_timelinelog_event_idx;"
+            ),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS logging_timelinelog_avg_idx "
+                "ON timeline_logger_timelinelog (timestamp) "
+                """WHERE extra_data @> '{"avg": true}'::jsonb;"""
+            ),
+            reverse_sql="DROP INDEX CONCURRENTLY IF EXISTS logging_timelinelog_avg_idx;",
+        ),
+    ]
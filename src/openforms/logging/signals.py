@@ -0,0 +1,20 @@
+from celery import Task
+from celery.signals import task_postrun, task_prerun
+
+from .buffer import flush_buffer, start_buffer
+
+
+@task_prerun.connect(dispatch_uid="logging.start_task_audit_log_buffer")
+def start_task_audit_log_buffer(task: Task, **kwargs) -> None:
+    """
+    Buffer the audit log entries created by the task, if enabled.
+    """
+    # the request context is specific to this execution of the task
+    task.request.audit_log_buffer = start_buffer()
+
+
+@task_postrun.connect(dispatch_uid="logging.flush_task_audit_log_buffer")
+def flush_task_audit_log_buffer(task: Task, **kwargs) -> None:
+    buffer = getattr(task.request, "audit_log_buffer", None)
+    if buffer is not None:
+        flush_buffer(buffer)
@@ -0,0 +1,156 @@
+from unittest.mock import Mock
+
+from django.db import transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from celery.app.task import Context
+from freezegun import freeze_time
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from .. import logevent
+from ..buffer import buffered_audit_log
+from ..middleware import BufferedAuditLogMiddleware
+from ..models import TimelineLogProxy
+from ..signals import flush_task_audit_log_buffer, start_task_audit_log_buffer
+
+
+@override_settings(AUDITLOG_BUFFERED=True)
+class BufferedAuditLogTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.submission = SubmissionFactory.create()
+
+    def test_log_entries_written_in_single_query(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with buffered_audit_log(), self.assertNumQueries(0):
+                with freeze_time("2024-01-01T12:00:00Z"):
+                    logevent.submission_start(self.submission)
+                with freeze_time("2024-01-01T12:00:01Z"):
+                    logevent.form_submit_success(self.submission)
+                with freeze_time("2024-01-01T12:00:02Z"):
+                    logevent.pdf_generation_start(self.submission)
+
+        self.assertFalse(TimelineLogProxy.objects.exists())
+        with freeze_time("2024-01-01T13:00:00Z"):
+            for callback in callbacks:
+                callback()
+
+        logs = TimelineLogProxy.objects.order_by("pk")
+        self.assertEqual(
+            [log.extra_data["log_event"] for log in logs],
+            ["submission_start", "form_submit_success", "pdf_generation_start"],
+        )
+        # the time of creation is kept, rather than the time of the flush
+        self.assertEqual(
+            [log.timestamp.isoformat() for log in logs],
+            [
+                "2024-01-01T12:00:00+00:00",
+                "2024-01-01T12:00:01+00:00",
+                "2024-01-01T12:00:02+00:00",
+            ],
+        )
+        self.assertEqual(logs[0].content_object, self.submission)
+
+    def test_flush_query_count(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with buffered_audit_log():
+                for _ in range(5):
+                    logevent.submission_start(self.submission)
+
+        # insert + restoring the creation timestamps
+        with self.assertNumQueries(2):
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 5)
+
+    def test_log_entries_of_rolled_back_transaction_are_discarded(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_log():
+                logevent.submission_start(self.submission)
+                try:
+                    with transaction.atomic():
+                        logevent.registration_start(self.submission)
+                        raise ValueError("Boom")
+                except ValueError:
+                    pass
+                logevent.form_submit_success(self.submission)
+
+        self.assertEqual(
+            [
+                log.extra_data["log_event"]
+                for log in TimelineLogProxy.objects.order_by("pk")
+            ],
+            ["submission_start", "form_submit_success"],
+        )
+
+    def test_nested_blocks_share_buffer(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            with buffered_audit_log():
+                with buffered_audit_log():
+                    logevent.submission_start(self.submission)
+
+                self.assertFalse(TimelineLogProxy.objects.exists())
+
+                logevent.form_submit_success(self.submission)
+
+        # a single flush
+        with self.assertNumQueries(2):
+            for callback in callbacks:
+                callback()
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
+
+    def test_middleware(self):
+        def get_response(request):
+            logevent.submission_start(self.submission)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+            return HttpResponse()
+
+        middleware = BufferedAuditLogMiddleware(get_response)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            middleware(RequestFactory().get("/"))
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    @override_settings(AUDITLOG_BUFFERED=False)
+    def test_buffering_disabled(self):
+        with buffered_audit_log():
+            with self.assertNumQueries(1):
+                logevent.submission_start(self.submission)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_celery_task(self):
+        task = Mock(request=Context())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            start_task_audit_log_buffer(task=task)
+            logevent.registration_start(self.submission)
+            self.assertFalse(TimelineLogProxy.objects.exists())
+            flush_task_audit_log_buffer(task=task)
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 1)
+
+    def test_nested_celery_task(self):
+        # e.g. an eagerly executed task during a request
+        task = Mock(request=Context())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with buffered_audit_log():
+                start_task_audit_log_buffer(task=task)
+                logevent.registration_start(self.submission)
+                flush_task_audit_log_buffer(task=task)
+
+                # the entries are flushed with the outer buffer
+                self.assertIsNone(task.request.audit_log_buffer)
+                logevent.form_submit_success(self.submission)
+
+            self.assertFalse(TimelineLogProxy.objects.exists())
+
+        self.assertEqual(TimelineLogProxy.objects.count(), 2)
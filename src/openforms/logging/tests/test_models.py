@@ -1,6 +1,8 @@
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.template.defaultfilters import capfirst
 from django.test import TestCase
+from django.utils import timezone
 from django.utils.translation import gettext as _
 
 from freezegun import freeze_time
@@ -9,7 +11,8 @@ from openforms.accounts.tests.factories import StaffUserFactory, UserFactory
 from openforms.forms.models import Form
 from openforms.forms.tests.factories import FormFactory
 from openforms.logging import logevent
-from openforms.logging.models import AVGTimelineLogProxy
+from openforms.logging.constants import TimelineLogTags
+from openforms.logging.models import AVGTimelineLogProxy, TimelineLogProxy
 from openforms.logging.tests.base import LoggingTestMixin
 from openforms.logging.tests.factories import TimelineLogProxyFactory
 from openforms.submissions.models import Submission
@@ -265,3 +268,26 @@ class LoggingTestMixinTest(LoggingTestMixin, TestCase):
             self.assertLogEventLast("bar_event")
         with self.assertRaises(AssertionError):
             self.assertLogEventLast("foo_event", foo="bad")
+
+
+class TimelineLogIndexesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        # the tables are too small for the planner to consider the indexes otherwise
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def test_filter_event_uses_index(self):
+        queryset = TimelineLogProxy.objects.filter_event("registration_failure").filter(
+            timestamp__gt=timezone.now()
+        )
+
+        self.assertIn("logging_timelinelog_event_idx", queryset.explain())
+
+    def test_has_avg_tag_uses_index(self):
+        queryset = TimelineLogProxy.objects.has_tag(TimelineLogTags.AVG).order_by(
+            "-timestamp"
+        )
+
+        self.assertIn("logging_timelinelog_avg_idx", queryset.explain())
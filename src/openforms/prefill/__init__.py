@@ -44,6 +44,8 @@ from openforms.plugins.exceptions import PluginNotEnabled
 from openforms.variables.constants import FormVariableSources
 
 if TYPE_CHECKING:
+    from django.contrib.sessions.backends.base import SessionBase
+
     from openforms.formio.service import FormioConfigurationWrapper
     from openforms.submissions.models import Submission
 
@@ -57,10 +59,16 @@ def _fetch_prefill_values(
     grouped_fields: dict[str, dict[str, list[str]]],
     submission: Submission,
     register: Registry,
+    session: SessionBase | None = None,
 ) -> dict[str, dict[str, Any]]:
     # local import to prevent AppRegistryNotReady:
     from openforms.logging import logevent
 
+    from . import caching
+
+    # resolve the secret before the plugins are invoked concurrently
+    cache_secret = caching.get_cache_secret(session)
+
     @elasticapm.capture_span(span_type="app.prefill")
     def invoke_plugin(
         item: tuple[str, str, list[str]]
@@ -72,7 +80,9 @@ def _fetch_prefill_values(
             raise PluginNotEnabled()
 
         try:
-            values = plugin.get_prefill_values(submission, fields, identifier_role)
+            values = caching.get_prefill_values(
+                cache_secret, plugin, submission, fields, identifier_role
+            )
         except Exception as e:
             logger.exception(f"exception in prefill plugin '{plugin_id}'")
             logevent.prefill_retrieve_failure(submission, plugin, e)
@@ -152,12 +162,17 @@ def inject_prefill(
 
 
 @elasticapm.capture_span(span_type="app.prefill")
-def prefill_variables(submission: Submission, register: Registry | None = None) -> None:
+def prefill_variables(
+    submission: Submission,
+    register: Registry | None = None,
+    session: SessionBase | None = None,
+) -> None:
     """Update the submission variables state with the fetched attribute values.
 
     For each submission value variable that need to be prefilled, the according plugin will
     be used to fetch the value. If ``register`` is not specified, the default registry instance
-    will be used.
+    will be used. If the ``session`` of the user is specified, the fetched values may be
+    cached for the other submissions of the session (see :mod:`openforms.prefill.caching`).
     """
     from openforms.formio.service import normalize_value_for_component
 
@@ -181,7 +196,7 @@ def prefill_variables(submission: Submission, register: Registry | None = None)
 
         grouped_fields[plugin_id][identifier_role].append(attribute_name)
 
-    results = _fetch_prefill_values(grouped_fields, submission, register)
+    results = _fetch_prefill_values(grouped_fields, submission, register, session)
 
     total_config_wrapper = submission.total_configuration_wrapper
     prefill_data = {}
@@ -0,0 +1,130 @@
+"""
+Opt-in, short-lived cache of the prefill values, shared by the submissions of a session.
+
+A citizen starting multiple forms (or restarting a form) would otherwise trigger the
+same lookups in the (rate-limited) registries for every submission. With
+``PREFILL_CACHE_TIMEOUT`` enabled, the values retrieved by a plugin are cached per
+plugin, identifier role, identifier and set of requested attributes.
+
+The values are personal data, so they are protected with a secret that only lives in
+the session of the user:
+
+* the cache keys are derived from the identifier with an HMAC, so they don't reveal
+  the BSN/KvK number
+* the values are encrypted, so they are useless without the session
+
+Removing the secret from the session (on logout, see :func:`clear`) makes the cached
+values of the session inaccessible - they expire from the cache on their own.
+"""
+
+import json
+import logging
+
+from django.conf import settings
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from openforms.submissions.models import Submission
+from openforms.typing import JSONEncodable
+from openforms.utils.cache import (
+    CacheStatistics,
+    HitCounter,
+    get_digest,
+    get_session_secret,
+)
+
+from .base import BasePlugin
+from .constants import IdentifierRoles
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "prefill"
+CACHE_KEY_VERSION = 1
+
+SESSION_KEY = "prefill_cache_secret"
+
+_hit_counter = HitCounter(f"{CACHE_KEY_PREFIX}|v{CACHE_KEY_VERSION}")
+
+
+def get_cache_secret(session: SessionBase | None) -> str | None:
+    """
+    Return the secret protecting the cached values of the session.
+
+    :returns: ``None`` if caching is disabled, or the secret - which is added to the
+      session if it doesn't have one yet.
+    """
+    if session is None or not settings.PREFILL_CACHE_TIMEOUT:
+        return None
+    return get_session_secret(session, SESSION_KEY)
+
+
+def clear(session: SessionBase) -> None:
+    """
+    Discard the cached values of the session.
+    """
+    session.pop(SESSION_KEY, None)
+
+
+def get_cache_key(
+    secret: str,
+    plugin_id: str,
+    identifier_role: str,
+    identifier: str,
+    attributes: list[str],
+) -> str:
+    digest = get_digest(
+        [plugin_id, identifier_role, identifier, sorted(attributes)], secret=secret
+    )
+    return f"{CACHE_KEY_PREFIX}|{plugin_id}|v{CACHE_KEY_VERSION}|{digest}"
+
+
+def get_cache_statistics() -> CacheStatistics:
+    """
+    Return the number of cache hits and misses of the prefill values.
+    """
+    return _hit_counter.get_statistics()
+
+
+def get_prefill_values(
+    secret: str | None,
+    plugin: BasePlugin,
+    submission: Submission,
+    attributes: list[str],
+    identifier_role: IdentifierRoles,
+) -> dict[str, JSONEncodable]:
+    """
+    Look up the cached prefill values, or retrieve them with the plugin.
+
+    Nothing is cached without a secret (see :func:`get_cache_secret`) or an identifier
+    on the submission. Empty results are not cached, so that a lookup that failed is
+    retried for the next submission.
+    """
+    if secret is None or not (
+        identifier := plugin.get_identifier_value(submission, identifier_role)
+    ):
+        return plugin.get_prefill_values(submission, attributes, identifier_role)
+
+    timeout = settings.PREFILL_CACHE_TIMEOUT
+    fernet = Fernet(secret)
+    cache_key = get_cache_key(
+        secret, plugin.identifier, identifier_role, identifier, attributes
+    )
+
+    if (token := cache.get(cache_key)) is not None:
+        try:
+            values = json.loads(fernet.decrypt(token, ttl=timeout))
+        except InvalidToken:
+            logger.warning("Discarding invalid cached prefill values %s", cache_key)
+        else:
+            _hit_counter.hit()
+            return values
+
+    _hit_counter.miss()
+    values = plugin.get_prefill_values(submission, attributes, identifier_role)
+    if values:
+        token = fernet.encrypt(json.dumps(values, cls=DjangoJSONEncoder).encode())
+        cache.set(cache_key, token, timeout=timeout)
+    return values
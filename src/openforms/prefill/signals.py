@@ -4,9 +4,13 @@ from django.dispatch import receiver
 from django.http import HttpRequest
 
 from openforms.authentication.base import BasePlugin
-from openforms.authentication.signals import co_sign_authentication_success
+from openforms.authentication.signals import (
+    authentication_logout,
+    co_sign_authentication_success,
+)
 from openforms.submissions.models import Submission
 
+from . import caching
 from .co_sign import add_co_sign_representation as _add_co_sign_representation
 
 logger = logging.getLogger(__name__)
@@ -33,3 +37,8 @@ def add_co_sign_representation(
         return
 
     _add_co_sign_representation(submission, plugin.provides_auth)
+
+
+@receiver(authentication_logout, dispatch_uid="openforms.prefill.clear_cache")
+def clear_prefill_cache(sender, request: HttpRequest, **kwargs) -> None:
+    caching.clear(request.session)
@@ -0,0 +1,138 @@
+from unittest.mock import Mock
+
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+
+from openforms.authentication.service import AuthAttribute
+from openforms.authentication.signals import authentication_logout
+from openforms.submissions.tests.factories import SubmissionFactory
+from openforms.utils.tests.cache import clear_caches
+
+from .. import caching
+from ..base import BasePlugin
+from ..constants import IdentifierRoles
+from ..registry import Registry
+
+register = Registry()
+
+
+@register("test-prefill")
+class TestPrefill(BasePlugin):
+    requires_auth = AuthAttribute.bsn
+    fetch = Mock()
+
+    @classmethod
+    def get_prefill_values(cls, submission, attributes, identifier_role):
+        return cls.fetch(attributes)
+
+
+plugin = register["test-prefill"]
+
+
+@override_settings(PREFILL_CACHE_TIMEOUT=60)
+class PrefillCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_caches)
+        TestPrefill.fetch.reset_mock(return_value=True, side_effect=True)
+        TestPrefill.fetch.return_value = {"voornamen": "Jan"}
+
+    def _get_values(self, session, attributes=None, bsn="111222333"):
+        submission = SubmissionFactory.create(
+            auth_info__value=bsn, auth_info__attribute=AuthAttribute.bsn
+        )
+        return caching.get_prefill_values(
+            caching.get_cache_secret(session),
+            plugin,
+            submission,
+            attributes or ["voornamen"],
+            IdentifierRoles.main,
+        )
+
+    def test_values_are_shared_by_the_submissions_of_a_session(self):
+        session = SessionStore()
+
+        first = self._get_values(session, ["voornamen", "geslachtsnaam"])
+        second = self._get_values(session, ["geslachtsnaam", "voornamen"])
+
+        self.assertEqual(first, {"voornamen": "Jan"})
+        self.assertEqual(second, first)
+        TestPrefill.fetch.assert_called_once()
+        stats = caching.get_cache_statistics()
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.hit_rate, 0.5)
+
+    def test_cache_key_depends_on_session_identifier_and_attributes(self):
+        session = SessionStore()
+
+        self._get_values(session)
+        self._get_values(SessionStore())
+        self._get_values(session, bsn="999990676")
+        self._get_values(session, ["voornamen", "geslachtsnaam"])
+
+        self.assertEqual(TestPrefill.fetch.call_count, 4)
+
+    def test_values_are_encrypted(self):
+        session = SessionStore()
+
+        self._get_values(session)
+
+        cache_key = caching.get_cache_key(
+            session[caching.SESSION_KEY],
+            "test-prefill",
+            IdentifierRoles.main,
+            "111222333",
+            ["voornamen"],
+        )
+        self.assertNotIn("111222333", cache_key)
+        token = cache.get(cache_key)
+        self.assertIsNotNone(token)
+        self.assertNotIn(b"Jan", token)
+
+    def test_empty_values_are_not_cached(self):
+        session = SessionStore()
+        TestPrefill.fetch.return_value = {}
+
+        self._get_values(session)
+        self._get_values(session)
+
+        self.assertEqual(TestPrefill.fetch.call_count, 2)
+
+    def test_logout_clears_the_cache(self):
+        session = SessionStore()
+        self._get_values(session)
+        request = RequestFactory().post("/")
+        request.session = session
+
+        authentication_logout.send(sender=None, request=request)
+
+        self.assertNotIn(caching.SESSION_KEY, session)
+        self._get_values(session)
+        self.assertEqual(TestPrefill.fetch.call_count, 2)
+
+    @override_settings(PREFILL_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        session = SessionStore()
+
+        self._get_values(session)
+        self._get_values(session)
+
+        self.assertNotIn(caching.SESSION_KEY, session)
+        self.assertEqual(TestPrefill.fetch.call_count, 2)
+
+    def test_anonymous_submissions_are_not_cached(self):
+        session = SessionStore()
+        submission = SubmissionFactory.create()
+
+        for _ in range(2):
+            caching.get_prefill_values(
+                caching.get_cache_secret(session),
+                plugin,
+                submission,
+                ["voornamen"],
+                IdentifierRoles.main,
+            )
+
+        self.assertEqual(TestPrefill.fetch.call_count, 2)
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.15 on 2026-10-18 08:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zgw_apis", "0013_set_zgw_api_group"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zgwapigroupconfig",
+            name="max_concurrent_uploads",
+            field=models.PositiveSmallIntegerField(
+                default=4,
+                help_text="The maximum number of attachments that are uploaded to the Documenten API and related to the ZAAK at the same time. Set to 1 to upload them one after the other.",
+                validators=[django.core.validators.MinValueValidator(1)],
+                verbose_name="maximum concurrent uploads",
+            ),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.core.validators import MinValueValidator
 from django.db import models
 from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
@@ -106,6 +107,16 @@ class ZGWApiGroupConfig(models.Model):
         max_length=200,
         default="Aanvrager",
     )
+    max_concurrent_uploads = models.PositiveSmallIntegerField(
+        _("maximum concurrent uploads"),
+        default=4,
+        validators=[MinValueValidator(1)],
+        help_text=_(
+            "The maximum number of attachments that are uploaded to the Documenten "
+            "API and related to the ZAAK at the same time. Set to 1 to upload them "
+            "one after the other."
+        ),
+    )
 
     # Objects API
     content_json = models.TextField(
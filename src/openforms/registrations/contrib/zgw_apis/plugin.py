@@ -1,6 +1,7 @@
 import logging
+from concurrent import futures
 from functools import partial, wraps
-from typing import Any, TypedDict
+from typing import Any, Callable, TypedDict
 
 from django.urls import reverse
 from django.utils.text import Truncator
@@ -8,7 +9,8 @@ from django.utils.translation import gettext, gettext_lazy as _
 
 import requests
 from furl import furl
-from glom import assign
+from glom import assign, glom
+from zgw_consumers.concurrent import parallel
 
 from openforms.config.data import Action
 from openforms.contrib.objects_api.helpers import prepare_data_for_registration
@@ -95,6 +97,77 @@ def wrap_api_errors(func):
     return decorator
 
 
+def upload_attachments(
+    submission: Submission,
+    uploads: list[tuple[int, Callable[[], dict]]],
+    relate: Callable[..., dict],
+    max_workers: int,
+) -> None:
+    """
+    Upload the attachment documents and relate them to the zaak.
+
+    Up to ``max_workers`` attachments are uploaded/related at the same time. Every
+    document is related as soon as it is uploaded. The results are stored on the
+    submission (in the calling thread) as soon as a call completes, so a retry after
+    a (partial) failure skips the uploads and relations that were already done.
+
+    :arg uploads: The attachment IDs and the callbacks creating their document.
+    :arg relate: Callback relating a ``document`` to the zaak.
+    """
+
+    def _spec(attachment_id: int, result: str) -> str:
+        return f"intermediate.documents.{attachment_id}.{result}"
+
+    if max_workers <= 1 or len(uploads) <= 1:
+        for attachment_id, upload in uploads:
+            document = execute_unless_result_exists(
+                upload, submission, _spec(attachment_id, "document")
+            )
+            execute_unless_result_exists(
+                partial(relate, document=document),
+                submission,
+                _spec(attachment_id, "relation"),
+            )
+        return
+
+    errors: list[Exception] = []
+    pending: dict[futures.Future, tuple[int, str]] = {}
+    with parallel(max_workers=max_workers) as executor:
+        for attachment_id, upload in uploads:
+            registration_result = submission.registration_result
+            if not (
+                document := glom(
+                    registration_result, _spec(attachment_id, "document"), default=None
+                )
+            ):
+                pending[executor.submit(upload)] = (attachment_id, "document")
+            elif not glom(
+                registration_result, _spec(attachment_id, "relation"), default=None
+            ):
+                future = executor.submit(relate, document=document)
+                pending[future] = (attachment_id, "relation")
+
+        while pending:
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                attachment_id, result = pending.pop(future)
+                try:
+                    # stores the result of the call on the submission
+                    outcome = execute_unless_result_exists(
+                        future.result, submission, _spec(attachment_id, result)
+                    )
+                except Exception as exc:
+                    errors.append(exc)
+                    continue
+
+                if result == "document":
+                    future = executor.submit(relate, document=outcome)
+                    pending[future] = (attachment_id, "relation")
+
+    if errors:
+        raise errors[0]
+
+
 @register("zgw-create-zaak")
 class ZGWRegistration(BasePlugin):
     verbose_name = _("ZGW API's")
@@ -307,7 +380,7 @@ class ZGWRegistration(BasePlugin):
                 "intermediate.status",
             )
 
-            # TODO: threading? asyncio?
+            attachment_uploads = []
             for attachment in submission.attachments:
                 # collect attributes of the attachment and add them to the configuration
                 # attribute names conform to the Documenten API specification
@@ -343,27 +416,22 @@ class ZGWRegistration(BasePlugin):
                         vertrouwelijkheidaanduiding
                     )
 
-                attachment_document = execute_unless_result_exists(
-                    partial(
-                        create_attachment_document,
-                        client=documents_client,
-                        name=submission.form.admin_name,
-                        submission_attachment=attachment,
-                        options=doc_options,
-                        language=attachment.submission_step.submission.language_code,  # assume same as submission
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.document",
-                )
-                execute_unless_result_exists(
-                    partial(
-                        zaken_client.relate_document,
-                        zaak=zaak,
-                        document=attachment_document,
-                    ),
-                    submission,
-                    f"intermediate.documents.{attachment.id}.relation",
+                upload = partial(
+                    create_attachment_document,
+                    client=documents_client,
+                    name=submission.form.admin_name,
+                    submission_attachment=attachment,
+                    options=doc_options,
+                    language=attachment.submission_step.submission.language_code,  # assume same as submission
                 )
+                attachment_uploads.append((attachment.id, upload))
+
+            upload_attachments(
+                submission,
+                attachment_uploads,
+                relate=partial(zaken_client.relate_document, zaak=zaak),
+                max_workers=zgw.max_concurrent_uploads,
+            )
 
             result.update(
                 {
@@ -1198,18 +1198,16 @@ class ZGWBackendTests(TestCase):
         plugin.register_submission(submission, zgw_form_options)
 
         self.assertEqual(len(m.request_history), 10)
-        (
-            create_pdf_document,
-            relate_pdf_document,
-            get_roltypen,
-            create_rol,
-            get_statustypen,
-            create_status,
-            create_attachment1_document,
-            relate_attachment1_document,
-            create_attachment2_document,
-            relate_attachment2_document,
-        ) = m.request_history
+        # the attachments are uploaded concurrently, in no particular order
+        create_attachment1_document, create_attachment2_document = sorted(
+            (
+                request
+                for request in m.request_history[6:]
+                if request.url
+                == "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten"
+            ),
+            key=lambda request: request.json()["bestandsnaam"],
+        )
 
         with self.subTest("Attachment 1: override fields"):
             # Verify attachments
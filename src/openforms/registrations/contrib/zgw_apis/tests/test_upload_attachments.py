@@ -0,0 +1,124 @@
+import threading
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from openforms.submissions.tests.factories import SubmissionFactory
+
+from ..plugin import upload_attachments
+
+
+def _upload(attachment_id: int):
+    return Mock(return_value=f"https://documenten.nl/api/v1/documenten/{attachment_id}")
+
+
+def _relate(*, document: str) -> dict:
+    return {"informatieobject": document}
+
+
+class UploadAttachmentsTests(TestCase):
+    def test_uploads_in_parallel(self):
+        submission = SubmissionFactory.create()
+        # both uploads must be busy at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(attachment_id: int):
+            barrier.wait()
+            return f"https://documenten.nl/api/v1/documenten/{attachment_id}"
+
+        upload_attachments(
+            submission,
+            [(1, lambda: upload(1)), (2, lambda: upload(2))],
+            relate=_relate,
+            max_workers=2,
+        )
+
+        submission.refresh_from_db()
+        self.assertEqual(
+            submission.registration_result["intermediate"]["documents"],
+            {
+                "1": {
+                    "document": "https://documenten.nl/api/v1/documenten/1",
+                    "relation": {
+                        "informatieobject": "https://documenten.nl/api/v1/documenten/1"
+                    },
+                },
+                "2": {
+                    "document": "https://documenten.nl/api/v1/documenten/2",
+                    "relation": {
+                        "informatieobject": "https://documenten.nl/api/v1/documenten/2"
+                    },
+                },
+            },
+        )
+
+    def test_existing_results_are_skipped(self):
+        submission = SubmissionFactory.create(
+            registration_result={
+                "intermediate": {
+                    "documents": {
+                        "1": {
+                            "document": "https://documenten.nl/api/v1/documenten/1",
+                            "relation": {"url": "https://zaken.nl/api/v1/zio/1"},
+                        },
+                        "2": {"document": "https://documenten.nl/api/v1/documenten/2"},
+                    }
+                }
+            }
+        )
+        uploads = {attachment_id: _upload(attachment_id) for attachment_id in (1, 2, 3)}
+        relate = Mock(wraps=_relate)
+
+        upload_attachments(
+            submission, list(uploads.items()), relate=relate, max_workers=2
+        )
+
+        uploads[1].assert_not_called()
+        uploads[2].assert_not_called()
+        uploads[3].assert_called_once()
+        self.assertCountEqual(
+            [call.kwargs["document"] for call in relate.call_args_list],
+            [
+                "https://documenten.nl/api/v1/documenten/2",
+                "https://documenten.nl/api/v1/documenten/3",
+            ],
+        )
+
+    def test_completed_results_are_stored_on_failure(self):
+        submission = SubmissionFactory.create()
+        failing_upload = Mock(side_effect=ValueError("Boom"))
+
+        with self.assertRaisesMessage(ValueError, "Boom"):
+            upload_attachments(
+                submission,
+                [(1, _upload(1)), (2, failing_upload)],
+                relate=_relate,
+                max_workers=2,
+            )
+
+        submission.refresh_from_db()
+        documents = submission.registration_result["intermediate"]["documents"]
+        self.assertEqual(list(documents), ["1"])
+        self.assertEqual(
+            documents["1"]["document"], "https://documenten.nl/api/v1/documenten/1"
+        )
+        self.assertIn("relation", documents["1"])
+
+    def test_serial_upload(self):
+        submission = SubmissionFactory.create()
+        calls = Mock()
+        calls.upload_1.return_value = "https://documenten.nl/api/v1/documenten/1"
+        calls.upload_2.return_value = "https://documenten.nl/api/v1/documenten/2"
+        calls.relate.side_effect = _relate
+
+        upload_attachments(
+            submission,
+            [(1, calls.upload_1), (2, calls.upload_2)],
+            relate=calls.relate,
+            max_workers=1,
+        )
+
+        self.assertEqual(
+            [name for name, *_ in calls.mock_calls],
+            ["upload_1", "relate", "upload_2", "relate"],
+        )
@@ -178,7 +178,7 @@ class SubmissionViewSet(
 
         logevent.submission_start(serializer.instance)
 
-        prefill_variables(serializer.instance)
+        prefill_variables(serializer.instance, session=self.request.session)
         initialise_user_defined_variables(serializer.instance)
 
     @extend_schema(
@@ -0,0 +1,104 @@
+"""
+Bulk loading of the submission state for batch processing.
+
+Loading the execution state (:meth:`Submission.load_execution_state`) and the
+variables state (:meth:`Submission.load_submission_value_variables_state`) of a
+submission costs a couple of queries. Batch jobs processing many submissions would run
+these queries for every submission. :func:`load_submission_states` loads the state of
+a whole batch of submissions in a fixed number of queries instead.
+"""
+
+import copy
+from collections import defaultdict
+from itertools import batched
+from typing import Iterator, Sequence
+
+from django.db import models
+
+from openforms.forms.models import Form, FormStep, FormVariable
+
+from .models import Submission, SubmissionStep, SubmissionValueVariable
+from .models.submission_value_variable import SubmissionValueVariablesState
+
+BATCH_SIZE = 100
+
+
+def load_submission_states(submissions: Sequence[Submission]) -> None:
+    """
+    Load and attach the execution and variables state of the submissions.
+
+    The forms (unless already loaded), form steps, form definitions, form variables,
+    submission steps and submission variables of all the submissions are retrieved
+    with one query each. Every submission gets its own copies of the form steps and
+    form variables, since the state of a submission (like the dynamic configuration
+    after evaluating logic) is stored on them.
+    """
+    if not submissions:
+        return
+
+    form_ids = {submission.form_id for submission in submissions}
+    submission_ids = [submission.pk for submission in submissions]
+
+    form_steps = defaultdict(list)
+    for form_step in (
+        FormStep.objects.filter(form__in=form_ids)
+        .select_related("form_definition")
+        .order_by("order")
+    ):
+        form_steps[form_step.form_id].append(form_step)
+
+    form_variables = defaultdict(list)
+    for form_variable in FormVariable.objects.filter(form__in=form_ids):
+        form_variables[form_variable.form_id].append(form_variable)
+
+    submission_steps = defaultdict(list)
+    for submission_step in SubmissionStep.objects.filter(submission__in=submission_ids):
+        submission_steps[submission_step.submission_id].append(submission_step)
+
+    submission_variables = defaultdict(list)
+    for submission_variable in SubmissionValueVariable.objects.filter(
+        submission__in=submission_ids
+    ):
+        submission_variables[submission_variable.submission_id].append(
+            submission_variable
+        )
+
+    # share the form instances, so that the form logic rules are cached once per form
+    forms = {
+        submission.form_id: submission.form
+        for submission in submissions
+        if Submission.form.is_cached(submission)
+    }
+    if missing_form_ids := form_ids - forms.keys():
+        forms.update(Form.objects.in_bulk(missing_form_ids))
+
+    for submission in submissions:
+        submission.form = forms[submission.form_id]
+        submission._execution_state = submission.build_execution_state(
+            [copy.deepcopy(form_step) for form_step in form_steps[submission.form_id]],
+            submission_steps=submission_steps[submission.pk],
+        )
+
+        for submission_variable in submission_variables[submission.pk]:
+            submission_variable.submission = submission
+        variables_state = SubmissionValueVariablesState(submission=submission)
+        variables_state._variables = variables_state.collect_variables(
+            form_variables=[
+                copy.copy(form_variable)
+                for form_variable in form_variables[submission.form_id]
+            ],
+            submission_variables=submission_variables[submission.pk],
+        )
+        submission._variables_state = variables_state
+
+
+def iter_submissions_with_state(
+    queryset: models.QuerySet[Submission], batch_size: int = BATCH_SIZE
+) -> Iterator[Submission]:
+    """
+    Iterate over the submissions in batches, with their state loaded in bulk.
+    """
+    submissions = queryset.select_related("form").iterator(chunk_size=batch_size)
+    for batch in batched(submissions, batch_size):
+        load_submission_states(batch)
+        yield from batch
@@ -1,14 +1,17 @@
+import csv
 import dataclasses
-from typing import Iterator
+import json
+from typing import Any, Callable, Iterable, Iterator, Mapping
 
 from django.db import models
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseBase, StreamingHttpResponse
 from django.utils.timezone import make_naive
 
 import tablib
 from lxml import etree
 from tablib.formats._json import serialize_objects_handler
 
+from .bulk_loading import iter_submissions_with_state
 from .models import Submission
 from .rendering.base import Node
 from .rendering.constants import RenderModes
@@ -21,6 +24,10 @@ class FileType:
     content_type: str
 
 
+# number of submissions fetched from the database at a time
+EXPORT_CHUNK_SIZE = 100
+
+
 class ExportFileTypes:
     CSV = FileType("csv", "text/csv")
     XLSX = FileType(
@@ -39,30 +46,35 @@ def iter_submission_data_nodes(submission: Submission) -> Iterator[Node]:
             yield node
 
 
-def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+def iter_submission_export(
+    queryset: models.QuerySet[Submission], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[list]:
     """
-    Turn a submissions queryset into a tablib dataset for export.
+    Yield the header row followed by a row for each submission in the queryset.
+
+    The submissions are fetched (with their state) and rendered in chunks, so that
+    memory usage does not grow with the number of exported submissions. Nothing is
+    yielded for an empty queryset.
 
     .. note:: the queryset of submissions must all be of the same form!
     """
-    # queryset *could* be empty
-    if not queryset:
-        return tablib.Dataset()
+    submissions = iter_submissions_with_state(queryset, batch_size=chunk_size)
+    translation_enabled = False
+    for index, submission in enumerate(submissions):
+        data_nodes = list(iter_submission_data_nodes(submission))
+
+        if index == 0:
+            translation_enabled = submission.form.translation_enabled
+            headers = ["Formuliernaam", "Inzendingdatum"]
+            if translation_enabled:
+                headers.append("Taalcode")
+            for data_node in data_nodes:
+                if hasattr(data_node, "component"):
+                    headers.append(data_node.component["key"])
+                elif hasattr(data_node, "variable"):
+                    headers.append(data_node.variable.key)
+            yield headers
 
-    first_submission = queryset[0]
-    headers = ["Formuliernaam", "Inzendingdatum"]
-    if first_submission.form.translation_enabled:
-        headers.append("Taalcode")
-
-    for data_node in iter_submission_data_nodes(first_submission):
-        if hasattr(data_node, "component"):
-            headers.append(data_node.component["key"])
-        elif hasattr(data_node, "variable"):
-            headers.append(data_node.variable.key)
-
-    data = tablib.Dataset(headers=headers)
-
-    for submission in queryset:
         inzending_datum = (
             make_naive(submission.completed_on) if submission.completed_on else None
         )
@@ -70,25 +82,96 @@ def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Da
             submission.form.admin_name,
             inzending_datum,
         ]
-        if first_submission.form.translation_enabled:
+        if translation_enabled:
             submission_data.append(submission.language_code)
-        submission_data += [
-            data_node.value for data_node in iter_submission_data_nodes(submission)
-        ]
-        data.append(submission_data)
+        submission_data += [data_node.value for data_node in data_nodes]
+        yield submission_data
+
+
+def create_submission_export(queryset: models.QuerySet[Submission]) -> tablib.Dataset:
+    """
+    Turn a submissions queryset into a tablib dataset for export.
+
+    .. note:: the queryset of submissions must all be of the same form!
+    """
+    rows = iter_submission_export(queryset)
+    # queryset *could* be empty
+    if (headers := next(rows, None)) is None:
+        return tablib.Dataset()
+
+    data = tablib.Dataset(headers=headers)
+    for row in rows:
+        data.append(row)
     return data
 
 
+class _Echo:
+    """
+    File-like object that returns the written value rather than buffering it.
+    """
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _stream_csv(rows: Iterator[list]) -> Iterator[str]:
+    writer = csv.writer(_Echo(), delimiter=",")
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def _stream_json(rows: Iterator[list]) -> Iterator[str]:
+    # matches the output of the tablib JSON format - a list of objects
+    if (headers := next(rows, None)) is None:
+        yield "[]"
+        return
+
+    yield "["
+    for index, row in enumerate(rows):
+        serialized = json.dumps(
+            dict(zip(headers, row)),
+            default=serialize_objects_handler,
+            ensure_ascii=False,
+        )
+        yield serialized if index == 0 else f", {serialized}"
+    yield "]"
+
+
+def _stream_xml(rows: Iterator[list]) -> Iterator[bytes]:
+    if (headers := next(rows, None)) is None:
+        return XMLKeyValueExport.iter_export([])
+    return XMLKeyValueExport.iter_export(dict(zip(headers, row)) for row in rows)
+
+
+STREAMING_EXPORTS: dict[str, Callable[[Iterator[list]], Iterator[str | bytes]]] = {
+    ExportFileTypes.CSV.extension: _stream_csv,
+    ExportFileTypes.JSON.extension: _stream_json,
+    ExportFileTypes.XML.extension: _stream_xml,
+}
+
+
 def export_submissions(
     queryset: models.QuerySet[Submission], file_type: FileType
-) -> HttpResponse:
-    export_data = create_submission_export(queryset)
+) -> HttpResponseBase:
+    """
+    Export the submissions as a file download.
+
+    The text based formats are streamed, as the submissions are rendered one chunk
+    at a time. Other formats (XLSX) are built in memory.
+    """
     filename = f"submissions_export.{file_type.extension}"
 
-    response = HttpResponse(
-        export_data.export(file_type.extension),
-        content_type=file_type.content_type,
-    )
+    if stream := STREAMING_EXPORTS.get(file_type.extension):
+        response = StreamingHttpResponse(
+            stream(iter_submission_export(queryset)),
+            content_type=file_type.content_type,
+        )
+    else:
+        export_data = create_submission_export(queryset)
+        response = HttpResponse(
+            export_data.export(file_type.extension),
+            content_type=file_type.content_type,
+        )
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
     return response
@@ -139,13 +222,20 @@ class XMLKeyValueExport:
 
     @classmethod
     def export_set(cls, dset):
-        root = etree.Element("submissions")
-        for row in dset.dict:
-            elem = etree.SubElement(root, "submission")
+        return b"".join(cls.iter_export(dset.dict))
+
+    @classmethod
+    def iter_export(cls, rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+        """
+        Serialize the rows one submission element at a time.
+        """
+        yield b"<?xml version='1.0' encoding='utf8'?>\n<submissions>\n"
+        for row in rows:
+            elem = etree.Element("submission")
             for key, value in row.items():
                 field = etree.SubElement(elem, "field", name=key)
                 _xml_value(field, value, wrap_single=True)
-
-        return etree.tostring(
-            root, xml_declaration=True, encoding="utf8", pretty_print=True
-        )
+            etree.indent(elem, level=1)
+            yield b"  " + etree.tostring(elem, encoding="utf8", xml_declaration=False)
+            yield b"\n"
+        yield b"</submissions>\n"
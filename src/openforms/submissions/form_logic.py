@@ -14,7 +14,12 @@ from openforms.typing import DataMapping
 
 from .logic.actions import ActionOperation
 from .logic.datastructures import DataContainer
-from .logic.rules import get_rules_to_evaluate, iter_evaluate_rules
+from .logic.incremental import get_cache_secret
+from .logic.rules import (
+    get_incremental_evaluation_cache_key,
+    get_rules_to_evaluate,
+    iter_evaluate_rules,
+)
 from .models.submission_step import DirtyData
 
 if TYPE_CHECKING:
@@ -92,6 +97,16 @@ def evaluate_form_logic(
     # 5.1 - if the action type is to set a variable, update the variable state. This
     # happens inside of iter_evaluate_rules. This is the ONLY operation that is allowed
     # to execute while we're looping through the rules.
+    #
+    # Logic checks with dirty data are performed for (almost) every change of a field
+    # value, so we only re-evaluate the rules affected by the changes since the
+    # previous check. The outcome of the previous check is protected with a secret in
+    # the session of the user.
+    incremental_cache_key, incremental_secret = "", ""
+    request = context.get("request")
+    if dirty and (session := getattr(request, "session", None)) is not None:
+        incremental_cache_key = get_incremental_evaluation_cache_key(submission, step)
+        incremental_secret = get_cache_secret(session)
     with elasticapm.capture_span(
         name="collect_logic_operations", span_type="app.submissions.logic"
     ):
@@ -99,6 +114,8 @@ def evaluate_form_logic(
             rules,
             data_container,
             submission=submission,
+            incremental_cache_key=incremental_cache_key,
+            incremental_secret=incremental_secret,
         ):
             mutation_operations.append(operation)
 
@@ -139,24 +156,30 @@ def evaluate_form_logic(
     # only keep the changes in the data, so that old values do not overwrite otherwise
     # debounced client-side data changes
     data_diff = FormioData()
-    for component in config_wrapper:
-        key = component["key"]
-        is_visible = config_wrapper.is_visible_in_frontend(key, data_container.data)
-        if is_visible:
-            continue
-
-        # Reset the value of any field that may have become hidden again after evaluating the logic
-        original_value = initial_data.get(key, empty)
-        empty_value = get_component_empty_value(component)
-        if original_value is empty or original_value == empty_value:
-            continue
-
-        if not component.get("clearOnHide", False):
-            continue
-
-        # clear the value
-        data_container.update({key: empty_value})
-        data_diff[key] = empty_value
+    # the cleared values may affect the visibility of other components, so repeat until
+    # no more values are cleared
+    values_cleared = True
+    while values_cleared:
+        values_cleared = False
+        visibility = config_wrapper.get_visibility(data_container.data)
+        for component in config_wrapper:
+            key = component["key"]
+            if visibility[key] or key in data_diff:
+                continue
+
+            # Reset the value of any field that may have become hidden again after evaluating the logic
+            original_value = initial_data.get(key, empty)
+            empty_value = get_component_empty_value(component)
+            if original_value is empty or original_value == empty_value:
+                continue
+
+            if not component.get("clearOnHide", False):
+                continue
+
+            # clear the value
+            data_container.update({key: empty_value})
+            data_diff[key] = empty_value
+            values_cleared = True
 
     # 7.2 Interpolate the component configuration with the variables.
     inject_variables(config_wrapper, data_container.data)
@@ -1,24 +1,22 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
-from typing import Any, Mapping, Self, TypedDict
-
-from django.core.cache import cache
-from django.core.serializers.json import DjangoJSONEncoder
+from functools import cached_property
+from typing import Any, Callable, Mapping, Self, TypedDict
 
 from glom import assign
-from json_logic import jsonLogic
 
-from openforms.dmn.service import evaluate_dmn
+from openforms.dmn.service import VariablesMapping, get_dmn_evaluator
 from openforms.formio.datastructures import FormioData
 from openforms.formio.service import FormioConfigurationWrapper
 from openforms.forms.constants import LogicActionTypes
-from openforms.forms.models import FormLogic
+from openforms.forms.models import FormLogic, FormVariable
 from openforms.typing import DataMapping, JSONObject
 
 from ..models import Submission, SubmissionStep
 from ..models.submission_step import DirtyData
+from .caching import get_cache_key, get_or_set
+from .compilation import evaluate_expression
 from .log_utils import log_errors
 from .service_fetching import perform_service_fetch
 
@@ -45,6 +43,19 @@ def compile_action_operation(action: ActionDict) -> ActionOperation:
     return cls.from_action(action)
 
 
+@dataclass
+class ConcurrentEvaluation:
+    """
+    The evaluation of an action operation, prepared to be performed concurrently.
+    """
+
+    # the variable keys read by the evaluation, ``None`` if they are unknown
+    inputs: frozenset[str] | None
+    # the variable keys that may be set by the evaluation
+    outputs: frozenset[str]
+    evaluate: Callable[[DataMapping], DataMapping | None]
+
+
 class ActionOperation:
     rule: FormLogic
 
@@ -74,6 +85,20 @@ class ActionOperation:
         """
         pass
 
+    def prepare_concurrent_eval(
+        self, submission: Submission
+    ) -> ConcurrentEvaluation | None:
+        """
+        Prepare the evaluation for a worker thread, if the operation supports it.
+
+        Operations that (mostly) wait for external services can be evaluated
+        concurrently with other such operations. Any database access must happen
+        here, in the calling thread.
+
+        :returns: ``None`` if the operation must be evaluated in order.
+        """
+        return None
+
 
 @dataclass
 class PropertyAction(ActionOperation):
@@ -175,7 +200,7 @@ class VariableAction(ActionOperation):
         submission: Submission,
     ) -> DataMapping:
         with log_errors(self.value, self.rule):
-            return {self.variable: jsonLogic(self.value, context)}
+            return {self.variable: evaluate_expression(self.rule, self.value, context)}
 
 
 @dataclass
@@ -186,15 +211,37 @@ class ServiceFetchAction(ActionOperation):
     def from_action(cls, action: ActionDict) -> Self:
         return cls(variable=action["variable"])
 
+    @cached_property
+    def form_variable(self) -> FormVariable:
+        return self.rule.form.formvariable_set.select_related(
+            "service_fetch_configuration__service__client_certificate",
+            "service_fetch_configuration__service__server_certificate",
+        ).get(key=self.variable)
+
+    def _fetch(
+        self, var: FormVariable, context: DataMapping, submission: Submission
+    ) -> DataMapping | None:
+        with log_errors({}, self.rule):  # TODO proper error handling
+            result = perform_service_fetch(var, context, str(submission.uuid))
+            return {var.key: result.value}
+
     def eval(
         self,
         context: DataMapping,
         submission: Submission,
-    ) -> DataMapping:
-        var = self.rule.form.formvariable_set.get(key=self.variable)
-        with log_errors({}, self.rule):  # TODO proper error handling
-            result = perform_service_fetch(var, context, str(submission.uuid))
-            return {var.key: result.value}
+    ) -> DataMapping | None:
+        return self._fetch(self.form_variable, context, submission)
+
+    def prepare_concurrent_eval(
+        self, submission: Submission
+    ) -> ConcurrentEvaluation | None:
+        var = self.form_variable
+        fetch_config = var.service_fetch_configuration
+        return ConcurrentEvaluation(
+            inputs=fetch_config.get_referenced_variables() if fetch_config else None,
+            outputs=frozenset({var.key}),
+            evaluate=lambda context: self._fetch(var, context, submission),
+        )
 
 
 class DMNVariableMapping(TypedDict):
@@ -227,11 +274,19 @@ class EvaluateDMNAction(ActionOperation):
 
         return cls(**dmn_config)
 
-    def eval(
+    def _get_evaluator(self) -> Callable[[VariablesMapping], VariablesMapping]:
+        return get_dmn_evaluator(
+            self.plugin_id,
+            self.decision_definition_id,
+            version=self.decision_definition_version,
+        )
+
+    def _evaluate(
         self,
+        evaluate: Callable[[VariablesMapping], VariablesMapping],
         context: DataMapping,
-        submission: Submission,
-    ) -> DataMapping | None:
+        submission_uuid: str,
+    ) -> DataMapping:
         # Mapping from form variables to DMN inputs
         data = FormioData(context)
         dmn_inputs = {
@@ -239,26 +294,20 @@ class EvaluateDMNAction(ActionOperation):
             for item in self.input_mapping
         }
 
-        def _evaluate_dmn():
-            return evaluate_dmn(
-                definition_id=self.decision_definition_id,
-                version=self.decision_definition_version,
-                input_values=dmn_inputs,
-                plugin_id=self.plugin_id,
-            )
-
         # Perform DMN call or retrieve result from cache
-        inputs = json.dumps(dmn_inputs, cls=DjangoJSONEncoder, sort_keys=True)
-        cache_key = hash(
-            str(submission.uuid)
-            + self.decision_definition_id
-            + self.decision_definition_version
-            + self.plugin_id
-            + inputs
+        cache_key = get_cache_key(
+            "dmn",
+            submission_uuid=submission_uuid,
+            config_id=(
+                f"{self.plugin_id}:{self.decision_definition_id}:"
+                f"{self.decision_definition_version}"
+            ),
+            arguments=dmn_inputs,
         )
-        dmn_outputs = cache.get_or_set(
+        dmn_outputs = get_or_set(
+            "dmn",
             cache_key,
-            default=_evaluate_dmn,
+            default=lambda: evaluate(dmn_inputs),
             timeout=self.cache_timeout,
         )
 
@@ -269,6 +318,31 @@ class EvaluateDMNAction(ActionOperation):
             if item["dmn_variable"] in dmn_outputs
         }
 
+    def eval(
+        self,
+        context: DataMapping,
+        submission: Submission,
+    ) -> DataMapping | None:
+        # only resolve the plugin configuration when the result is not cached
+        return self._evaluate(
+            lambda dmn_inputs: self._get_evaluator()(dmn_inputs),
+            context,
+            str(submission.uuid),
+        )
+
+    def prepare_concurrent_eval(
+        self, submission: Submission
+    ) -> ConcurrentEvaluation | None:
+        # resolve the plugin configuration here, only the evaluation itself is done
+        # in the worker thread
+        evaluate = self._get_evaluator()
+        submission_uuid = str(submission.uuid)
+        return ConcurrentEvaluation(
+            inputs=frozenset(item["form_variable"] for item in self.input_mapping),
+            outputs=frozenset(item["form_variable"] for item in self.output_mapping),
+            evaluate=lambda context: self._evaluate(evaluate, context, submission_uuid),
+        )
+
 
 @dataclass
 class SetRegistrationBackendAction(ActionOperation):
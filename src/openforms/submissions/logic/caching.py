@@ -0,0 +1,76 @@
+"""
+Shared caching of the results of (external) calls made while evaluating logic.
+
+Logic actions like fetching a value from a service or evaluating a DMN decision are
+evaluated again on every logic check. The results are cached in the shared cache so
+that all the (web and Celery) processes can benefit from a call made by any of them.
+"""
+
+import logging
+from typing import Callable, TypeVar
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.utils.functional import empty
+
+from openforms.typing import JSONValue
+from openforms.utils.cache import CacheStatistics, HitCounter, get_digest
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "submission-logic"
+CACHE_KEY_VERSION = 1
+
+T = TypeVar("T")
+
+
+def get_cache_key(
+    namespace: str, submission_uuid: str, config_id: str, arguments: JSONValue
+) -> str:
+    """
+    Build a deterministic cache key for the result of a call made during logic
+    evaluation.
+
+    :arg namespace: The kind of call, e.g. ``service-fetch``.
+    :arg submission_uuid: The submission to scope the result to.
+    :arg config_id: Identifies the configuration of the call.
+    :arg arguments: The arguments of the call. They are serialized canonically, so
+      the order of keys does not matter.
+    """
+    digest = get_digest([str(submission_uuid), str(config_id), arguments])
+    return f"{CACHE_KEY_PREFIX}|{namespace}|v{CACHE_KEY_VERSION}|{digest}"
+
+
+def _get_hit_counter(namespace: str) -> HitCounter:
+    return HitCounter(f"{CACHE_KEY_PREFIX}|{namespace}|v{CACHE_KEY_VERSION}")
+
+
+def get_cache_statistics(namespace: str) -> CacheStatistics:
+    """
+    Return the number of cache hits and misses recorded for the namespace.
+    """
+    return _get_hit_counter(namespace).get_statistics()
+
+
+def get_or_set(
+    namespace: str,
+    cache_key: str,
+    default: Callable[[], T],
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> T:
+    """
+    Look up the cached value, or call ``default`` and cache its result.
+
+    Cache hits and misses are counted per namespace.
+    """
+    counter = _get_hit_counter(namespace)
+    value = cache.get(cache_key, empty)
+    if value is not empty:
+        counter.hit()
+        return value
+
+    logger.debug("Cache miss for %s (namespace: %s)", cache_key, namespace)
+    counter.miss()
+    value = default()
+    cache.add(cache_key, value, timeout=timeout)
+    return value
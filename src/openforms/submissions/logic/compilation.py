@@ -0,0 +1,43 @@
+"""
+In-process cache of compiled logic rule expressions.
+
+The compiled expressions are keyed by the rule primary key and a marker derived from
+the expression content, so that updating a rule (or the form being re-imported)
+automatically invalidates the compiled version - no explicit cache busting is needed.
+"""
+
+import json
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from json_logic import jsonLogic
+from json_logic.typing import JSON
+
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.json_logic.compiler import CompiledExpression, compile_expression
+
+
+@lru_cache(maxsize=4096)
+def _get_compiled(rule_pk: int | None, marker: str) -> CompiledExpression:
+    # the marker is the canonical serialization of the expression
+    return compile_expression(json.loads(marker))
+
+
+def get_compiled_expression(rule: FormLogic, expression: JSON) -> CompiledExpression:
+    marker = json.dumps(expression, cls=DjangoJSONEncoder, sort_keys=True)
+    return _get_compiled(rule.pk, marker)
+
+
+def evaluate_expression(rule: FormLogic, expression: JSON, data: DataMapping) -> JSON:
+    """
+    Evaluate an expression belonging to ``rule`` (its trigger or an action value).
+
+    Depending on the ``LOGIC_COMPILE_EXPRESSIONS`` setting, the expression is compiled
+    once and cached, or interpreted on every call.
+    """
+    if not settings.LOGIC_COMPILE_EXPRESSIONS:
+        return jsonLogic(expression, data)
+    return get_compiled_expression(rule, expression)(data)
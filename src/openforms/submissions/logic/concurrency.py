@@ -0,0 +1,148 @@
+"""
+Concurrent evaluation of logic actions that call external services.
+
+Fetching a variable value from a service or evaluating a DMN decision blocks on a
+(remote) HTTP call. When several of these actions are triggered during a single logic
+evaluation pass and they do not depend on each other, they are evaluated at the same
+time.
+
+Actions are deferred rather than evaluated immediately - the evaluation of the
+subsequent rules continues until a rule is encountered that reads or writes a
+variable that is set by a deferred action. At that point (or at the end of the pass),
+all the deferred actions are evaluated concurrently and their results are applied in
+rule order, so the outcome is the same as when evaluating the actions one after the
+other.
+
+Every deferred action is evaluated with a snapshot of the data at the position of its
+rule, so the actions never see changes made by the rules that come after them.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from zgw_consumers.concurrent import parallel
+
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+
+from ..models import Submission
+from .actions import ActionOperation, ConcurrentEvaluation
+from .dependencies import keys_overlap
+
+
+@dataclass
+class DeferredRule:
+    rule: FormLogic
+    operations: list[ActionOperation]
+    evaluations: list[ConcurrentEvaluation]
+    context: DataMapping = field(default_factory=dict)
+    # the results of the evaluations, in order of the operations
+    results: list[DataMapping | None] = field(default_factory=list)
+
+    @property
+    def inputs(self) -> set[str] | None:
+        inputs = set()
+        for evaluation in self.evaluations:
+            if evaluation.inputs is None:
+                return None
+            inputs |= evaluation.inputs
+        return inputs
+
+    @property
+    def outputs(self) -> set[str]:
+        return {key for evaluation in self.evaluations for key in evaluation.outputs}
+
+
+def _any_overlap(keys: Iterable[str], others: Iterable[str]) -> bool:
+    return any(keys_overlap(key, other) for key in keys for other in others)
+
+
+class ConcurrentActionEvaluator:
+    """
+    Keep track of the deferred rules during a single evaluation pass.
+    """
+
+    def __init__(self, submission: Submission, max_workers: int):
+        self.submission = submission
+        self.max_workers = max_workers
+        self.pending: list[DeferredRule] = []
+        self._pending_outputs: set[str] = set()
+
+    def conflicts(
+        self, inputs: Iterable[str] | None, outputs: Iterable[str] = ()
+    ) -> bool:
+        """
+        Check if reading ``inputs`` or writing ``outputs`` requires the results of
+        the pending actions.
+
+        :arg inputs: The keys that are read, ``None`` if they are unknown.
+        :arg outputs: The keys that are written.
+        """
+        if not self.pending:
+            return False
+        if inputs is None:
+            return True
+        return _any_overlap([*inputs, *outputs], self._pending_outputs)
+
+    def prepare(
+        self, rule: FormLogic, operations: list[ActionOperation]
+    ) -> DeferredRule | None:
+        """
+        Prepare the (triggered) rule for deferred evaluation.
+
+        :returns: ``None`` if any of the actions of the rule must be evaluated in
+          order.
+        """
+        if self.max_workers <= 1 or not operations:
+            return None
+
+        evaluations = []
+        outputs: set[str] = set()
+        for operation in operations:
+            evaluation = operation.prepare_concurrent_eval(self.submission)
+            if evaluation is None:
+                return None
+            # actions of the same rule see the results of the preceding actions
+            if evaluations and (
+                evaluation.inputs is None or _any_overlap(evaluation.inputs, outputs)
+            ):
+                return None
+            evaluations.append(evaluation)
+            outputs |= evaluation.outputs
+
+        return DeferredRule(rule=rule, operations=operations, evaluations=evaluations)
+
+    def defer(self, deferred: DeferredRule, context: DataMapping) -> None:
+        deferred.context = context
+        self.pending.append(deferred)
+        self._pending_outputs |= deferred.outputs
+
+    def evaluate(self) -> list[DeferredRule]:
+        """
+        Evaluate all the pending actions.
+
+        :returns: The deferred rules in rule order, with their results.
+        """
+        pending, self.pending = self.pending, []
+        self._pending_outputs = set()
+
+        calls = [
+            (evaluation, deferred.context)
+            for deferred in pending
+            for evaluation in deferred.evaluations
+        ]
+        if len(calls) > 1:
+            with parallel(max_workers=min(self.max_workers, len(calls))) as executor:
+                results = list(
+                    executor.map(
+                        lambda call: call[0].evaluate(call[1]),
+                        calls,
+                    )
+                )
+        else:
+            results = [evaluation.evaluate(context) for evaluation, context in calls]
+
+        results_iterator = iter(results)
+        for deferred in pending:
+            deferred.results = [next(results_iterator) for _ in deferred.evaluations]
+        return pending
@@ -12,15 +12,45 @@ from ..models.submission_value_variable import SubmissionValueVariablesState
 class DataContainer:
     """
     A data container to manage the data/variables lifecycle during logic evaluation.
+
+    The (nested) data mapping is built once and then kept in sync with the variables
+    state by patching it in place on every :meth:`update`. Snapshots of the data are
+    cheap - the containers in the mapping are shared with the snapshot and only copied
+    when they are about to be modified (copy-on-write).
     """
 
     state: SubmissionValueVariablesState
 
-    _initial_data: tuple[tuple[str, Any]] = field(init=False, default_factory=tuple)
+    _data: DataMapping = field(init=False, repr=False)
+    _initial_data: DataMapping = field(init=False, repr=False)
+    # containers created after the last snapshot, keyed by their ``id()``. Keeping a
+    # reference ensures the ids are not recycled. These may be mutated in place.
+    _owned: dict[int, dict] = field(init=False, repr=False, default_factory=dict)
+    # variable keys that are nested inside another variable key, e.g. ``foo.bar`` is
+    # nested inside ``foo``.
+    _nested_keys: dict[str, list[str]] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self):
-        # ensure the initial data is immutable
-        self._initial_data = tuple(self.data.items())  # record for logging purposes
+        self._data = self._build_data()
+        keys = self.state.variables.keys()
+        for key in keys:
+            bits = key.split(".")
+            for depth in range(1, len(bits)):
+                if (parent := ".".join(bits[:depth])) in keys:
+                    self._nested_keys.setdefault(parent, []).append(key)
+        # record for logging purposes and to determine the changes made by the logic
+        self._initial_data = self.snapshot()
+
+    def _build_data(self) -> DataMapping:
+        dynamic_values = {
+            key: variable.to_python() for key, variable in self.state.variables.items()
+        }
+        static_values = self.state.static_data()
+        nested_data = FormioData({**dynamic_values, **static_values})
+        self._owned.clear()
+        return nested_data.data
 
     @property
     def initial_data(self) -> DataMapping:
@@ -32,23 +62,69 @@ class DataContainer:
         Collect the total picture of data/variable values.
 
         The current view on the submission variable value state is augmented with
-        the static variables.
+        the static variables. The returned mapping is kept up to date with
+        subsequent calls to :meth:`update` and must not be mutated by the caller.
 
         :return: A datamapping (key: variable key, value: variable value) ready for
           (template context) evaluation.
         """
-        dynamic_values = {
-            key: variable.to_python() for key, variable in self.state.variables.items()
-        }
-        static_values = self.state.static_data()
-        nested_data = FormioData({**dynamic_values, **static_values})
-        return nested_data.data
+        return self._data
+
+    def snapshot(self) -> DataMapping:
+        """
+        Return a read-only view of the current data.
+
+        Subsequent updates do not affect the snapshot.
+        """
+        # everything currently in the data is now shared with the snapshot
+        self._owned.clear()
+        return self._data
+
+    def _own(self, container: dict) -> dict:
+        if id(container) in self._owned:
+            return container
+        copy = dict(container)
+        self._owned[id(copy)] = copy
+        return copy
+
+    def _assign(self, key: str, value: Any) -> bool:
+        """
+        Set the (possibly nested) key, copying the containers along the path if they
+        are shared with a snapshot.
+
+        :returns: ``False`` if the value could not be assigned because the path
+          traverses a non-dict value.
+        """
+        *parents, leaf = key.split(".")
+        self._data = container = self._own(self._data)
+        for bit in parents:
+            child = container.get(bit)
+            if child is None and bit not in container:
+                child = {}
+            if not isinstance(child, dict):
+                return False
+            container[bit] = container = self._own(child)
+        container[leaf] = value
+        return True
 
     def update(self, updates: DataMapping) -> None:
         """
         Update the dynamic data state.
         """
-        self.state.set_values(updates)
+        updated_keys = self.state.set_values(updates)
+        static_data = self.state.static_data()
+        variables = self.state.variables
+        for key in updated_keys:
+            # static variables take precedence
+            if key in static_data:
+                continue
+            keys = [key, *self._nested_keys.get(key, [])]
+            if not all(
+                self._assign(_key, variables[_key].to_python()) for _key in keys
+            ):
+                # fall back to the complete rebuild for exotic structures
+                self._data = self._build_data()
+                return
 
     def get_updated_step_data(self, step: SubmissionStep) -> FormioData:
         relevant_variables = self.state.get_variables_in_submission_step(
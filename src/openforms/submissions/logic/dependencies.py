@@ -0,0 +1,198 @@
+"""
+Static dependency analysis of form logic rules.
+
+Every logic rule reads a number of variables (in its trigger and in the expressions
+of its actions) and writes a number of variables (through its actions). We
+introspect the JSON logic expressions to build a variable -> rule dependency graph,
+which the incremental rule evaluation uses to figure out which rules need to be
+re-evaluated when only a subset of the data has changed.
+
+Rules whose inputs cannot be determined statically are marked as *volatile* - they
+are always evaluated.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterable
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from json_logic.meta import JSONLogicExpression, Operation
+from json_logic.typing import JSON, Primitive
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.models import FormLogic
+from openforms.utils.json_logic.datastructures import iter_tree
+
+# operators whose result depends on something else than the data passed in, or
+# that reference variables in a way that cannot be statically resolved.
+VOLATILE_OPERATORS = {"today", "missing", "missing_some"}
+
+
+@dataclass(frozen=True)
+class RuleDependencies:
+    inputs: frozenset[str] = frozenset()
+    outputs: frozenset[str] = frozenset()
+    volatile: bool = False
+
+
+def _collect_expression_inputs(expression: JSON) -> tuple[set[str], bool]:
+    """
+    Determine the variable keys that are read by the expression.
+
+    :returns: a tuple of the input keys and a boolean indicating if the expression is
+      volatile.
+    """
+    try:
+        tree = JSONLogicExpression.from_expression(expression).as_tree()
+    except Exception:  # unknown operators, malformed expressions...
+        return set(), True
+
+    inputs = set()
+    for node in iter_tree(tree):
+        if isinstance(node, Primitive) or not isinstance(node, Operation):
+            continue
+        if node.operator in VOLATILE_OPERATORS:
+            return set(), True
+        if node.operator != "var":
+            continue
+        key = node.arguments[0] if node.arguments else ""
+        # {"var": ""} returns the whole data structure, and dynamic keys can only
+        # be resolved at evaluation time
+        if not key or not isinstance(key, str):
+            return set(), True
+        inputs.add(key)
+    return inputs, False
+
+
+def _analyze_rule(trigger: JSON, actions: list[dict]) -> RuleDependencies:
+    inputs, volatile = _collect_expression_inputs(trigger)
+    outputs = set()
+
+    for action in actions:
+        action_details = action.get("action", {})
+        match action_details.get("type"):
+            case LogicActionTypes.variable:
+                outputs.add(action["variable"])
+                action_inputs, action_volatile = _collect_expression_inputs(
+                    action_details.get("value")
+                )
+                inputs |= action_inputs
+                volatile = volatile or action_volatile
+            case LogicActionTypes.fetch_from_service:
+                # the request arguments are templated with the complete data context
+                outputs.add(action["variable"])
+                volatile = True
+            case LogicActionTypes.evaluate_dmn:
+                config = action_details.get("config", {})
+                inputs |= {
+                    item["form_variable"] for item in config.get("input_mapping", [])
+                }
+                outputs |= {
+                    item["form_variable"] for item in config.get("output_mapping", [])
+                }
+
+    return RuleDependencies(
+        inputs=frozenset(inputs),
+        outputs=frozenset(outputs),
+        volatile=volatile,
+    )
+
+
+@lru_cache(maxsize=2048)
+def _analyze_rule_cached(rule_signature: str) -> RuleDependencies:
+    trigger, actions = json.loads(rule_signature)
+    return _analyze_rule(trigger, actions)
+
+
+def _get_rule_signature(rule: FormLogic) -> str:
+    return json.dumps(
+        [rule.json_logic_trigger, rule.actions],
+        cls=DjangoJSONEncoder,
+        sort_keys=True,
+    )
+
+
+def get_rule_dependencies(rule: FormLogic) -> RuleDependencies:
+    """
+    Introspect the rule to determine the variables it reads and writes.
+
+    The result is cached in-process based on the content of the rule, so that any
+    modification of the trigger or actions invalidates the cached analysis.
+    """
+    return _analyze_rule_cached(_get_rule_signature(rule))
+
+
+@lru_cache(maxsize=2048)
+def _get_trigger_dependencies_cached(trigger_signature: str) -> RuleDependencies:
+    inputs, volatile = _collect_expression_inputs(json.loads(trigger_signature))
+    return RuleDependencies(inputs=frozenset(inputs), volatile=volatile)
+
+
+def get_trigger_dependencies(rule: FormLogic) -> RuleDependencies:
+    """
+    Introspect the trigger of the rule to determine the variables it reads.
+    """
+    return _get_trigger_dependencies_cached(
+        json.dumps(rule.json_logic_trigger, cls=DjangoJSONEncoder, sort_keys=True)
+    )
+
+
+def keys_overlap(key: str, other: str) -> bool:
+    """
+    Check if two (possibly nested) variable keys point to overlapping data.
+
+    A change in ``foo`` affects a rule reading ``foo.bar`` and vice versa.
+    """
+    if key == other:
+        return True
+    return other.startswith(f"{key}.") or key.startswith(f"{other}.")
+
+
+@dataclass
+class DependencyGraph:
+    """
+    The variable -> rule dependency graph of a set of logic rules.
+    """
+
+    rules: list[FormLogic]
+    dependencies: dict[int, RuleDependencies]
+    fingerprint: str
+    rules_by_input: dict[str, set[int]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rules(cls, rules: Iterable[FormLogic]) -> "DependencyGraph":
+        rules = list(rules)
+        dependencies = {}
+        rules_by_input: dict[str, set[int]] = {}
+        fingerprint = hashlib.md5(usedforsecurity=False)
+        for rule in rules:
+            signature = _get_rule_signature(rule)
+            fingerprint.update(f"{rule.pk}:{signature}".encode())
+            rule_dependencies = _analyze_rule_cached(signature)
+            dependencies[rule.pk] = rule_dependencies
+            for key in rule_dependencies.inputs:
+                rules_by_input.setdefault(key, set()).add(rule.pk)
+
+        return cls(
+            rules=rules,
+            dependencies=dependencies,
+            fingerprint=fingerprint.hexdigest(),
+            rules_by_input=rules_by_input,
+        )
+
+    def get_dependent_rules(self, keys: Iterable[str]) -> set[int]:
+        """
+        Return the primary keys of the rules that read any of the given keys.
+        """
+        dependent_rules = set()
+        for key in keys:
+            for input_key, rule_ids in self.rules_by_input.items():
+                if keys_overlap(key, input_key):
+                    dependent_rules |= rule_ids
+        return dependent_rules
+
+    def is_volatile(self, rule: FormLogic) -> bool:
+        return self.dependencies[rule.pk].volatile
@@ -0,0 +1,186 @@
+"""
+Incremental evaluation of logic rules.
+
+During a logic check with dirty data, typically only one or a handful of fields have
+changed compared to the previous check. The outcome of a rule (is it triggered and
+which variable values does it set) is fully determined by the values of its inputs,
+so rules whose inputs did not change (directly or transitively through other rules)
+produce the same outcome as during the previous evaluation.
+
+We record the outcome of every rule in a snapshot in the cache, together with a
+digest of the data that was used as input. On the next evaluation, the input data is
+compared with the snapshot and only the rules that are affected by the changes are
+evaluated again. The outcome of every other rule is taken from the snapshot, which
+gives the same result as a full evaluation pass.
+
+The snapshot is stored in the shared cache, while the data is personal data. It is
+protected with a secret that only lives in the session of the user:
+
+* the input values are only stored as an HMAC digest of each value
+* the outcomes (containing the values set by the rules) are encrypted
+"""
+
+import logging
+import pickle
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.contrib.sessions.backends.base import SessionBase
+from django.core.cache import cache
+from django.utils.functional import empty
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from openforms.forms.models import FormLogic
+from openforms.typing import DataMapping
+from openforms.utils.cache import get_digest, get_session_secret
+
+from .datastructures import DataContainer
+from .dependencies import DependencyGraph
+
+logger = logging.getLogger(__name__)
+
+# Matches the DigiD/eHerkenning session duration - logic checks are done while the
+# user is filling out the form.
+SNAPSHOT_CACHE_TIMEOUT = 60 * 15
+
+SESSION_KEY = "logic_evaluation_secret"
+
+
+@dataclass
+class RuleOutcome:
+    triggered: bool
+    mutations: DataMapping = field(default_factory=dict)
+
+
+@dataclass
+class EvaluationSnapshot:
+    fingerprint: str
+    input_digests: dict[str, str]
+    # the encrypted outcomes of the rules, see :meth:`IncrementalEvaluation.save`
+    outcomes: bytes
+
+
+def get_cache_secret(session: SessionBase) -> str:
+    """
+    Return the secret protecting the snapshots of the session.
+
+    The secret is added to the session if it doesn't have one yet.
+    """
+    return get_session_secret(session, SESSION_KEY)
+
+
+def get_flat_values(data_container: DataContainer) -> dict[str, Any]:
+    state = data_container.state
+    return {
+        **{key: variable.to_python() for key, variable in state.variables.items()},
+        **state.static_data(),
+    }
+
+
+def get_digests(secret: str, values: DataMapping) -> dict[str, str]:
+    """
+    Calculate the HMAC digest of the canonical representation of every value.
+    """
+    digests = {}
+    for key, value in values.items():
+        try:
+            digests[key] = get_digest(value, secret=secret)
+        except TypeError:
+            # not JSON serializable - at worst the value is considered to be changed
+            digests[key] = get_digest(repr(value), secret=secret)
+    return digests
+
+
+def _get_changed_keys(old: DataMapping, new: DataMapping) -> set[str]:
+    return {
+        key
+        for key in old.keys() | new.keys()
+        if old.get(key, empty) != new.get(key, empty)
+    }
+
+
+class IncrementalEvaluation:
+    """
+    Keep track of which rules need to be evaluated during a single evaluation pass.
+    """
+
+    def __init__(
+        self,
+        cache_key: str,
+        secret: str,
+        graph: DependencyGraph,
+        data_container: DataContainer,
+    ):
+        self.cache_key = cache_key
+        self.fernet = Fernet(secret)
+        self.graph = graph
+        self.input_digests = get_digests(secret, get_flat_values(data_container))
+        self.outcomes: dict[int, RuleOutcome] = {}
+
+        self.previous: dict[int, RuleOutcome] | None = None
+        self.changed_keys: set[str] = set()
+        self.affected_rules: set[int] = set()
+
+        snapshot = cache.get(cache_key)
+        if (
+            isinstance(snapshot, EvaluationSnapshot)
+            and snapshot.fingerprint == graph.fingerprint
+        ):
+            self.previous = self._load_outcomes(snapshot)
+        if self.previous is not None:
+            self._mark_changed(
+                _get_changed_keys(snapshot.input_digests, self.input_digests)
+            )
+
+    def _load_outcomes(
+        self, snapshot: EvaluationSnapshot
+    ) -> dict[int, RuleOutcome] | None:
+        try:
+            token = self.fernet.decrypt(snapshot.outcomes, ttl=SNAPSHOT_CACHE_TIMEOUT)
+        except InvalidToken:
+            # encrypted with the secret of another (or an expired) session
+            logger.debug("Discarding invalid evaluation snapshot %s", self.cache_key)
+            return None
+        # the token is authenticated, so it was produced by :meth:`save`
+        return pickle.loads(token)
+
+    def _mark_changed(self, keys: set[str]) -> None:
+        new_keys = keys - self.changed_keys
+        if not new_keys:
+            return
+        self.changed_keys |= new_keys
+        self.affected_rules |= self.graph.get_dependent_rules(new_keys)
+
+    def get_previous_outcome(self, rule: FormLogic) -> RuleOutcome | None:
+        """
+        Return the outcome of the previous evaluation if it is still valid.
+
+        ``None`` is returned if the rule must be evaluated again.
+        """
+        if self.previous is None:
+            return None
+        if self.graph.is_volatile(rule) or rule.pk in self.affected_rules:
+            return None
+        outcome = self.previous.get(rule.pk)
+        if outcome is not None:
+            self.outcomes[rule.pk] = outcome
+        return outcome
+
+    def record_outcome(self, rule: FormLogic, outcome: RuleOutcome) -> None:
+        self.outcomes[rule.pk] = outcome
+        if self.previous is None:
+            return
+        previous_outcome = self.previous.get(rule.pk, RuleOutcome(False))
+        # any variable set differently than before affects the rules reading it
+        self._mark_changed(
+            _get_changed_keys(previous_outcome.mutations, outcome.mutations)
+        )
+
+    def save(self) -> None:
+        snapshot = EvaluationSnapshot(
+            fingerprint=self.graph.fingerprint,
+            input_digests=self.input_digests,
+            outcomes=self.fernet.encrypt(pickle.dumps(self.outcomes)),
+        )
+        cache.set(self.cache_key, snapshot, timeout=SNAPSHOT_CACHE_TIMEOUT)
@@ -1,13 +1,22 @@
 from typing import Iterable, Iterator
 
+from django.conf import settings
+
 import elasticapm
-from json_logic import jsonLogic
 
 from openforms.forms.models import FormLogic, FormStep
 
 from ..models import Submission, SubmissionStep
 from .actions import ActionOperation
+from .compilation import evaluate_expression
+from .concurrency import ConcurrentActionEvaluator
 from .datastructures import DataContainer
+from .dependencies import (
+    DependencyGraph,
+    get_rule_dependencies,
+    get_trigger_dependencies,
+)
+from .incremental import IncrementalEvaluation, RuleOutcome
 from .log_utils import log_errors
 
 
@@ -106,10 +115,18 @@ def get_current_step(submission: Submission) -> SubmissionStep | None:
     return step
 
 
+def get_incremental_evaluation_cache_key(
+    submission: Submission, step: SubmissionStep
+) -> str:
+    return f"submission-logic-evaluation:{submission.uuid}:{step.form_step.uuid}"
+
+
 def iter_evaluate_rules(
     rules: Iterable[FormLogic],
     data_container: DataContainer,
     submission: Submission,
+    incremental_cache_key: str = "",
+    incremental_secret: str = "",
 ) -> Iterator[ActionOperation]:
     """
     Iterate over the rules and evaluate the trigger, yielding action operations.
@@ -119,33 +136,131 @@ def iter_evaluate_rules(
     action operator that updates a variable is processed immediately. The caller is
     responsible for processing (all other) actions accordingly.
 
+    Actions that call external services (fetching a variable value from a service,
+    evaluating a DMN decision) are evaluated concurrently when they do not depend on
+    each other, see :mod:`openforms.submissions.logic.concurrency`. The operations
+    are still yielded in rule order.
+
     :arg rules: An iterable of form logic rules to evaluate.
     :arg data_container: The :class:`DataContainer` instance wrapping the
       submission/step data and everything contained within. Note that the internal state
       can and should be mutated while processing the action operations (e.g. when updating
       variable values).
-    :arg on_rule_check: Optional callable taking a :class:`EvaluatedRule` instance as
-      sole argument. Useful to gather metadata about rule evaluation.
+    :arg submission: The submission instance the rules are evaluated for.
+    :arg incremental_cache_key: Optional cache key to enable incremental evaluation.
+      The outcome of each rule is recorded under this key, and on subsequent calls
+      only the rules affected by changes in the data are evaluated again. See
+      :mod:`openforms.submissions.logic.incremental`.
+    :arg incremental_secret: The secret protecting the recorded outcomes, required for
+      incremental evaluation.
     :returns: An iterator yielding :class:`ActionOperation` instances.
     """
+    incremental = None
+    if incremental_cache_key and incremental_secret:
+        rules = list(rules)
+        incremental = IncrementalEvaluation(
+            incremental_cache_key,
+            secret=incremental_secret,
+            graph=DependencyGraph.from_rules(rules),
+            data_container=data_container,
+        )
+
+    concurrent = ConcurrentActionEvaluator(
+        submission, max_workers=settings.LOGIC_MAX_CONCURRENT_ACTIONS
+    )
+    # operations of the rules following a deferred rule, yielded once the deferred
+    # rules are evaluated to preserve the order
+    buffered_operations: list[ActionOperation] = []
+
+    def _evaluate_deferred() -> Iterator[ActionOperation]:
+        for deferred in concurrent.evaluate():
+            rule_mutations = {}
+            for mutations in deferred.results:
+                if mutations:
+                    data_container.update(mutations)
+                    rule_mutations.update(mutations)
+            if incremental:
+                incremental.record_outcome(
+                    deferred.rule, RuleOutcome(triggered=True, mutations=rule_mutations)
+                )
+        yield from buffered_operations
+        buffered_operations.clear()
+
+    def _emit(operations: Iterable[ActionOperation]) -> Iterator[ActionOperation]:
+        if concurrent.pending:
+            buffered_operations.extend(operations)
+        else:
+            yield from operations
+
     for rule in rules:
         with elasticapm.capture_span(
             "evaluate_rule",
             span_type="app.submissions.logic",
             labels={"ruleId": rule.pk},
         ):
+            trigger_dependencies = get_trigger_dependencies(rule)
+            if concurrent.conflicts(
+                None if trigger_dependencies.volatile else trigger_dependencies.inputs
+            ):
+                yield from _evaluate_deferred()
+
+            rule_dependencies = get_rule_dependencies(rule)
+            # volatile rules are always evaluated, the conflicts are checked later
+            if not rule_dependencies.volatile and concurrent.conflicts(
+                rule_dependencies.inputs, outputs=rule_dependencies.outputs
+            ):
+                yield from _evaluate_deferred()
+
+            if incremental and (outcome := incremental.get_previous_outcome(rule)):
+                if not outcome.triggered:
+                    continue
+                if outcome.mutations:
+                    data_container.update(outcome.mutations)
+                # variable mutations are already applied, the other operations are
+                # applied by the caller
+                yield from _emit(rule.action_operations)
+                continue
+
             triggered = False
             with log_errors(rule.json_logic_trigger, rule):
                 triggered = bool(
-                    jsonLogic(rule.json_logic_trigger, data_container.data)
+                    evaluate_expression(
+                        rule, rule.json_logic_trigger, data_container.data
+                    )
                 )
 
             if not triggered:
+                if incremental:
+                    incremental.record_outcome(rule, RuleOutcome(triggered=False))
+                continue
+
+            operations = list(rule.action_operations)
+            if deferred := concurrent.prepare(rule, operations):
+                # the actions must see the results of the pending actions they read
+                if concurrent.conflicts(deferred.inputs):
+                    yield from _evaluate_deferred()
+                concurrent.defer(deferred, context=data_container.snapshot())
+                buffered_operations.extend(operations)
                 continue
 
-            for operation in rule.action_operations:
+            if rule_dependencies.volatile and concurrent.conflicts(None):
+                yield from _evaluate_deferred()
+
+            rule_mutations = {}
+            for operation in operations:
                 if mutations := operation.eval(
                     data_container.data, submission=submission
                 ):
                     data_container.update(mutations)
-                yield operation
+                    rule_mutations.update(mutations)
+            yield from _emit(operations)
+
+            if incremental:
+                incremental.record_outcome(
+                    rule, RuleOutcome(triggered=True, mutations=rule_mutations)
+                )
+
+    yield from _evaluate_deferred()
+
+    if incremental:
+        incremental.save()
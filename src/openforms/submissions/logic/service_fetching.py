@@ -1,7 +1,8 @@
 import json
 from dataclasses import dataclass
+from functools import lru_cache
 
-from django.core.cache import cache
+from django.conf import settings
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
 import jq
@@ -10,8 +11,11 @@ from zgw_consumers.client import build_client
 
 from openforms.forms.models import FormVariable
 from openforms.typing import DataMapping, JSONObject, JSONValue
+from openforms.utils.json_logic.compiler import CompiledExpression, compile_expression
 from openforms.variables.models import DataMappingTypes, ServiceFetchConfiguration
 
+from .caching import get_cache_key, get_or_set
+
 
 @dataclass
 class FetchResult:
@@ -23,6 +27,39 @@ class FetchResult:
     # response_headers: JSONObject
 
 
+@lru_cache(maxsize=256)
+def _compile_jq(expression: str) -> jq._Program:
+    return jq.compile(expression)
+
+
+@lru_cache(maxsize=256)
+def _compile_json_logic(marker: str) -> CompiledExpression:
+    # the marker is the canonical serialization of the expression
+    return compile_expression(json.loads(marker))
+
+
+def apply_data_mapping(
+    fetch_config: ServiceFetchConfiguration, raw_value: JSONValue
+) -> JSONValue:
+    """
+    Transform the raw response data with the mapping expression of the configuration.
+
+    The mapping expressions are compiled once per process and reused, as compiling
+    them can be (a lot) more expensive than applying them.
+    """
+    match fetch_config.data_mapping_type, fetch_config.mapping_expression:
+        case DataMappingTypes.jq, expression:
+            # XXX raise warning if len(result) > 1 ?
+            return _compile_jq(expression).input(raw_value).first()
+        case DataMappingTypes.json_logic, expression:
+            if not settings.LOGIC_COMPILE_EXPRESSIONS:
+                return jsonLogic(expression, raw_value)
+            marker = json.dumps(expression, sort_keys=True)
+            return _compile_json_logic(marker)(raw_value)
+        case _:
+            return raw_value
+
+
 def perform_service_fetch(
     var: FormVariable, context: DataMapping, submission_uuid: str = ""
 ) -> FetchResult:
@@ -36,8 +73,8 @@ def perform_service_fetch(
     The result is presented as a form variable value for a given submission
     instance.
 
-    The value returned by the request is cached using the submission UUID and the
-    arguments to the request (hashed to make a cache key).
+    The value returned by the request is cached using the submission UUID, the
+    fetch configuration and the arguments to the request (hashed to make a cache key).
     """
 
     if not var.service_fetch_configuration:
@@ -59,25 +96,23 @@ def perform_service_fetch(
     if not submission_uuid:
         raw_value = _do_fetch()
     else:
-        cache_key = hash(submission_uuid + json.dumps(request_args, sort_keys=True))
+        cache_key = get_cache_key(
+            "service-fetch",
+            submission_uuid=submission_uuid,
+            config_id=str(fetch_config.pk),
+            arguments=request_args,
+        )
         timeout = (
             _timeout
             if (_timeout := fetch_config.cache_timeout) is not None
             else DEFAULT_TIMEOUT
         )
-        raw_value = cache.get_or_set(cache_key, default=_do_fetch, timeout=timeout)
-
-    match fetch_config.data_mapping_type, fetch_config.mapping_expression:
-        case DataMappingTypes.jq, expression:
-            # XXX raise warning if len(result) > 1 ?
-            value = jq.compile(expression).input(raw_value).first()
-        case DataMappingTypes.json_logic, expression:
-            value = jsonLogic(expression, raw_value)
-        case _:
-            value = raw_value
+        raw_value = get_or_set(
+            "service-fetch", cache_key, default=_do_fetch, timeout=timeout
+        )
 
     return FetchResult(
-        value=value,
+        value=apply_data_mapping(fetch_config, raw_value),
         request_parameters=request_args,
         response_json=raw_value,
     )
@@ -0,0 +1,88 @@
+"""
+Micro-benchmark of the logic rule trigger evaluation.
+
+Compares the JSON logic interpreter with the compiled expressions for the logic rules
+of the form of a given submission, using the submission data as input.
+"""
+
+import timeit
+
+from django.core.management import BaseCommand
+
+from json_logic import jsonLogic
+from tabulate import tabulate
+
+from openforms.utils.json_logic.compiler import compile_expression
+
+from ...logic.datastructures import DataContainer
+from ...models import Submission
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the evaluation of the logic rule triggers of a submission's form, "
+        "comparing the JSON logic interpreter with the compiled expressions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "submission_id",
+            type=int,
+            help="ID of the submission providing the form and the data.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=1000,
+            help="Number of evaluations of the full set of rules. Defaults to 1000.",
+        )
+
+    def handle(self, **options):
+        submission = Submission.objects.select_related("form").get(
+            pk=options["submission_id"]
+        )
+        iterations = options["iterations"]
+
+        state = submission.load_submission_value_variables_state()
+        data = DataContainer(state=state).data
+        triggers = [
+            rule.json_logic_trigger for rule in submission.form.formlogic_set.all()
+        ]
+
+        compile_time = timeit.timeit(
+            lambda: [compile_expression(trigger) for trigger in triggers], number=1
+        )
+        compiled = [compile_expression(trigger) for trigger in triggers]
+
+        def _interpret():
+            for trigger in triggers:
+                jsonLogic(trigger, data)
+
+        def _compiled():
+            for func in compiled:
+                func(data)
+
+        interpreted_time = timeit.timeit(_interpret, number=iterations)
+        compiled_time = timeit.timeit(_compiled, number=iterations)
+
+        self.stdout.write(
+            f"Evaluated {len(triggers)} rule triggers {iterations} times.\n"
+        )
+        self.stdout.write(
+            tabulate(
+                [
+                    ["compilation (once)", f"{compile_time * 1000:.3f}"],
+                    ["interpreter", f"{interpreted_time * 1000 / iterations:.3f}"],
+                    ["compiled", f"{compiled_time * 1000 / iterations:.3f}"],
+                    [
+                        "speedup",
+                        (
+                            f"{interpreted_time / compiled_time:.2f}x"
+                            if compiled_time
+                            else "-"
+                        ),
+                    ],
+                ],
+                headers=["", "ms per pass"],
+            )
+        )
@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import uuid
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Mapping
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
 
 from django.conf import settings
 from django.db import models, transaction
@@ -527,15 +527,32 @@ class Submission(models.Model):
         # ⚡️ no select_related/prefetch ON PURPOSE - while processing the form steps,
         # we're doing this in python as we have the objects already from the query
         # above.
-        _submission_steps = self.submissionstep_set.all()
-        submission_steps = {}
-        for step in _submission_steps:
+        state = self.build_execution_state(
+            form_steps, submission_steps=self.submissionstep_set.all()
+        )
+        self._execution_state = state
+        return state
+
+    def build_execution_state(
+        self,
+        form_steps: list[FormStep],
+        submission_steps: Iterable[SubmissionStep],
+    ) -> SubmissionState:
+        """
+        Combine the (ordered) form steps and the persisted submission steps into the
+        execution state.
+
+        The form step instances are taken over by the state, they must not be shared
+        with other submissions.
+        """
+        steps_by_form_step: dict[int, SubmissionStep] = {}
+        for step in submission_steps:
             # non-empty value implies that the form_step FK was (cascade) deleted
             if step.form_step_history:
                 # deleted formstep FKs are loaded from history
                 if step.form_step not in form_steps:
                     form_steps.append(step.form_step)
-            submission_steps[step.form_step_id] = step
+            steps_by_form_step[step.form_step_id] = step
 
         # sort the steps again in case steps from history were inserted
         form_steps = sorted(form_steps, key=lambda s: s.order)
@@ -544,8 +561,8 @@ class Submission(models.Model):
         # in the database yet - this is on purpose!
         steps: list[SubmissionStep] = []
         for form_step in form_steps:
-            if form_step.id in submission_steps:
-                step = submission_steps[form_step.id]
+            if form_step.id in steps_by_form_step:
+                step = steps_by_form_step[form_step.id]
                 # replace the python objects to avoid extra queries and/or joins in the
                 # submission step query.
                 step.form_step = form_step
@@ -556,12 +573,10 @@ class Submission(models.Model):
                 step = SubmissionStep(uuid=None, submission=self, form_step=form_step)
             steps.append(step)
 
-        state = SubmissionState(
+        return SubmissionState(
             form_steps=form_steps,
             submission_steps=steps,
         )
-        self._execution_state = state
-        return state
 
     def clear_execution_state(self) -> None:
         if not hasattr(self, "_execution_state"):
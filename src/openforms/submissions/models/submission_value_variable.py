@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date, datetime, time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable
 
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
@@ -101,7 +101,24 @@ class SubmissionValueVariablesState:
             if variable.key in keys_in_step
         }
 
-    def collect_variables(self) -> dict[str, SubmissionValueVariable]:
+    def collect_variables(
+        self,
+        form_variables: Iterable[FormVariable] | None = None,
+        submission_variables: Iterable[SubmissionValueVariable] | None = None,
+    ) -> dict[str, SubmissionValueVariable]:
+        """
+        Combine the form variables and the persisted submission variables.
+
+        :arg form_variables: The variables of the submission form, queried if not
+          provided.
+        :arg submission_variables: The persisted variables of the submission, queried
+          if not provided.
+        """
+        if form_variables is None:
+            form_variables = self.submission.form.formvariable_set.all()
+        if submission_variables is None:
+            submission_variables = self.submission.submissionvaluevariable_set.all()
+
         # leverage the (already populated) submission state to get access to form
         # steps and form definitions
         submission_state = self.submission.load_execution_state()
@@ -112,8 +129,7 @@ class SubmissionValueVariablesState:
 
         # Build a collection of all form variables
         all_form_variables = {
-            form_variable.key: form_variable
-            for form_variable in self.submission.form.formvariable_set.all()
+            form_variable.key: form_variable for form_variable in form_variables
         }
         # optimize the access from form_variable.form_definition using the already
         # existing map, saving a `select_related` call on data we (probably) already
@@ -127,7 +143,7 @@ class SubmissionValueVariablesState:
         # calls since we already have the relevant data
         all_submission_variables = {
             submission_value_variables.key: submission_value_variables
-            for submission_value_variables in self.submission.submissionvaluevariable_set.all()
+            for submission_value_variables in submission_variables
         }
         # do the join by `key`, which is unique across the form
         for variable_key, submission_value_variable in all_submission_variables.items():
@@ -184,7 +200,7 @@ class SubmissionValueVariablesState:
 
         SubmissionValueVariable.objects.bulk_create(variables_to_prefill)
 
-    def set_values(self, data: DataMapping) -> None:
+    def set_values(self, data: DataMapping) -> list[str]:
         """
         Apply the values from ``data`` to the current state of the variables.
 
@@ -193,16 +209,20 @@ class SubmissionValueVariablesState:
         variables in the state.
 
         :arg data: mapping of variable key to value.
+        :returns: the keys of the variables that received a value.
 
         .. todo:: apply variable.datatype/format to obtain python objects? This also
            needs to properly serialize back to JSON though!
         """
         formio_data = FormioData(data)
+        updated_keys = []
         for key, variable in self.variables.items():
             new_value = formio_data.get(key, default=empty)
             if new_value is empty:
                 continue
             variable.value = new_value
+            updated_keys.append(key)
+        return updated_keys
 
 
 class SubmissionValueVariableManager(models.Manager):
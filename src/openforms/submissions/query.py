@@ -59,6 +59,52 @@ class SubmissionQuerySet(models.QuerySet["Submission"]):
 
         return annotation
 
+    @transaction.atomic
+    def remove_sensitive_data(self) -> int:
+        """
+        Remove the sensitive data of all the submissions in the queryset.
+
+        This is the set-based equivalent of
+        :meth:`openforms.submissions.models.Submission.remove_sensitive_data`, using
+        a fixed number of queries rather than a couple of queries per submission.
+
+        :returns: The number of submissions that were cleaned.
+        """
+        from openforms.authentication.models import AuthInfo
+
+        from .constants import SubmissionValueVariableSources
+        from .models import SubmissionFileAttachment, SubmissionValueVariable
+
+        submission_ids = list(self.values_list("pk", flat=True))
+        if not submission_ids:
+            return 0
+
+        AuthInfo.objects.filter(submission__in=submission_ids).update(value="")
+
+        SubmissionValueVariable.objects.filter(
+            submission__in=submission_ids,
+            form_variable__is_sensitive_data=True,
+        ).update(value="", source=SubmissionValueVariableSources.sensitive_data_cleaner)
+
+        SubmissionFileAttachment.objects.filter(
+            submission_step__submission__in=submission_ids,
+            submission_variable__form_variable__is_sensitive_data=True,
+        ).delete()
+
+        # We do keep the representation, as that is used in PDF and confirmation e-mail
+        # generation and is usually a label derived from the source fields.
+        co_signed = list(
+            self.model.objects.filter(pk__in=submission_ids)
+            .exclude(co_sign_data={})
+            .exclude(co_sign_data__isnull=True)
+            .only("pk", "co_sign_data")
+        )
+        for submission in co_signed:
+            submission.co_sign_data.update({"identifier": "", "fields": {}})
+        self.model.objects.bulk_update(co_signed, fields=["co_sign_data"])
+
+        return self.model.objects.filter(pk__in=submission_ids).update(_is_cleaned=True)
+
 
 class SubmissionManager(models.Manager.from_queryset(SubmissionQuerySet)):
     @transaction.atomic
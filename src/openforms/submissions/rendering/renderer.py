@@ -14,11 +14,11 @@ from typing import Iterator
 from openforms.forms.models import Form
 from openforms.variables.rendering.nodes import VariablesNode
 
-from ..form_logic import evaluate_form_logic
 from ..models import Submission
 from .base import Node
 from .constants import RenderModes
 from .nodes import FormNode, SubmissionStepNode
+from .tree import get_resolved_render_tree
 from .utils import get_request
 
 
@@ -69,19 +69,9 @@ class Renderer:
         """
         Produce only the direct child nodes.
         """
-        submission_data = self.submission.data
+        # the form logic is evaluated once per submission and shared by all renderers
+        get_resolved_render_tree(self.submission, request=self.dummy_request)
         for step in self.steps:
-            new_configuration = evaluate_form_logic(
-                submission=self.submission,
-                step=step,
-                data=submission_data,
-                dirty=False,
-                request=self.dummy_request,
-            )
-            # update the configuration for introspection - note that we are mutating
-            # an instance here without persisting it to the backend on purpose!
-            # this replicates the run-time behaviour while filling out the form
-            step.form_step.form_definition.configuration = new_configuration
             submission_step_node = SubmissionStepNode(renderer=self, step=step)
             if not submission_step_node.is_visible:
                 continue
@@ -0,0 +1,108 @@
+"""
+Resolved render tree of a submission.
+
+Rendering a submission requires the form logic to be evaluated for every step, which
+determines the applicable steps and the dynamic configuration of the components.
+After completion, the same submission is rendered for the PDF report, the confirmation
+and registration emails and the exports, typically in separate (Celery) processes.
+
+The outcome of the logic evaluation is captured in a :class:`ResolvedRenderTree`. It
+is memoised on the submission instance, so that all the renderers of that instance
+share a single evaluation.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.http import HttpRequest
+
+from openforms.typing import DataMapping, JSONObject
+
+from ..form_logic import evaluate_form_logic
+from ..models import Submission, SubmissionStep
+from ..models.submission_step import DirtyData
+
+
+@dataclass(frozen=True)
+class ResolvedStep:
+    form_step_uuid: str
+    is_applicable: bool
+    configuration: JSONObject
+    data: DataMapping
+
+
+@dataclass(frozen=True)
+class ResolvedRenderTree:
+    steps: tuple[ResolvedStep, ...]
+
+    def apply(self, submission_steps: list[SubmissionStep]) -> bool:
+        """
+        Set the evaluated configuration and applicability on the submission steps.
+
+        :returns: ``False`` if the tree does not match the submission steps.
+        """
+        if len(submission_steps) != len(self.steps):
+            return False
+        if any(
+            str(step.form_step.uuid) != resolved.form_step_uuid
+            for step, resolved in zip(submission_steps, self.steps)
+        ):
+            return False
+
+        for step, resolved in zip(submission_steps, self.steps):
+            step.form_step.form_definition.configuration = resolved.configuration
+            step.is_applicable = resolved.is_applicable
+            step.data = DirtyData(resolved.data)
+            step._form_logic_evaluated = True
+        return True
+
+
+def _evaluate(
+    submission: Submission, steps: list[SubmissionStep], request: HttpRequest | None
+) -> ResolvedRenderTree:
+    submission_data = submission.data
+    resolved_steps = []
+    for step in steps:
+        new_configuration = evaluate_form_logic(
+            submission=submission,
+            step=step,
+            data=submission_data,
+            dirty=False,
+            request=request,
+        )
+        # update the configuration for introspection - note that we are mutating
+        # an instance here without persisting it to the backend on purpose!
+        # this replicates the run-time behaviour while filling out the form
+        step.form_step.form_definition.configuration = new_configuration
+        # record the applicability right after evaluating the step - the logic of
+        # subsequent steps does not affect the steps rendered before them
+        resolved_steps.append(
+            ResolvedStep(
+                form_step_uuid=str(step.form_step.uuid),
+                is_applicable=step.is_applicable,
+                configuration=new_configuration,
+                data=dict(step._unsaved_data or {}),
+            )
+        )
+    return ResolvedRenderTree(steps=tuple(resolved_steps))
+
+
+def get_resolved_render_tree(
+    submission: Submission, request: HttpRequest | None = None
+) -> ResolvedRenderTree:
+    """
+    Evaluate the form logic of all the submission steps once and apply the outcome.
+
+    The result is memoised on the submission (for the current execution state).
+    """
+    steps = submission.load_execution_state().submission_steps
+
+    memo = getattr(submission, "_resolved_render_tree", None)
+    if memo is not None and memo[0] is steps and memo[1].apply(steps):
+        return memo[1]
+
+    tree = _evaluate(submission, steps, request=request)
+    tree.apply(steps)
+    submission._resolved_render_tree = (steps, tree)
+    return tree
@@ -12,7 +12,11 @@ from openforms.submissions.models import (
     SubmissionFileAttachment,
     SubmissionReport,
 )
-from openforms.utils.files import _delete_obj_files, get_file_field_names
+from openforms.utils.files import (
+    _delete_obj_files,
+    defer_file_delete,
+    get_file_field_names,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +80,9 @@ def delete_obj_files(
 def delete_submission_report_files(
     sender: type[SubmissionReport], instance: SubmissionReport, **kwargs
 ) -> None:
+    if defer_file_delete(instance.content):
+        return
+
     logger.debug("Deleting file %r", instance.content.name)
 
     instance.content.delete(save=False)
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...logic.compilation import evaluate_expression, get_compiled_expression
+
+
+class CompiledExpressionCacheTests(SimpleTestCase):
+    def test_compiled_expression_is_cached(self):
+        rule = FormLogicFactory.build(pk=1, json_logic_trigger={"var": "a"})
+
+        compiled1 = get_compiled_expression(rule, rule.json_logic_trigger)
+        compiled2 = get_compiled_expression(rule, {"var": "a"})
+
+        self.assertIs(compiled1, compiled2)
+
+    def test_modified_expression_is_recompiled(self):
+        rule = FormLogicFactory.build(pk=1, json_logic_trigger={"var": "a"})
+        compiled1 = get_compiled_expression(rule, rule.json_logic_trigger)
+
+        rule.json_logic_trigger = {"var": "b"}
+        compiled2 = get_compiled_expression(rule, rule.json_logic_trigger)
+
+        self.assertIsNot(compiled1, compiled2)
+        self.assertEqual(compiled2({"a": 1, "b": 2}), 2)
+
+    @override_settings(LOGIC_COMPILE_EXPRESSIONS=True)
+    def test_evaluate_compiled(self):
+        rule = FormLogicFactory.build(pk=1)
+
+        with patch("openforms.submissions.logic.compilation.jsonLogic") as mock:
+            result = evaluate_expression(rule, {"+": [{"var": "a"}, 1]}, {"a": 1})
+
+        self.assertEqual(result, 2)
+        mock.assert_not_called()
+
+    @override_settings(LOGIC_COMPILE_EXPRESSIONS=False)
+    def test_evaluate_interpreted(self):
+        rule = FormLogicFactory.build(pk=1)
+
+        with patch(
+            "openforms.submissions.logic.compilation.compile_expression"
+        ) as mock:
+            result = evaluate_expression(rule, {"+": [{"var": "a"}, 1]}, {"a": 1})
+
+        self.assertEqual(result, 2)
+        mock.assert_not_called()
@@ -0,0 +1,250 @@
+import threading
+from unittest.mock import Mock, patch
+
+from django.test import TestCase, override_settings
+
+from django_camunda.models import CamundaConfig
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormVariableFactory,
+)
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...logic.actions import EvaluateDMNAction, VariableAction
+from ...logic.datastructures import DataContainer
+from ...logic.rules import iter_evaluate_rules
+from ..factories import SubmissionFactory
+
+
+def _dmn_action(decision: str, input_variable: str, output_variable: str) -> dict:
+    return {
+        "action": {
+            "type": LogicActionTypes.evaluate_dmn,
+            "config": {
+                "plugin_id": "camunda7",
+                "decision_definition_id": decision,
+                "decision_definition_version": "1",
+                "input_mapping": [
+                    {"form_variable": input_variable, "dmn_variable": "input"}
+                ],
+                "output_mapping": [
+                    {"form_variable": output_variable, "dmn_variable": "output"}
+                ],
+            },
+        },
+    }
+
+
+def _get_dmn_evaluator(evaluate_dmn):
+    def get_dmn_evaluator(plugin_id, definition_id, *, version=""):
+        return lambda input_values: evaluate_dmn(
+            definition_id=definition_id,
+            version=version,
+            input_values=input_values,
+            plugin_id=plugin_id,
+        )
+
+    return get_dmn_evaluator
+
+
+@override_settings(LOGIC_MAX_CONCURRENT_ACTIONS=4)
+class ConcurrentActionsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create()
+        for key in ("a", "b", "c", "d"):
+            FormVariableFactory.create(
+                form=cls.form,
+                key=key,
+                source=FormVariableSources.user_defined,
+                data_type=FormVariableDataTypes.int,
+                initial_value=0,
+            )
+
+    def _evaluate(self, rules) -> tuple[DataContainer, list]:
+        submission = SubmissionFactory.create(form=self.form)
+        data_container = DataContainer(
+            state=submission.load_submission_value_variables_state()
+        )
+        data_container.update({"a": 1})
+        operations = list(
+            iter_evaluate_rules(rules, data_container, submission=submission)
+        )
+        return data_container, operations
+
+    def test_independent_actions_are_evaluated_concurrently(self):
+        # both evaluations must be in progress at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        main_thread = threading.get_ident()
+        threads = set()
+
+        def evaluate_dmn(definition_id, version, input_values, plugin_id):
+            threads.add(threading.get_ident())
+            barrier.wait()
+            offset = 10 if definition_id == "first" else 20
+            return {"output": input_values["input"] + offset}
+
+        rules = [
+            FormLogicFactory.create(
+                form=self.form,
+                order=0,
+                json_logic_trigger=True,
+                actions=[_dmn_action("first", "a", "b")],
+            ),
+            FormLogicFactory.create(
+                form=self.form,
+                order=1,
+                json_logic_trigger=True,
+                actions=[_dmn_action("second", "a", "c")],
+            ),
+            FormLogicFactory.create(
+                form=self.form,
+                order=2,
+                json_logic_trigger=True,
+                actions=[
+                    {
+                        "variable": "d",
+                        "action": {
+                            "type": LogicActionTypes.variable,
+                            "value": {"+": [{"var": "b"}, {"var": "c"}]},
+                        },
+                    }
+                ],
+            ),
+        ]
+
+        with patch(
+            "openforms.submissions.logic.actions.get_dmn_evaluator",
+            side_effect=_get_dmn_evaluator(evaluate_dmn),
+        ):
+            data_container, operations = self._evaluate(rules)
+
+        self.assertEqual(len(threads), 2)
+        self.assertNotIn(main_thread, threads)
+        self.assertEqual(data_container.data["b"], 11)
+        self.assertEqual(data_container.data["c"], 21)
+        # the dependent rule is evaluated after the results of the DMN evaluations
+        self.assertEqual(data_container.data["d"], 32)
+        # the operations are yielded in rule order
+        self.assertEqual(
+            [type(operation) for operation in operations],
+            [EvaluateDMNAction, EvaluateDMNAction, VariableAction],
+        )
+        self.assertEqual(
+            [operation.rule for operation in operations],
+            rules,
+        )
+
+    def test_dependent_actions_are_evaluated_in_order(self):
+        def evaluate_dmn(definition_id, version, input_values, plugin_id):
+            return {"output": input_values["input"] * 10}
+
+        rules = [
+            FormLogicFactory.create(
+                form=self.form,
+                order=0,
+                json_logic_trigger=True,
+                actions=[_dmn_action("first", "a", "b")],
+            ),
+            FormLogicFactory.create(
+                form=self.form,
+                order=1,
+                json_logic_trigger=True,
+                actions=[_dmn_action("second", "b", "c")],
+            ),
+            # the trigger reads the output of the previous action
+            FormLogicFactory.create(
+                form=self.form,
+                order=2,
+                json_logic_trigger={"==": [{"var": "c"}, 100]},
+                actions=[_dmn_action("third", "a", "d")],
+            ),
+        ]
+
+        mock_evaluate_dmn = Mock(side_effect=evaluate_dmn)
+        with patch(
+            "openforms.submissions.logic.actions.get_dmn_evaluator",
+            side_effect=_get_dmn_evaluator(mock_evaluate_dmn),
+        ):
+            data_container, _ = self._evaluate(rules)
+
+        self.assertEqual(mock_evaluate_dmn.call_count, 3)
+        self.assertEqual(data_container.data["b"], 10)
+        self.assertEqual(data_container.data["c"], 100)
+        self.assertEqual(data_container.data["d"], 10)
+
+    @override_settings(LOGIC_MAX_CONCURRENT_ACTIONS=1)
+    def test_concurrency_disabled(self):
+        main_thread = threading.get_ident()
+        threads = set()
+
+        def evaluate_dmn(definition_id, version, input_values, plugin_id):
+            threads.add(threading.get_ident())
+            return {"output": 1}
+
+        rules = [
+            FormLogicFactory.create(
+                form=self.form,
+                order=index,
+                json_logic_trigger=True,
+                actions=[_dmn_action(f"decision-{index}", "a", output)],
+            )
+            for index, output in enumerate("bc")
+        ]
+
+        with patch(
+            "openforms.submissions.logic.actions.get_dmn_evaluator",
+            side_effect=_get_dmn_evaluator(evaluate_dmn),
+        ):
+            self._evaluate(rules)
+
+        self.assertEqual(threads, {main_thread})
+
+    def test_plugin_configuration_is_loaded_in_calling_thread(self):
+        barrier = threading.Barrier(2, timeout=5)
+        main_thread = threading.get_ident()
+        config_threads = set()
+        evaluate_threads = set()
+
+        def get_solo():
+            config_threads.add(threading.get_ident())
+            return CamundaConfig(rest_api_path="engine-rest/")
+
+        def evaluate_dmn(dmn_key, dmn_id, input_values, client):
+            evaluate_threads.add(threading.get_ident())
+            barrier.wait()
+            return {"output": 1}
+
+        rules = [
+            FormLogicFactory.create(
+                form=self.form,
+                order=index,
+                json_logic_trigger=True,
+                actions=[_dmn_action(f"decision-{index}", "a", output)],
+            )
+            for index, output in enumerate("bc")
+        ]
+
+        with (
+            patch.object(CamundaConfig, "get_solo", side_effect=get_solo),
+            patch(
+                "openforms.dmn.contrib.camunda.plugin._get_decision_definition_id",
+                return_value="some-id",
+            ),
+            patch(
+                "openforms.dmn.contrib.camunda.plugin.evaluate_dmn",
+                side_effect=evaluate_dmn,
+            ),
+        ):
+            data_container, _ = self._evaluate(rules)
+
+        self.assertEqual(config_threads, {main_thread})
+        self.assertEqual(len(evaluate_threads), 2)
+        self.assertNotIn(main_thread, evaluate_threads)
+        self.assertEqual(data_container.data["b"], 1)
+        self.assertEqual(data_container.data["c"], 1)
@@ -0,0 +1,71 @@
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormFactory, FormVariableFactory
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...logic.datastructures import DataContainer
+from ..factories import SubmissionFactory
+
+
+class DataContainerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.form = FormFactory.create()
+        for key, data_type, initial_value in (
+            ("a", FormVariableDataTypes.int, 1),
+            ("b", FormVariableDataTypes.object, {"c": 2}),
+            ("d.e", FormVariableDataTypes.string, "foo"),
+            ("d.f", FormVariableDataTypes.string, "bar"),
+        ):
+            FormVariableFactory.create(
+                form=cls.form,
+                key=key,
+                source=FormVariableSources.user_defined,
+                data_type=data_type,
+                initial_value=initial_value,
+            )
+
+    def _get_container(self) -> DataContainer:
+        submission = SubmissionFactory.create(form=self.form)
+        state = submission.load_submission_value_variables_state()
+        return DataContainer(state=state)
+
+    def test_data_is_kept_up_to_date(self):
+        data_container = self._get_container()
+        data = data_container.data
+
+        data_container.update({"a": 2, "d.e": "baz"})
+
+        self.assertEqual(data_container.data["a"], 2)
+        self.assertEqual(data_container.data["d"], {"e": "baz", "f": "bar"})
+        self.assertEqual(data_container.data["b"], {"c": 2})
+        # static variables are included
+        self.assertIn("now", data_container.data)
+        # the data is not rebuilt on every access
+        self.assertIs(data_container.data, data_container.data)
+        # the previously obtained view is not modified
+        self.assertEqual(data["a"], 1)
+
+    def test_same_result_as_rebuilding(self):
+        data_container = self._get_container()
+
+        data_container.update({"a": 3, "b": {"c": 4, "g": 5}, "d": {"f": "baz"}})
+
+        rebuilt = DataContainer(state=data_container.state)
+        self.assertEqual(data_container.data, rebuilt.data)
+
+    def test_initial_data_is_not_modified(self):
+        data_container = self._get_container()
+
+        data_container.update({"a": 2})
+        data_container.update({"d.e": "baz", "d.f": "qux"})
+        snapshot = data_container.snapshot()
+        data_container.update({"d.f": "quux"})
+
+        initial_data = data_container.initial_data
+        self.assertEqual(initial_data["a"], 1)
+        self.assertEqual(initial_data["d"], {"e": "foo", "f": "bar"})
+        self.assertEqual(snapshot["d"], {"e": "baz", "f": "qux"})
+        self.assertEqual(data_container.data["d"], {"e": "baz", "f": "quux"})
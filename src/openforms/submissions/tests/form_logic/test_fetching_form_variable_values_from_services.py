@@ -1,11 +1,13 @@
 from pathlib import Path
 from typing import Any
 from unittest import skip
+from unittest.mock import patch
 from urllib.parse import unquote
 
 from django.core.exceptions import SuspiciousOperation
-from django.test import SimpleTestCase, tag
+from django.test import SimpleTestCase, override_settings, tag
 
+import jq
 import requests_mock
 from factory.django import FileField
 from furl import furl
@@ -14,12 +16,18 @@ from zgw_consumers.constants import APITypes, AuthTypes
 from zgw_consumers.test.factories import ServiceFactory
 
 from openforms.forms.tests.factories import FormVariableFactory
+from openforms.utils.json_logic.compiler import compile_expression
 from openforms.utils.tests.nlx import DisableNLXRewritingMixin
 from openforms.variables.constants import DataMappingTypes
 from openforms.variables.tests.factories import ServiceFetchConfigurationFactory
 from openforms.variables.validators import HeaderValidator, ValidationError
 
-from ...logic.service_fetching import perform_service_fetch
+from ...logic.service_fetching import (
+    _compile_jq,
+    _compile_json_logic,
+    apply_data_mapping,
+    perform_service_fetch,
+)
 
 DEFAULT_REQUEST_HEADERS = {
     "Accept",
@@ -394,6 +402,46 @@ class ServiceFetchConfigVariableBindingTests(DisableNLXRewritingMixin, SimpleTes
 
         self.assertEqual(value, "https://httpbin.org/get")
 
+    def test_compiled_jq_programs_are_reused(self):
+        _compile_jq.cache_clear()
+        fetch_config = ServiceFetchConfigurationFactory.build(
+            service=self.service,
+            data_mapping_type=DataMappingTypes.jq,
+            mapping_expression=".[1].url",
+        )
+
+        with patch("jq.compile", wraps=jq.compile) as mock_compile:
+            for index in range(3):
+                value = apply_data_mapping(
+                    fetch_config, [{"url": "foo"}, {"url": f"bar{index}"}]
+                )
+
+                self.assertEqual(value, f"bar{index}")
+
+        mock_compile.assert_called_once_with(".[1].url")
+
+    @override_settings(LOGIC_COMPILE_EXPRESSIONS=True)
+    def test_compiled_jsonlogic_expressions_are_reused(self):
+        _compile_json_logic.cache_clear()
+        fetch_config = ServiceFetchConfigurationFactory.build(
+            service=self.service,
+            data_mapping_type=DataMappingTypes.json_logic,
+            mapping_expression={"var": "1.url"},
+        )
+
+        with patch(
+            "openforms.submissions.logic.service_fetching.compile_expression",
+            wraps=compile_expression,
+        ) as mock_compile:
+            for index in range(3):
+                value = apply_data_mapping(
+                    fetch_config, [{"url": "foo"}, {"url": f"bar{index}"}]
+                )
+
+                self.assertEqual(value, f"bar{index}")
+
+        mock_compile.assert_called_once_with({"var": "1.url"})
+
     @skip("This will go into an infinite loop")
     @tag("dangerous", "gh-2744")
     @requests_mock.Mocker()
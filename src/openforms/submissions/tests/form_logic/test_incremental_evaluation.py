@@ -0,0 +1,250 @@
+import pickle
+from unittest.mock import patch
+
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from openforms.forms.tests.factories import (
+    FormFactory,
+    FormLogicFactory,
+    FormStepFactory,
+    FormVariableFactory,
+)
+from openforms.variables.constants import FormVariableDataTypes, FormVariableSources
+
+from ...form_logic import evaluate_form_logic
+from ...logic.compilation import evaluate_expression
+from ...logic.dependencies import DependencyGraph, get_rule_dependencies
+from ...logic.rules import get_incremental_evaluation_cache_key
+from ...models import SubmissionStep
+from ..factories import SubmissionFactory, SubmissionStepFactory
+
+
+class RuleDependenciesTests(SimpleTestCase):
+    def test_inputs_and_outputs(self):
+        rule = FormLogicFactory.build(
+            pk=1,
+            json_logic_trigger={">": [{"var": "a"}, {"var": "b.c"}]},
+            actions=[
+                {
+                    "variable": "d",
+                    "action": {
+                        "type": "variable",
+                        "value": {"+": [{"var": "e"}, 1]},
+                    },
+                },
+                {
+                    "action": {
+                        "type": "evaluate-dmn",
+                        "config": {
+                            "plugin_id": "camunda7",
+                            "decision_definition_id": "approve",
+                            "input_mapping": [
+                                {"form_variable": "f", "dmn_variable": "x"}
+                            ],
+                            "output_mapping": [
+                                {"form_variable": "g", "dmn_variable": "y"}
+                            ],
+                        },
+                    },
+                },
+            ],
+        )
+
+        dependencies = get_rule_dependencies(rule)
+
+        self.assertEqual(dependencies.inputs, {"a", "b.c", "e", "f"})
+        self.assertEqual(dependencies.outputs, {"d", "g"})
+        self.assertFalse(dependencies.volatile)
+
+    def test_volatile_rules(self):
+        expressions = [
+            {"var": ""},
+            {"var": {"cat": ["a", "b"]}},
+            {"==": [{"today": []}, {"var": "a"}]},
+            {"missing": ["a", "b"]},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                rule = FormLogicFactory.build(
+                    pk=1, json_logic_trigger=expression, actions=[]
+                )
+
+                self.assertTrue(get_rule_dependencies(rule).volatile)
+
+        with self.subTest("service fetch"):
+            rule = FormLogicFactory.build(
+                pk=1,
+                json_logic_trigger=True,
+                actions=[
+                    {"variable": "a", "action": {"type": "fetch-from-service"}},
+                ],
+            )
+
+            self.assertTrue(get_rule_dependencies(rule).volatile)
+
+    def test_dependent_rules_nested_keys(self):
+        rule1 = FormLogicFactory.build(pk=1, json_logic_trigger={"var": "a.b"})
+        rule2 = FormLogicFactory.build(pk=2, json_logic_trigger={"var": "c"})
+        graph = DependencyGraph.from_rules([rule1, rule2])
+
+        self.assertEqual(graph.get_dependent_rules(["a"]), {1})
+        self.assertEqual(graph.get_dependent_rules(["a.b.c"]), {1})
+        self.assertEqual(graph.get_dependent_rules(["ab"]), set())
+
+
+class IncrementalEvaluationTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(cache.clear)
+
+        self.form = FormFactory.create()
+        self.form_step = FormStepFactory.create(
+            form=self.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "number", "key": "a"},
+                    {"type": "number", "key": "b"},
+                    {"type": "textfield", "key": "c"},
+                ]
+            },
+        )
+        FormVariableFactory.create(
+            form=self.form,
+            key="double",
+            source=FormVariableSources.user_defined,
+            data_type=FormVariableDataTypes.int,
+        )
+        # rule 1 depends on a, and sets `double`
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={">": [{"var": "a"}, 0]},
+            actions=[
+                {
+                    "variable": "double",
+                    "action": {
+                        "type": "variable",
+                        "value": {"*": [{"var": "a"}, 2]},
+                    },
+                }
+            ],
+        )
+        # rule 2 depends transitively on a
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={">": [{"var": "double"}, 10]},
+            actions=[
+                {
+                    "component": "c",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+        # rule 3 depends on b only
+        self.rule3 = FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={"==": [{"var": "b"}, 1]},
+            actions=[{"action": {"type": "disable-next"}}],
+        )
+        submission = SubmissionFactory.create(form=self.form)
+        self.submission_step = SubmissionStepFactory.create(
+            submission=submission, form_step=self.form_step, data={"a": 1, "b": 1}
+        )
+        self.session = SessionStore()
+
+    def _logic_check(self, data, session=None):
+        step = SubmissionStep.objects.get(pk=self.submission_step.pk)
+        request = RequestFactory().post("/")
+        request.session = session or self.session
+        with patch(
+            "openforms.submissions.logic.rules.evaluate_expression",
+            wraps=evaluate_expression,
+        ) as mock_evaluate:
+            configuration = evaluate_form_logic(
+                step.submission, step, data, dirty=True, request=request
+            )
+        return step, configuration, mock_evaluate.call_count
+
+    def test_only_affected_rules_are_evaluated(self):
+        with self.subTest("first check evaluates everything"):
+            _, _, call_count = self._logic_check({"a": 1, "b": 1})
+
+            self.assertEqual(call_count, 3)
+
+        with self.subTest("unrelated change"):
+            step, configuration, call_count = self._logic_check({"a": 1, "b": 2})
+
+            # only rule 3 is evaluated
+            self.assertEqual(call_count, 1)
+            self.assertTrue(step.can_submit)
+            state = step.submission.load_submission_value_variables_state()
+            self.assertEqual(state.variables["double"].value, 2)
+            self.assertFalse(configuration["components"][2].get("hidden", False))
+
+        with self.subTest("transitive change"):
+            step, configuration, call_count = self._logic_check({"a": 6, "b": 2})
+
+            # rule 1 and rule 2
+            self.assertEqual(call_count, 2)
+            state = step.submission.load_submission_value_variables_state()
+            self.assertEqual(state.variables["double"].value, 12)
+            self.assertTrue(configuration["components"][2]["hidden"])
+
+        with self.subTest("nothing changed"):
+            step, configuration, call_count = self._logic_check({"a": 6, "b": 2})
+
+            self.assertEqual(call_count, 0)
+            self.assertTrue(configuration["components"][2]["hidden"])
+
+    def test_same_result_as_full_evaluation(self):
+        self._logic_check({"a": 1, "b": 1})
+        incremental_step, incremental_configuration, _ = self._logic_check(
+            {"a": 6, "b": 1}
+        )
+        cache.clear()
+
+        full_step, full_configuration, call_count = self._logic_check({"a": 6, "b": 1})
+
+        self.assertEqual(call_count, 3)
+        self.assertEqual(incremental_configuration, full_configuration)
+        self.assertEqual(incremental_step.data, full_step.data)
+        self.assertEqual(incremental_step.can_submit, full_step.can_submit)
+
+    def test_modified_rules_invalidate_previous_evaluation(self):
+        self._logic_check({"a": 1, "b": 1})
+        self.rule3.json_logic_trigger = {"==": [{"var": "b"}, 2]}
+        self.rule3.save()
+
+        step, _, call_count = self._logic_check({"a": 1, "b": 2})
+
+        self.assertEqual(call_count, 3)
+        self.assertFalse(step.can_submit)
+
+    def test_snapshot_does_not_contain_plaintext_values(self):
+        self._logic_check({"a": 6, "b": 1, "c": "Some secret text"})
+
+        cache_key = get_incremental_evaluation_cache_key(
+            self.submission_step.submission, self.submission_step
+        )
+        snapshot = pickle.dumps(cache.get(cache_key))
+        self.assertNotIn(b"Some secret text", snapshot)
+
+    def test_snapshot_not_used_by_other_sessions(self):
+        self._logic_check({"a": 1, "b": 1})
+
+        _, _, call_count = self._logic_check({"a": 1, "b": 1}, session=SessionStore())
+
+        self.assertEqual(call_count, 3)
+
+    def test_not_incremental_without_session(self):
+        step = SubmissionStep.objects.get(pk=self.submission_step.pk)
+        evaluate_form_logic(step.submission, step, {"a": 1, "b": 1}, dirty=True)
+
+        cache_key = get_incremental_evaluation_cache_key(step.submission, step)
+        self.assertIsNone(cache.get(cache_key))
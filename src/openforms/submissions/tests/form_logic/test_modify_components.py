@@ -1011,6 +1011,53 @@ class ComponentModificationTests(TestCase):
 
         self.assertNotIn("selectboxes", submission_step.data)
 
+    def test_clearing_value_hides_preceding_component(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [
+                    {
+                        "key": "textField",
+                        "type": "textfield",
+                        "conditional": {"eq": "yes", "show": True, "when": "radio2"},
+                        "clearOnHide": True,
+                    },
+                    {
+                        "key": "radio2",
+                        "type": "radio",
+                        "values": [
+                            {"label": "yes", "value": "yes"},
+                            {"label": "no", "value": "no"},
+                        ],
+                        "conditional": {"eq": "yes", "show": True, "when": "radio1"},
+                        "clearOnHide": True,
+                    },
+                    {
+                        "key": "radio1",
+                        "type": "radio",
+                        "values": [
+                            {"label": "yes", "value": "yes"},
+                            {"label": "no", "value": "no"},
+                        ],
+                    },
+                ]
+            },
+        )
+
+        submission = SubmissionFactory.create(form=form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission,
+            form_step=step,
+            data={"radio1": "no", "radio2": "yes", "textField": "Some data"},
+        )
+
+        evaluate_form_logic(submission, submission_step, submission.data, dirty=True)
+
+        # radio2 is hidden, and clearing its value hides the text field
+        self.assertEqual(submission_step.data["radio2"], "")
+        self.assertEqual(submission_step.data["textField"], "")
+
     @tag("gh-3744")
     def test_postcode_component_made_optional(self):
         form = FormFactory.create()
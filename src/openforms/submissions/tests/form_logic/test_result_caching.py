@@ -0,0 +1,98 @@
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from ...logic.caching import (
+    CACHE_KEY_VERSION,
+    get_cache_key,
+    get_cache_statistics,
+    get_or_set,
+)
+
+
+class CacheKeyTests(SimpleTestCase):
+    def test_key_is_deterministic(self):
+        key1 = get_cache_key(
+            "service-fetch",
+            submission_uuid="4c2a1c5e-5d2e-4c7c-bd26-18bb4b14d2b5",
+            config_id="1",
+            arguments={"url": "https://example.com", "params": {"a": 1, "b": 2}},
+        )
+        key2 = get_cache_key(
+            "service-fetch",
+            submission_uuid="4c2a1c5e-5d2e-4c7c-bd26-18bb4b14d2b5",
+            config_id="1",
+            arguments={"params": {"b": 2, "a": 1}, "url": "https://example.com"},
+        )
+
+        self.assertEqual(key1, key2)
+        self.assertEqual(
+            key1,
+            f"submission-logic|service-fetch|v{CACHE_KEY_VERSION}|"
+            "da3b71ac2c16082418e62f7cdb22fb297d48da2d7498c7c81326dec556682624",
+        )
+
+    def test_key_depends_on_all_parts(self):
+        base = {
+            "namespace": "dmn",
+            "submission_uuid": "4c2a1c5e-5d2e-4c7c-bd26-18bb4b14d2b5",
+            "config_id": "camunda7:some-id:1",
+            "arguments": {"a": 1},
+        }
+        key = get_cache_key(**base)
+
+        for part, value in (
+            ("namespace", "service-fetch"),
+            ("submission_uuid", "0a2a1c5e-5d2e-4c7c-bd26-18bb4b14d2b5"),
+            ("config_id", "camunda7:some-id:2"),
+            ("arguments", {"a": 2}),
+        ):
+            with self.subTest(part=part):
+                self.assertNotEqual(get_cache_key(**{**base, part: value}), key)
+
+
+class GetOrSetTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def test_hits_and_misses_are_counted(self):
+        default = Mock(return_value={"result": 42})
+        key = get_cache_key("test", "submission", "config", {"a": 1})
+
+        result1 = get_or_set("test", key, default=default)
+        result2 = get_or_set("test", key, default=default)
+
+        self.assertEqual(result1, {"result": 42})
+        self.assertEqual(result2, {"result": 42})
+        default.assert_called_once()
+        statistics = get_cache_statistics("test")
+        self.assertEqual(statistics.hits, 1)
+        self.assertEqual(statistics.misses, 1)
+
+    def test_falsy_values_are_cached(self):
+        default = Mock(return_value=None)
+        key = get_cache_key("test", "submission", "config", {"a": 1})
+
+        get_or_set("test", key, default=default)
+        get_or_set("test", key, default=default)
+
+        default.assert_called_once()
+
+    def test_counting_a_hit_is_a_single_cache_call(self):
+        key = get_cache_key("test", "submission", "config", {"a": 1})
+        get_or_set("test", key, default=Mock(return_value=1))
+        get_or_set("test", key, default=Mock(return_value=1))
+
+        with (
+            patch.object(cache, "incr", wraps=cache.incr) as mock_incr,
+            patch.object(cache, "add", wraps=cache.add) as mock_add,
+        ):
+            get_or_set("test", key, default=Mock(return_value=1))
+
+        mock_incr.assert_called_once()
+        mock_add.assert_not_called()
+        self.assertEqual(get_cache_statistics("test").hits, 2)
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormLogicFactory
+
+from ...form_logic import evaluate_form_logic
+from ...models import Submission
+from ...rendering import Renderer, RenderModes
+from ...rendering.nodes import SubmissionStepNode
+from ..factories import SubmissionFactory
+
+
+def _render(submission: Submission, mode: RenderModes = RenderModes.pdf) -> list[str]:
+    renderer = Renderer(submission=submission, mode=mode, as_html=False)
+    return [node.render() for node in renderer]
+
+
+class ResolvedRenderTreeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "name", "label": "Name"},
+                {"type": "textfield", "key": "secret", "label": "Secret"},
+            ],
+            submitted_data={"name": "Alice", "secret": "hidden"},
+            completed=True,
+        )
+        FormLogicFactory.create(
+            form=cls.submission.form,
+            json_logic_trigger={"==": [{"var": "name"}, "Alice"]},
+            actions=[
+                {
+                    "component": "secret",
+                    "action": {
+                        "type": "property",
+                        "property": {"value": "hidden", "type": "bool"},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+
+    def test_logic_evaluated_once_for_all_render_modes(self):
+        submission = Submission.objects.get(pk=self.submission.pk)
+
+        with patch(
+            "openforms.submissions.rendering.tree.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate:
+            for mode in (RenderModes.pdf, RenderModes.summary):
+                with self.subTest(mode=mode):
+                    rendered = _render(submission, mode=mode)
+
+                    self.assertIn("Name: Alice", rendered)
+                    self.assertNotIn("Secret: hidden", rendered)
+
+        self.assertEqual(mock_evaluate.call_count, 1)
+
+    def test_resolved_tree_not_shared_between_instances(self):
+        expected = _render(Submission.objects.get(pk=self.submission.pk))
+
+        with patch(
+            "openforms.submissions.rendering.tree.evaluate_form_logic",
+            wraps=evaluate_form_logic,
+        ) as mock_evaluate:
+            rendered = _render(Submission.objects.get(pk=self.submission.pk))
+
+        self.assertEqual(mock_evaluate.call_count, 1)
+        self.assertEqual(rendered, expected)
+
+    def test_step_nodes_reflect_resolved_applicability(self):
+        submission = Submission.objects.get(pk=self.submission.pk)
+        renderer = Renderer(submission=submission, mode=RenderModes.pdf, as_html=False)
+
+        step_nodes = [node for node in renderer if isinstance(node, SubmissionStepNode)]
+
+        self.assertEqual(len(step_nodes), 1)
+        self.assertTrue(step_nodes[0].step._form_logic_evaluated)
@@ -0,0 +1,127 @@
+from django.test import TestCase
+
+from openforms.forms.tests.factories import FormStepFactory, FormVariableFactory
+from openforms.variables.constants import FormVariableSources
+
+from ..bulk_loading import iter_submissions_with_state, load_submission_states
+from ..models import Submission
+from .factories import SubmissionFactory, SubmissionStepFactory
+
+
+class BulkLoadingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.submission = SubmissionFactory.from_components(
+            [{"type": "textfield", "key": "name"}],
+            submitted_data={"name": "Alice"},
+            completed=True,
+        )
+        form = cls.submission.form
+        cls.form_step = form.formstep_set.get()
+        # a second step that is not filled out yet
+        FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "textfield", "key": "other"}]
+            },
+        )
+        FormVariableFactory.create(
+            form=form,
+            key="udv",
+            source=FormVariableSources.user_defined,
+            initial_value="initial",
+        )
+        for name in ("Bob", "Carol"):
+            submission = SubmissionFactory.create(form=form, completed=True)
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=cls.form_step,
+                data={"name": name},
+            )
+        # a submission of another form
+        SubmissionFactory.from_components(
+            [{"type": "number", "key": "amount"}],
+            submitted_data={"amount": 3},
+        )
+
+    def test_state_loaded_in_fixed_number_of_queries(self):
+        submissions = list(Submission.objects.order_by("pk"))
+
+        # forms, form steps, form variables, submission steps and submission variables
+        with self.assertNumQueries(5):
+            load_submission_states(submissions)
+
+        with self.assertNumQueries(0):
+            data = [submission.data for submission in submissions]
+            steps = [
+                submission.load_execution_state().submission_steps
+                for submission in submissions
+            ]
+
+        self.assertEqual(
+            data,
+            [
+                {"name": "Alice"},
+                {"name": "Bob"},
+                {"name": "Carol"},
+                {"amount": 3},
+            ],
+        )
+        self.assertEqual(
+            [len(submission_steps) for submission_steps in steps], [2, 2, 2, 1]
+        )
+        # the second step was not filled out yet
+        self.assertIsNone(steps[0][1].pk)
+
+    def test_same_state_as_loading_individually(self):
+        submissions = list(Submission.objects.order_by("pk"))
+        load_submission_states(submissions)
+
+        for submission in submissions:
+            with self.subTest(submission=submission):
+                individual = Submission.objects.get(pk=submission.pk)
+                bulk_state = submission.load_execution_state()
+                individual_state = individual.load_execution_state()
+
+                self.assertEqual(bulk_state.form_steps, individual_state.form_steps)
+                # unsaved submission steps have no primary key to compare
+                self.assertEqual(
+                    [(step.pk, step.form_step) for step in bulk_state.submission_steps],
+                    [
+                        (step.pk, step.form_step)
+                        for step in individual_state.submission_steps
+                    ],
+                )
+                self.assertEqual(
+                    submission.load_submission_value_variables_state().variables.keys(),
+                    individual.load_submission_value_variables_state().variables.keys(),
+                )
+                self.assertEqual(submission.data, individual.data)
+
+    def test_form_steps_are_not_shared_between_submissions(self):
+        first, second, *_ = list(Submission.objects.order_by("pk"))
+        load_submission_states([first, second])
+
+        first_step = first.load_execution_state().form_steps[0]
+        second_step = second.load_execution_state().form_steps[0]
+
+        self.assertEqual(first_step, second_step)
+        self.assertIsNot(first_step, second_step)
+        self.assertIsNot(first_step.form_definition, second_step.form_definition)
+        self.assertIsNot(
+            first_step.form_definition.configuration,
+            second_step.form_definition.configuration,
+        )
+
+    def test_iterate_in_batches(self):
+        queryset = Submission.objects.order_by("pk")
+
+        with self.assertNumQueries(1 + 2 * 4):
+            submissions = list(iter_submissions_with_state(queryset, batch_size=2))
+
+        self.assertEqual(len(submissions), 4)
+        with self.assertNumQueries(0):
+            for submission in submissions:
+                submission.data
@@ -1,5 +1,6 @@
 from datetime import datetime
 
+from django.http import StreamingHttpResponse
 from django.test import TestCase, tag
 from django.utils import timezone
 
@@ -8,7 +9,12 @@ from freezegun import freeze_time
 from openforms.forms.tests.factories import FormFactory, FormStepFactory
 from openforms.variables.constants import FormVariableSources
 
-from ..exports import create_submission_export
+from ..exports import (
+    ExportFileTypes,
+    create_submission_export,
+    export_submissions,
+    iter_submission_export,
+)
 from ..models import Submission
 from .factories import (
     SubmissionFactory,
@@ -266,3 +272,72 @@ class ExportTests(TestCase):
         export = create_submission_export(Submission.objects.all())
 
         self.assertIn(("Taalcode", "en"), zip(export.headers, export[0]))
+
+
+class StreamingExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        first_submission = SubmissionFactory.from_components(
+            [
+                {"type": "textfield", "key": "name"},
+                {"type": "textfield", "key": "tags", "multiple": True},
+            ],
+            submitted_data={"name": "Alice", "tags": ["a", "b"]},
+            completed=True,
+        )
+        form_step = first_submission.form.formstep_set.get()
+        for name in ("Bob", "Carol"):
+            submission = SubmissionFactory.create(
+                form=first_submission.form, completed=True
+            )
+            SubmissionStepFactory.create(
+                submission=submission,
+                form_step=form_step,
+                data={"name": name, "tags": [name.lower()]},
+            )
+
+    def test_rows_are_produced_in_chunks(self):
+        rows = list(
+            iter_submission_export(Submission.objects.order_by("pk"), chunk_size=1)
+        )
+
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[0][-2:], ["name", "tags"])
+        self.assertEqual(
+            [row[-2:] for row in rows[1:]],
+            [["Alice", ["a", "b"]], ["Bob", ["bob"]], ["Carol", ["carol"]]],
+        )
+
+    def test_empty_queryset(self):
+        rows = list(iter_submission_export(Submission.objects.none()))
+
+        self.assertEqual(rows, [])
+
+    def test_streamed_output_matches_dataset_export(self):
+        queryset = Submission.objects.order_by("pk")
+        dataset = create_submission_export(queryset)
+
+        for file_type in (
+            ExportFileTypes.CSV,
+            ExportFileTypes.JSON,
+            ExportFileTypes.XML,
+        ):
+            with self.subTest(file_type=file_type.extension):
+                response = export_submissions(queryset, file_type)
+
+                self.assertIsInstance(response, StreamingHttpResponse)
+                self.assertEqual(response["Content-Type"], file_type.content_type)
+                expected = dataset.export(file_type.extension)
+                if isinstance(expected, str):
+                    expected = expected.encode("utf-8")
+                self.assertEqual(response.getvalue(), expected)
+
+    def test_xlsx_export_is_not_streamed(self):
+        response = export_submissions(
+            Submission.objects.order_by("pk"), ExportFileTypes.XLSX
+        )
+
+        self.assertNotIsInstance(response, StreamingHttpResponse)
+        self.assertTrue(response.content)
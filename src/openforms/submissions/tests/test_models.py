@@ -160,6 +160,107 @@ class SubmissionTests(TestCase):
             },
         )
 
+    def test_queryset_remove_sensitive_data(self):
+        form_definition = FormDefinitionFactory.create(
+            configuration={
+                "components": [
+                    {
+                        "key": "textFieldSensitive",
+                        "type": "textfield",
+                        "isSensitiveData": True,
+                    },
+                    {
+                        "key": "textFieldNotSensitive",
+                        "type": "textfield",
+                        "isSensitiveData": False,
+                    },
+                    {"key": "sensitiveFile", "type": "file", "isSensitiveData": True},
+                    {"key": "otherFile", "type": "file", "isSensitiveData": False},
+                ],
+            }
+        )
+        form_step = FormStepFactory.create(form_definition=form_definition)
+        co_sign_data = {
+            "plugin": "digid",
+            "identifier": "123456782",
+            "representation": "T. Hulk",
+            "fields": {"firstName": "The", "lastName": "Hulk"},
+        }
+        submissions, attachments = [], []
+        for index in range(3):
+            submission = SubmissionFactory.create(
+                form=form_step.form,
+                auth_info__value="999990676",
+                co_sign_data=co_sign_data if index == 0 else {},
+            )
+            submission_step = SubmissionStepFactory.create(
+                submission=submission,
+                form_step=form_step,
+                data={
+                    "textFieldSensitive": "this is sensitive",
+                    "textFieldNotSensitive": "this is not sensitive",
+                },
+            )
+            attachments.append(
+                (
+                    SubmissionFileAttachmentFactory.create(
+                        submission_step=submission_step, form_key="sensitiveFile"
+                    ),
+                    SubmissionFileAttachmentFactory.create(
+                        submission_step=submission_step, form_key="otherFile"
+                    ),
+                )
+            )
+            submissions.append(submission)
+        # the last submission is not part of the queryset
+        queryset = Submission.objects.filter(
+            pk__in=[submission.pk for submission in submissions[:2]]
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            num_cleaned = queryset.remove_sensitive_data()
+
+        self.assertEqual(num_cleaned, 2)
+        for submission, (sensitive_file, other_file) in zip(submissions, attachments):
+            cleaned = submission in submissions[:2]
+            with self.subTest(submission=submission, cleaned=cleaned):
+                submission.refresh_from_db()
+                submission.auth_info.refresh_from_db()
+
+                self.assertEqual(submission._is_cleaned, cleaned)
+                self.assertEqual(
+                    submission.auth_info.value, "" if cleaned else "999990676"
+                )
+                data = submission.data
+                self.assertEqual(data["textFieldNotSensitive"], "this is not sensitive")
+                self.assertEqual(
+                    data.get("textFieldSensitive"),
+                    None if cleaned else "this is sensitive",
+                )
+                self.assertEqual(
+                    SubmissionFileAttachment.objects.filter(
+                        pk=sensitive_file.pk
+                    ).exists(),
+                    not cleaned,
+                )
+                self.assertEqual(
+                    sensitive_file.content.storage.exists(sensitive_file.content.name),
+                    not cleaned,
+                )
+                self.assertTrue(
+                    SubmissionFileAttachment.objects.filter(pk=other_file.pk).exists()
+                )
+
+        self.assertEqual(
+            submissions[0].co_sign_data,
+            {
+                "plugin": "digid",
+                "identifier": "",
+                "fields": {},
+                "representation": "T. Hulk",
+            },
+        )
+
     def test_submission_delete_file_uploads_cascade(self):
         """
         Assert that when a submission is deleted, the file uploads (on disk!) are deleted.
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from factory.django import FileField
@@ -107,6 +107,9 @@ class ServiceFetchWithActionsTest(TestCase):
         # shouldn't be overwritten
         self.assertEqual(variable.value, "some initial value")
 
+    # the requests are asserted in order, which is not guaranteed when the service
+    # fetches are performed concurrently
+    @override_settings(LOGIC_MAX_CONCURRENT_ACTIONS=1)
     @requests_mock.Mocker(case_sensitive=True)
     def test_requests_not_made_multiple_times(self, m):
         submission = SubmissionFactory.from_components(
@@ -6,16 +6,41 @@ The ``template`` package provides generic template rendering constructs. Feature
 * Option to sandbox templates to only allow safe-ish public API
 * Utilities to evaluate templates from string (user-contributed content and inherently
   unsafe).
+* Caching for string-based templates - the compiled templates are kept in a bounded
+  in-process cache, and sources without any template syntax are not rendered at all.
+"""
 
-Possible future features:
+from functools import lru_cache
 
-* Caching for string-based templates
-* ...
-"""
+from django.template import TemplateSyntaxError
+from django.template.base import TextNode, Variable, VariableNode
+from django.utils.safestring import SafeString
 
 from .backends.sandboxed_django import backend as sandbox_backend, openforms_backend
 
-__all__ = ["render_from_string", "parse", "sandbox_backend", "openforms_backend"]
+__all__ = [
+    "render_from_string",
+    "parse",
+    "get_referenced_variables",
+    "sandbox_backend",
+    "openforms_backend",
+]
+
+# the number of compiled templates to keep in memory
+TEMPLATE_CACHE_SIZE = 1024
+
+# markers of variables, tags and comments - without them, the template source renders
+# to itself
+TEMPLATE_SYNTAX_MARKERS = ("{{", "{%", "{#")
+
+
+def has_template_syntax(source: str) -> bool:
+    return any(marker in source for marker in TEMPLATE_SYNTAX_MARKERS)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _parse_cached(source: str, backend):
+    return backend.from_string(source)
 
 
 def parse(source: str, backend=sandbox_backend):
@@ -26,7 +51,7 @@ def parse(source: str, backend=sandbox_backend):
     :raises: :class:`django.template.TemplateSyntaxError` if there are any
       syntax errors
     """
-    return backend.from_string(source)
+    return _parse_cached(source, backend)
 
 
 def render_from_string(
@@ -46,8 +71,46 @@ def render_from_string(
     :raises: :class:`django.template.TemplateSyntaxError` if the template source is
       invalid
     """
+    # nothing to render, the output is the same as the input
+    if not has_template_syntax(source):
+        return SafeString(source)
     if disable_autoescape:
         source = f"{{% autoescape off %}}{source}{{% endautoescape %}}"
     template = parse(source, backend=backend)
     res = template.render(context)
     return res
+
+
+@lru_cache(maxsize=1024)
+def get_referenced_variables(source: str) -> frozenset[str] | None:
+    """
+    Determine the (dotted) variable names referenced by a sandboxed template source.
+
+    Only templates consisting of text and variable nodes (``{{ some.variable }}``,
+    including filter arguments) are introspected.
+
+    :returns: The variable names, or ``None`` if they can't be determined reliably
+      because the template uses tags or is invalid.
+    """
+    try:
+        template = parse(source, backend=sandbox_backend)
+    except TemplateSyntaxError:
+        return None
+
+    names = set()
+    for node in template.template.nodelist:
+        if isinstance(node, TextNode):
+            continue
+        if not isinstance(node, VariableNode):
+            return None
+        filter_expression = node.filter_expression
+        variables = [filter_expression.var] + [
+            arg
+            for _, args in filter_expression.filters
+            for is_lookup, arg in args
+            if is_lookup
+        ]
+        for variable in variables:
+            if isinstance(variable, Variable) and variable.lookups is not None:
+                names.add(".".join(variable.lookups))
+    return frozenset(names)
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+from django.utils.safestring import SafeString
+
+from .. import openforms_backend, parse, render_from_string, sandbox_backend
+
+
+class TemplateCachingTests(SimpleTestCase):
+    def test_compiled_templates_are_reused(self):
+        template1 = parse("Hello {{ name }}", backend=sandbox_backend)
+        template2 = parse("Hello {{ name }}", backend=sandbox_backend)
+
+        self.assertIs(template1, template2)
+
+    def test_cache_is_keyed_by_backend(self):
+        template1 = parse("Hello {{ name }}", backend=sandbox_backend)
+        template2 = parse("Hello {{ name }}", backend=openforms_backend)
+
+        self.assertIsNot(template1, template2)
+
+    def test_rendering_with_different_contexts(self):
+        for name in ("Alice", "Bob"):
+            with self.subTest(name=name):
+                result = render_from_string("Hello {{ name }}", {"name": name})
+
+                self.assertEqual(result, f"Hello {name}")
+
+    def test_sources_without_template_syntax_are_not_rendered(self):
+        sources = ("", "Plain <b>text</b> with { braces }", "100%")
+
+        for source in sources:
+            with (
+                self.subTest(source=source),
+                patch("openforms.template._parse_cached") as mock_parse,
+            ):
+                result = render_from_string(source, {}, disable_autoescape=True)
+
+                mock_parse.assert_not_called()
+                self.assertEqual(result, source)
+                self.assertIsInstance(result, SafeString)
+
+    def test_comments_are_rendered(self):
+        result = render_from_string("foo{# a comment #}bar", {})
+
+        self.assertEqual(result, "foobar")
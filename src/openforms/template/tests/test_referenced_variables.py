@@ -0,0 +1,24 @@
+from django.test import SimpleTestCase
+
+from .. import get_referenced_variables
+
+
+class ReferencedVariablesTests(SimpleTestCase):
+    def test_variables_are_collected(self):
+        source = "/api/{{ some.nested.key }}/{{ other|default:fallback }}?x={{ 'a' }}"
+
+        variables = get_referenced_variables(source)
+
+        self.assertEqual(variables, {"some.nested.key", "other", "fallback"})
+
+    def test_text_only(self):
+        self.assertEqual(get_referenced_variables("/api/v1/"), set())
+
+    def test_unknown_variables(self):
+        for source in (
+            "{% if foo %}{{ bar }}{% endif %}",
+            "{% for item in items %}{{ item }}{% endfor %}",
+            "{{ foo|bad_filter }}",
+        ):
+            with self.subTest(source=source):
+                self.assertIsNone(get_referenced_variables(source))
@@ -1,9 +1,15 @@
-from typing import Generic, Iterator, TypedDict, TypeVar
+import os
+import uuid
+from base64 import b64encode
+from typing import BinaryIO, Generic, Iterator, TypedDict, TypeVar
 
 from ape_pie import APIClient
 
 T = TypeVar("T")
 
+# a multiple of 3 bytes, so that the encoded chunks can be concatenated
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
 
 class PaginatedResponseData(TypedDict, Generic[T]):
     count: int
@@ -32,3 +38,71 @@ def pagination_helper(
             yield from _iter(data)
 
     return _iter(paginated_data)
+
+
+def get_base64_placeholder() -> str:
+    """
+    Generate a placeholder to mark the position of the base64 encoded content.
+
+    A new placeholder is generated for every request, so that it cannot appear in the
+    (user provided) values of the rest of the body.
+    """
+    return f"__base64_content_{uuid.uuid4().hex}__"
+
+
+def get_content_size(content: BinaryIO) -> int:
+    """
+    Determine the size of a (Django) file object without reading it.
+    """
+    if (size := getattr(content, "size", None)) is not None:
+        return size
+    position = content.tell()
+    size = content.seek(0, os.SEEK_END)
+    content.seek(position)
+    return size
+
+
+class Base64StreamingBody:
+    """
+    A request body with the base64 encoded file content embedded in it.
+
+    The content is encoded in chunks while the request is sent, so the file never has
+    to be loaded into memory entirely. The body is built from a rendered (JSON or XML)
+    text, where the placeholder (see :func:`get_base64_placeholder`) marks the position
+    of the encoded content.
+
+    The length of the body is known up front, so :mod:`requests` sends it with a
+    ``Content-Length`` header rather than chunked transfer encoding.
+    """
+
+    def __init__(self, body: str, content: BinaryIO, placeholder: str):
+        prefix, suffix = body.split(placeholder)
+        self.prefix = prefix.encode("utf-8")
+        self.suffix = suffix.encode("utf-8")
+        self.content = content
+        self.content_size = get_content_size(content)
+
+    def __len__(self) -> int:
+        encoded_size = (self.content_size + 2) // 3 * 4
+        return len(self.prefix) + encoded_size + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+        # start from the beginning every time, in case the request is retried
+        self.content.seek(0)
+        remainder = b""
+        while chunk := self.content.read(BASE64_CHUNK_SIZE):
+            if remainder:
+                chunk = remainder + chunk
+            # only complete groups of 3 bytes can be encoded without padding
+            if excess := len(chunk) % 3:
+                chunk, remainder = chunk[:-excess], chunk[-excess:]
+            else:
+                remainder = b""
+            yield b64encode(chunk)
+        if remainder:
+            yield b64encode(remainder)
+        yield self.suffix
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} bytes>"
@@ -12,6 +12,7 @@ class UtilsConfig(AppConfig):
     def ready(self):
         from . import cache  # noqa
         from . import checks  # noqa
+        from . import db_metrics  # noqa
 
         setting_changed.connect(clear_lru_cache_on_settings_changed)
 
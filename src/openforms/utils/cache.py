@@ -1,8 +1,21 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
 import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from django.core import signals
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
 from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cryptography.fernet import Fernet
+
+if TYPE_CHECKING:
+    from django.contrib.sessions.backends.base import SessionBase
 
 
 class RequestProxyCache(BaseCache):
@@ -102,3 +115,91 @@ signals.request_started.connect(
     mark_request_proxy_caches,
     dispatch_uid="openforms.cache.mark_request_start",
 )
+
+
+# Helpers for caching in the shared cache. The cache keys are built by the callers from
+# a prefix and a version, which must be bumped when the format of the cached values
+# changes so that values cached by a previous release are no longer used.
+
+
+def get_digest(
+    value: Any, secret: str = "", encoder: type[json.JSONEncoder] = DjangoJSONEncoder
+) -> str:
+    """
+    Calculate a digest of the canonical JSON representation of the value.
+
+    The builtin :func:`hash` is randomized per process, the digest is stable across
+    processes and can be used in cache keys.
+
+    :arg secret: If provided, an HMAC is calculated with the secret, which prevents
+      (low entropy) values like a BSN from being derived from the digest.
+    :raises TypeError: if the value cannot be serialized to JSON.
+    """
+    canonical = json.dumps(
+        value, cls=encoder, sort_keys=True, separators=(",", ":")
+    ).encode("utf-8")
+    if secret:
+        return hmac.new(secret.encode("ascii"), canonical, hashlib.sha256).hexdigest()
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def get_session_secret(session: SessionBase, session_key: str) -> str:
+    """
+    Return the secret stored in the session, which is added if it doesn't exist yet.
+
+    The secret is suitable for encrypting values with :class:`Fernet` and as key of
+    :func:`get_digest`. Personal data in the shared cache is protected this way, and
+    becomes inaccessible when the secret is removed from the session.
+    """
+    if (secret := session.get(session_key)) is None:
+        secret = session[session_key] = Fernet.generate_key().decode("ascii")
+    return secret
+
+
+@dataclass
+class CacheStatistics:
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float | None:
+        if not (total := self.hits + self.misses):
+            return None
+        return self.hits / total
+
+
+@dataclass(frozen=True)
+class HitCounter:
+    """
+    Count the hits and misses of a cache in the shared cache.
+
+    :arg key_prefix: The prefix of the keys of the counters.
+    """
+
+    key_prefix: str
+
+    def _get_key(self, counter: str) -> str:
+        return f"{self.key_prefix}|stats|{counter}"
+
+    def _increment(self, counter: str) -> None:
+        cache = caches[DEFAULT_CACHE_ALIAS]
+        key = self._get_key(counter)
+        try:
+            cache.incr(key)
+        except ValueError:  # the counter doesn't exist (yet), or was evicted
+            if not cache.add(key, 1, timeout=None):
+                # another process created the counter in the meantime
+                cache.incr(key)
+
+    def hit(self) -> None:
+        self._increment("hits")
+
+    def miss(self) -> None:
+        self._increment("misses")
+
+    def get_statistics(self) -> CacheStatistics:
+        hits_key, misses_key = self._get_key("hits"), self._get_key("misses")
+        counters = caches[DEFAULT_CACHE_ALIAS].get_many([hits_key, misses_key])
+        return CacheStatistics(
+            hits=counters.get(hits_key, 0), misses=counters.get(misses_key, 0)
+        )
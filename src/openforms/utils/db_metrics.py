@@ -0,0 +1,81 @@
+"""
+Statistics of the use of the database connections.
+
+With ``CONN_MAX_AGE`` enabled, the database connection of a thread is kept open and
+reused by the next requests/tasks handled by that thread. For every database alias, the
+statistics keep track of:
+
+* ``checkouts``: the number of requests and tasks that started
+* ``reused``: the number of those that could use an open connection
+* ``opened``: the number of new connections made to the database
+
+The statistics are reported to Elastic APM through :class:`ConnectionMetricSet`.
+"""
+
+import threading
+from collections import Counter
+
+from django.core.signals import request_started
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from celery.signals import task_prerun
+from elasticapm.metrics.base_metrics import MetricSet
+
+METRICS = ("checkouts", "reused", "opened")
+
+_lock = threading.Lock()
+_stats: Counter[tuple[str, str]] = Counter()
+
+
+def _increment(alias: str, metric: str) -> None:
+    with _lock:
+        _stats[(alias, metric)] += 1
+
+
+def get_connection_stats() -> dict[str, dict[str, int]]:
+    """
+    Return the connection statistics (of this process) per database alias.
+    """
+    with _lock:
+        stats = dict(_stats)
+    return {
+        alias: {metric: stats.get((alias, metric), 0) for metric in METRICS}
+        for alias in connections
+    }
+
+
+def reset_connection_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def record_checkout(**kwargs) -> None:
+    for alias in connections:
+        _increment(alias, "checkouts")
+        # Django closes the connections that are obsolete or unusable at the start of
+        # a request, before this receiver is called.
+        if connections[alias].connection is not None:
+            _increment(alias, "reused")
+
+
+def record_connection_created(sender, connection, **kwargs) -> None:
+    _increment(connection.alias, "opened")
+
+
+request_started.connect(record_checkout, dispatch_uid="db_metrics.request_checkout")
+task_prerun.connect(record_checkout, dispatch_uid="db_metrics.task_checkout")
+connection_created.connect(
+    record_connection_created, dispatch_uid="db_metrics.connection_created"
+)
+
+
+class ConnectionMetricSet(MetricSet):
+    """
+    Report the database connection statistics to Elastic APM.
+    """
+
+    def before_collect(self) -> None:
+        for alias, stats in get_connection_stats().items():
+            for metric, value in stats.items():
+                self.counter(f"db.connections.{metric}", alias=alias).val = value
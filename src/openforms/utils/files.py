@@ -5,6 +5,9 @@ These utilities apply to file fields and subclasses thereof.
 """
 
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, TypeAlias
 
 from django.db import models, transaction
 from django.db.models import Model
@@ -12,6 +15,13 @@ from django.db.models.fields.files import FieldFile
 
 logger = logging.getLogger(__name__)
 
+# model label, field name and file name of a file to delete
+FileReference: TypeAlias = tuple[str, str, str]
+
+_deferred_deletes: ContextVar[list[FileReference] | None] = ContextVar(
+    "deferred_file_deletes", default=None
+)
+
 
 def get_file_field_names(model: type[Model]) -> list[str]:
     """
@@ -51,9 +61,45 @@ class log_failed_deletes:
             return True
 
 
+@contextmanager
+def defer_file_deletes() -> Iterator[list[FileReference]]:
+    """
+    Collect the files to delete instead of deleting them.
+
+    The file deletes triggered inside the block (including the deletes scheduled
+    with :func:`django.db.transaction.on_commit` by transactions that commit inside
+    the block) are collected in the yielded list, so that they can be handed off to
+    a background task with :func:`openforms.utils.tasks.delete_files`.
+    """
+    references: list[FileReference] = []
+    token = _deferred_deletes.set(references)
+    try:
+        yield references
+    finally:
+        _deferred_deletes.reset(token)
+
+
+def defer_file_delete(filefield: FieldFile) -> bool:
+    """
+    Add the file to the deferred deletes, if file deletes are being deferred.
+
+    :returns: ``True`` if the file delete is deferred, ``False`` if the caller must
+      delete the file.
+    """
+    references = _deferred_deletes.get()
+    if references is None:
+        return False
+    if filefield:
+        instance = filefield.instance
+        references.append((instance._meta.label, filefield.field.name, filefield.name))
+    return True
+
+
 def _delete_obj_files(fields: list[str], obj: models.Model) -> None:
     for name in fields:
         filefield = getattr(obj, name)
+        if defer_file_delete(filefield):
+            continue
         with log_failed_deletes(filefield):
             filefield.delete(save=False)
 
@@ -0,0 +1,133 @@
+"""
+Compile JsonLogic expressions into Python closures.
+
+:func:`json_logic.jsonLogic` interprets the expression tree on every call - it
+destructures every (nested) expression, normalizes the arguments and looks up the
+operator implementation. Logic rules are evaluated many times with different data
+while the expressions themselves rarely change, so we do this work only once and
+produce a closure that only needs to be called with the data.
+
+The compiled closures follow the semantics of the interpreter exactly (including the
+eager evaluation of all operands and the handling of empty operands), and look up the
+operator implementations at call time so that the monkeypatches from
+:func:`openforms.setup.monkeypatch_json_logic` are respected.
+"""
+
+from functools import reduce
+from typing import Any, Callable
+
+from json_logic import (
+    empty_operand_values_for_operators,
+    get_var,
+    missing,
+    missing_some,
+    operations,
+)
+from json_logic.meta.expressions import destructure
+from json_logic.typing import JSON
+
+__all__ = ["CompiledExpression", "compile_expression"]
+
+CompiledExpression = Callable[[Any], JSON]
+
+
+def _compile_arguments(values: JSON) -> list[CompiledExpression]:
+    # Easy syntax for unary operators, like {"var": "x"} instead of strict
+    # {"var": ["x"]}
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+    return [compile_expression(value) for value in values]
+
+
+def _compile_reduce(
+    iterable_path: JSON, scoped_logic: JSON, initializer: JSON
+) -> CompiledExpression:
+    get_iterable = compile_expression(iterable_path)
+    scoped = compile_expression(scoped_logic)
+
+    def _reduce(data):
+        iterable = get_iterable(data)
+        if not isinstance(iterable, list):
+            return initializer
+        return reduce(
+            lambda accumulator, current: scoped(
+                {"accumulator": accumulator, "current": current}
+            ),
+            iterable,
+            initializer,
+        )
+
+    return _reduce
+
+
+def _compile_map(iterable_path: JSON, scoped_logic: JSON) -> CompiledExpression:
+    get_iterable = compile_expression(iterable_path)
+    scoped = compile_expression(scoped_logic)
+
+    def _map(data):
+        iterable = get_iterable(data) or []
+        return [scoped(item) for item in iterable]
+
+    return _map
+
+
+def compile_expression(expression: JSON) -> CompiledExpression:
+    """
+    Compile a JsonLogic expression into a callable taking the data as sole argument.
+
+    Calling the result is equivalent to ``jsonLogic(expression, data)``.
+    """
+    if isinstance(expression, list):
+        items = [compile_expression(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if expression is None or not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator, values = destructure(expression)
+
+    match operator:
+        case "reduce":
+            compiled_scoped = _compile_reduce(
+                *(values if isinstance(values, (list, tuple)) else [values])
+            )
+            return lambda data: compiled_scoped(data or {})
+        case "map":
+            compiled_scoped = _compile_map(
+                *(values if isinstance(values, (list, tuple)) else [values])
+            )
+            return lambda data: compiled_scoped(data or {})
+
+    arguments = _compile_arguments(values)
+
+    match operator:
+        case "var":
+
+            def _var(data):
+                data = data or {}
+                return get_var(data, *[argument(data) for argument in arguments])
+
+            return _var
+
+        case "missing" | "missing_some":
+            func = missing if operator == "missing" else missing_some
+
+            def _missing(data):
+                data = data or {}
+                return func(data, *[argument(data) for argument in arguments])
+
+            return _missing
+
+    empty_values = empty_operand_values_for_operators.get(operator)
+
+    def _operation(data):
+        data = data or {}
+        evaluated = [argument(data) for argument in arguments]
+        if operator not in operations:
+            raise ValueError("Unrecognized operation %s" % operator)
+        if empty_values and any(value in empty_values for value in evaluated):
+            return None
+        return operations[operator](*evaluated)
+
+    return _operation
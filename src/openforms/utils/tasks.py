@@ -1,8 +1,10 @@
 import logging
 
+from django.apps import apps
 from django.core import management
 
 from ..celery import app
+from .files import FileReference
 
 logger = logging.getLogger(__name__)
 
@@ -19,3 +21,23 @@ def cleanup_csp_reports() -> None:
     logger.debug("Cleanup CSP reports")
     # remove CSP reports older then a week
     management.call_command("clean_cspreports")
+
+
+@app.task(ignore_result=True)
+def delete_files(files: list[FileReference]) -> None:
+    """
+    Delete the files of (already deleted) model instances from their storage.
+    """
+    for model_label, field_name, name in files:
+        storage = apps.get_model(model_label)._meta.get_field(field_name).storage
+        try:
+            storage.delete(name)
+        except Exception as exc:
+            logger.warning(
+                "File delete of %s (model=%s, field=%s) failed: %s",
+                name,
+                model_label,
+                field_name,
+                exc,
+                exc_info=exc,
+            )
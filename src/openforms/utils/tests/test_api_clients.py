@@ -1,9 +1,18 @@
+import tracemalloc
+from base64 import b64encode
+from io import BytesIO
+from tempfile import TemporaryFile
 from unittest import TestCase
 
 import requests_mock
 from ape_pie import APIClient
 
-from ..api_clients import pagination_helper
+from ..api_clients import (
+    BASE64_CHUNK_SIZE,
+    Base64StreamingBody,
+    get_base64_placeholder,
+    pagination_helper,
+)
 
 
 class PaginationTests(TestCase):
@@ -57,3 +66,88 @@ class PaginationTests(TestCase):
 
         self.assertEqual(len(m.request_history), 2)
         self.assertEqual(all_results, [0, 1, 2])
+
+
+class ShortReadsIO(BytesIO):
+    def read(self, size=-1):
+        # return fewer bytes than requested, like a network stream may do
+        return super().read(min(size, 1000))
+
+
+PLACEHOLDER = get_base64_placeholder()
+
+
+class Base64StreamingBodyTests(TestCase):
+    def test_content_is_encoded_in_place_of_placeholder(self):
+        body_template = f'{{"inhoud": "{PLACEHOLDER}", "titel": "Foo"}}'
+
+        for size in (0, 1, 2, 3, 4, BASE64_CHUNK_SIZE - 1, BASE64_CHUNK_SIZE + 1):
+            with self.subTest(size=size):
+                content = bytes(range(256)) * (size // 256) + bytes(size % 256)
+                body = Base64StreamingBody(body_template, BytesIO(content), PLACEHOLDER)
+
+                data = b"".join(body)
+
+                expected = (
+                    f'{{"inhoud": "{b64encode(content).decode()}", "titel": "Foo"}}'
+                )
+                self.assertEqual(data.decode(), expected)
+                self.assertEqual(len(body), len(data))
+
+    def test_placeholder_is_unique(self):
+        # e.g. a user provided title that contains a (former) placeholder
+        body_template = (
+            f'{{"inhoud": "{PLACEHOLDER}", "titel": "__base64_content__ '
+            f'{get_base64_placeholder()}"}}'
+        )
+
+        body = Base64StreamingBody(body_template, BytesIO(b"content"), PLACEHOLDER)
+
+        self.assertTrue(
+            b"".join(body).startswith(b'{"inhoud": "Y29udGVudA==", "titel"')
+        )
+        self.assertNotEqual(get_base64_placeholder(), PLACEHOLDER)
+
+    def test_short_reads(self):
+        content = b"x" * 10_001
+        body = Base64StreamingBody(PLACEHOLDER, ShortReadsIO(content), PLACEHOLDER)
+
+        self.assertEqual(b"".join(body), b64encode(content))
+
+    def test_can_be_iterated_again(self):
+        body = Base64StreamingBody(
+            f"<a>{PLACEHOLDER}</a>", BytesIO(b"content"), PLACEHOLDER
+        )
+
+        self.assertEqual(b"".join(body), b"<a>Y29udGVudA==</a>")
+        self.assertEqual(b"".join(body), b"<a>Y29udGVudA==</a>")
+
+    def test_memory_usage_does_not_grow_with_content_size(self):
+        with TemporaryFile() as content:
+            content.write(b"x" * 20 * 1024 * 1024)
+            body = Base64StreamingBody(PLACEHOLDER, content, PLACEHOLDER)
+
+            tracemalloc.start()
+            self.addCleanup(tracemalloc.stop)
+            for _ in body:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+
+        # a couple of chunks at most, rather than (a multiple of) the 20MB content
+        self.assertLess(peak, 1024 * 1024)
+
+    @requests_mock.Mocker()
+    def test_sent_with_content_length(self, m):
+        m.post("https://example.com/documents")
+        client = APIClient("https://example.com/")
+        body = Base64StreamingBody(
+            f"<a>{PLACEHOLDER}</a>", BytesIO(b"content"), PLACEHOLDER
+        )
+
+        with client:
+            client.post("documents", data=body)
+
+        request = m.last_request
+        self.assertEqual(request.headers["Content-Length"], "19")
+        self.assertNotIn("Transfer-Encoding", request.headers)
+        self.assertEqual(b"".join(request.body), b"<a>Y29udGVudA==</a>")
@@ -2,11 +2,14 @@ import contextlib
 import time
 from unittest.mock import patch
 
-from django.core.cache import caches
+from django.contrib.sessions.backends.cache import SessionStore
+from django.core.cache import cache as default_cache, caches
 from django.http import HttpResponse
-from django.test import Client, TestCase, override_settings
+from django.test import Client, SimpleTestCase, TestCase, override_settings
 from django.urls import path
 
+from ..cache import HitCounter, get_digest, get_session_secret
+
 
 @override_settings(
     CACHES={
@@ -229,3 +232,47 @@ class WithinRequestProxyCacheTests(TestCase):
                 client.get("/")
             except Exception:
                 self.fail("Assertions in test view failed")
+
+
+class CacheHelpersTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        default_cache.clear()
+        self.addCleanup(default_cache.clear)
+
+    def test_digest_is_canonical(self):
+        digest = get_digest({"a": 1, "b": [1, 2]})
+
+        self.assertEqual(get_digest({"b": [1, 2], "a": 1}), digest)
+        self.assertNotEqual(get_digest({"a": 1, "b": [2, 1]}), digest)
+
+    def test_digest_with_secret(self):
+        digest = get_digest("111222333", secret="secret")
+
+        self.assertNotEqual(get_digest("111222333"), digest)
+        self.assertNotEqual(get_digest("111222333", secret="other"), digest)
+
+    def test_session_secret(self):
+        session = SessionStore()
+
+        secret = get_session_secret(session, "some_secret")
+
+        self.assertEqual(session["some_secret"], secret)
+        self.assertEqual(get_session_secret(session, "some_secret"), secret)
+        self.assertNotEqual(get_session_secret(SessionStore(), "some_secret"), secret)
+
+    def test_hit_counter(self):
+        counter = HitCounter("test|v1")
+
+        self.assertIsNone(counter.get_statistics().hit_rate)
+
+        counter.hit()
+        counter.hit()
+        counter.miss()
+        default_cache.delete("test|v1|stats|misses")  # evicted
+        counter.miss()
+
+        statistics = counter.get_statistics()
+        self.assertEqual((statistics.hits, statistics.misses), (2, 1))
+        self.assertEqual(statistics.hit_rate, 2 / 3)
@@ -0,0 +1,64 @@
+from unittest.mock import Mock
+
+from django.core.signals import request_started
+from django.db import close_old_connections, connection
+from django.db.backends.signals import connection_created
+from django.test import TestCase
+
+from celery.signals import task_prerun
+
+from ..db_metrics import (
+    ConnectionMetricSet,
+    get_connection_stats,
+    reset_connection_stats,
+)
+
+
+class ConnectionStatsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        reset_connection_stats()
+        self.addCleanup(reset_connection_stats)
+
+        # like the test client, don't let the request signal close the connection of
+        # the test case
+        request_started.disconnect(close_old_connections)
+        self.addCleanup(request_started.connect, close_old_connections)
+
+    def test_open_connection_is_reused(self):
+        # the test case keeps the connection open
+        connection.ensure_connection()
+
+        request_started.send(sender=None)
+        task_prerun.send(sender=None, task_id="some-task")
+
+        self.assertEqual(
+            get_connection_stats()["default"],
+            {"checkouts": 2, "reused": 2, "opened": 0},
+        )
+
+    def test_new_connections_are_counted(self):
+        connection_created.send(sender=type(connection), connection=connection)
+
+        self.assertEqual(get_connection_stats()["default"]["opened"], 1)
+
+    def test_elastic_apm_metric_set(self):
+        request_started.send(sender=None)
+        metric_set = ConnectionMetricSet(Mock(ignore_patterns=[]))
+
+        samples = {
+            name: sample["value"]
+            for data in metric_set.collect()
+            if data["tags"] == {"alias": "default"}
+            for name, sample in data["samples"].items()
+        }
+
+        self.assertEqual(
+            samples,
+            {
+                "db.connections.checkouts": 1,
+                "db.connections.reused": 1,
+                "db.connections.opened": 0,
+            },
+        )
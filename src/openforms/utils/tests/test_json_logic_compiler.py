@@ -0,0 +1,89 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from json_logic import jsonLogic
+
+from ..json_logic.compiler import compile_expression
+
+
+class CompiledExpressionTests(SimpleTestCase):
+    def test_same_result_as_interpreter(self):
+        data = {
+            "a": 1,
+            "b": "2",
+            "nested": {"c": [1, 2, 3]},
+            "empty": None,
+            "date": "2024-03-01",
+            "items": [{"price": 5}, {"price": 10}],
+        }
+        expressions = [
+            True,
+            None,
+            "a string",
+            [1, {"var": "a"}],
+            {"var": "a"},
+            {"var": ["nested.c.1"]},
+            {"var": ["missing", "default"]},
+            {"var": ""},
+            {"==": [{"var": "a"}, {"var": "b"}]},
+            {"===": [{"var": "a"}, {"var": "b"}]},
+            {">": [{"var": "empty"}, 1]},
+            {"+": [{"var": "a"}, {"var": "b"}, 3]},
+            {"*": [{"var": "a"}, 2.5]},
+            {"-": [{"var": "a"}]},
+            {"/": [{"var": "a"}, 4]},
+            {"and": [True, {"var": "a"}, 0]},
+            {"or": [False, {"var": "empty"}, {"var": "b"}]},
+            {"if": [{"var": "empty"}, "yes", {"var": "a"}, "maybe", "no"]},
+            {"?:": [{"var": "a"}, "yes", "no"]},
+            {"!": {"var": "a"}},
+            {"!!": [{"var": "nested.c"}]},
+            {"in": [2, {"var": "nested.c"}]},
+            {"in": [None, "abc"]},
+            {"cat": ["a", {"var": "a"}, None]},
+            {"merge": [[1], {"var": "nested.c"}, 4]},
+            {"missing": ["a", "x", "nested.c"]},
+            {"missing_some": [1, ["x", "y", "a"]]},
+            {"max": [{"var": "a"}, 3, 2]},
+            {"date": {"var": "date"}},
+            {
+                ">": [
+                    {"+": [{"date": {"var": "date"}}, {"rdelta": [0, 1]}]},
+                    {"date": "2024-03-15"},
+                ]
+            },
+            {
+                "reduce": [
+                    {"var": "items"},
+                    {"+": [{"var": "accumulator"}, {"var": "current.price"}]},
+                    0,
+                ]
+            },
+            {"reduce": [{"var": "empty"}, {"var": "current"}, "initial"]},
+            {"map": [{"var": "nested.c"}, {"*": [{"var": ""}, 2]}]},
+        ]
+
+        for expression in expressions:
+            with self.subTest(expression=expression):
+                compiled = compile_expression(expression)
+
+                self.assertEqual(compiled(data), jsonLogic(expression, data))
+
+    def test_compiled_expression_is_reusable(self):
+        compiled = compile_expression({">": [{"var": "a"}, 1]})
+
+        self.assertTrue(compiled({"a": 2}))
+        self.assertFalse(compiled({"a": 0}))
+        self.assertIsNone(compiled({}))
+
+    def test_today(self):
+        compiled = compile_expression({"today": []})
+
+        self.assertEqual(compiled({}), date.today())
+
+    def test_unknown_operator(self):
+        compiled = compile_expression({"foo": [1, 2]})
+
+        with self.assertRaises(ValueError):
+            compiled({})
@@ -3,7 +3,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from openforms.formio.service import recursive_apply
-from openforms.template import render_from_string, sandbox_backend
+from openforms.template import (
+    get_referenced_variables,
+    render_from_string,
+    sandbox_backend,
+)
 from openforms.typing import DataMapping
 
 from .constants import DataMappingTypes, ServiceFetchMethods
@@ -107,6 +111,23 @@ class ServiceFetchConfiguration(models.Model):
         if errors:
             raise ValidationError(errors)
 
+    def get_referenced_variables(self) -> frozenset[str] | None:
+        """
+        Return the variable keys used in the templated request arguments.
+
+        :returns: ``None`` if the used variables can't be determined.
+        """
+        sources = [self.path, *(self.headers or {}).values()]
+        for values in (self.query_params or {}).values():
+            sources += values if isinstance(values, list) else [values]
+
+        variables = set()
+        for source in sources:
+            if (names := get_referenced_variables(source)) is None:
+                return None
+            variables |= names
+        return frozenset(variables)
+
     def request_arguments(self, context: DataMapping) -> dict:
         """Return a dictionary with keyword arguments for a
         zgw_consumers.Service client request call.
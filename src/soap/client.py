@@ -1,11 +1,115 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Hashable
+
+from django.conf import settings
+
 from ape_pie.client import APIClient as SessionBase, is_base_url
 from zeep.client import Client
+from zeep.settings import Settings
 from zeep.transports import Transport
+from zeep.wsdl import Document
 
 from .models import SoapService
 from .session_factory import SessionFactory
 
 
+@dataclass
+class _CachedDocument:
+    state: Hashable
+    document: Document
+    expires: float
+
+
+_documents: dict[tuple[int, str], _CachedDocument] = {}
+_documents_lock = threading.Lock()
+# the sessions are not shared between threads
+_sessions = threading.local()
+
+
+def _get_service_state(service: SoapService) -> Hashable:
+    """
+    Return the configuration of the service that affects the WSDL and session.
+    """
+    session_kwargs = SessionFactory(service).get_client_session_kwargs()
+    return (service.url, service.timeout, *session_kwargs.values())
+
+
+def get_session(service: SoapService) -> "SOAPSession":
+    """
+    Get a session for the service, reusing the session of the thread if possible.
+
+    The reused sessions keep their connections to the service open (pooled). A new
+    session is created when the configuration of the service changes.
+    """
+    session_factory = SessionFactory(service)
+    # unsaved services can't be identified
+    if service.pk is None:
+        return SOAPSession.configure_from(session_factory)
+
+    state = _get_service_state(service)
+    sessions: dict[int, tuple[Hashable, SOAPSession]] = _sessions.__dict__
+    if (cached := sessions.get(service.pk)) is not None:
+        cached_state, session = cached
+        if cached_state == state:
+            return session
+        session.__exit__(None, None, None)
+
+    session = SOAPSession.configure_from(session_factory)
+    # keep the connection pool of the session open until it's replaced
+    session.__enter__()
+    sessions[service.pk] = (state, session)
+    return session
+
+
+def get_wsdl_document(
+    service: SoapService, location: str, transport: Transport
+) -> Document | str:
+    """
+    Get the parsed WSDL document, from the process-level cache if possible.
+
+    Downloading and parsing the WSDL and the XSDs it refers to is expensive, so the
+    parsed document is cached for ``settings.SOAP_WSDL_CACHE_TIMEOUT`` seconds, per
+    service and WSDL location. A change in the configuration of the service discards
+    the cached document.
+
+    :returns: The parsed document, or the location of the WSDL if it can't be cached.
+    """
+    timeout = settings.SOAP_WSDL_CACHE_TIMEOUT
+    if not timeout or service.pk is None:
+        return location
+
+    key = (service.pk, location)
+    state = _get_service_state(service)
+    with _documents_lock:
+        cached = _documents.get(key)
+    if (
+        cached is not None
+        and cached.state == state
+        and cached.expires > time.monotonic()
+    ):
+        return cached.document
+
+    document = Document(location, transport, settings=Settings())
+    with _documents_lock:
+        _documents[key] = _CachedDocument(
+            state=state, document=document, expires=time.monotonic() + timeout
+        )
+    return document
+
+
+def clear_client_caches() -> None:
+    """
+    Discard the cached WSDL documents and the sessions of the current thread.
+    """
+    with _documents_lock:
+        _documents.clear()
+    for _, session in _sessions.__dict__.values():
+        session.__exit__(None, None, None)
+    _sessions.__dict__.clear()
+
+
 def build_client(
     service: SoapService,
     transport_factory=Transport,
@@ -17,11 +121,12 @@ def build_client(
 
     The mTLS and authentication parameters are taken from the service configuration
     and configured on the session, which is then used as transport for the zeep client.
+    The session and the parsed WSDL are reused by subsequent calls, see
+    :func:`get_session` and :func:`get_wsdl_document`.
 
     Any additional kwargs are passed through to the :class:`zeep.Client` instantiation.
     """
-    session_factory = SessionFactory(service)
-    session = SOAPSession.configure_from(session_factory)
+    session = get_session(service)
     transport = transport_factory(
         session=session,
         timeout=service.timeout,
@@ -29,8 +134,12 @@ def build_client(
         # monkeypatched requests.Session defaults
         operation_timeout=service.timeout,
     )
-    kwargs.setdefault("wsdl", service.url)
+    wsdl = kwargs.pop("wsdl", service.url)
+    # the document is parsed with the default settings
+    if "settings" not in kwargs:
+        wsdl = get_wsdl_document(service, wsdl, transport)
     client = client_factory(
+        wsdl=wsdl,
         transport=transport,
         wsse=service.get_wsse(),
         **kwargs,
@@ -2,9 +2,11 @@
 Test the client factory from SOAPService configuration.
 """
 
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from ape_pie import InvalidURLError
@@ -15,7 +17,7 @@ from zeep.wsse import Signature, UsernameToken
 
 from openforms.utils.tests.vcr import OFVCRMixin
 
-from ..client import SOAPSession, build_client
+from ..client import Document, SOAPSession, build_client, clear_client_caches
 from ..constants import EndpointSecurity
 from ..session_factory import SessionFactory
 from .factories import SoapServiceFactory
@@ -257,3 +259,84 @@ class ClientTransportTimeoutTests(TestCase):
             except XMLSyntaxError:
                 # timeout time has passed and we're trying
                 self.fail("timeout not honoured by SOAP client")
+
+
+class ClientCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.addCleanup(clear_client_caches)
+
+        patcher = patch("soap.client.Document", wraps=Document)
+        self.mock_document = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parsed_wsdl_is_reused(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        client1 = build_client(service)
+        client2 = build_client(service)
+
+        self.mock_document.assert_called_once()
+        self.assertIs(client1.wsdl, client2.wsdl)
+        self.assertIsNot(client1.transport, client2.transport)
+
+    def test_wsdl_parsed_again_when_service_changes(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        build_client(service)
+
+        service.timeout = 20
+        client = build_client(service)
+
+        self.assertEqual(self.mock_document.call_count, 2)
+        self.assertEqual(client.transport.operation_timeout, 20)
+
+    def test_wsdl_parsed_again_when_expired(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        with patch("soap.client.time.monotonic", return_value=0):
+            build_client(service)
+        with patch("soap.client.time.monotonic", return_value=3601):
+            build_client(service)
+
+        self.assertEqual(self.mock_document.call_count, 2)
+
+    @override_settings(SOAP_WSDL_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        client1 = build_client(service)
+        client2 = build_client(service)
+
+        self.assertIsNot(client1.wsdl, client2.wsdl)
+
+    def test_session_is_reused_in_thread(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+
+        session1 = build_client(service).transport.session
+        session2 = build_client(service).transport.session
+        other_thread_sessions = []
+        thread = threading.Thread(
+            target=lambda: other_thread_sessions.append(
+                build_client(service).transport.session
+            )
+        )
+        thread.start()
+        thread.join()
+
+        self.assertIs(session1, session2)
+        self.assertIsNot(other_thread_sessions[0], session1)
+
+    def test_new_session_when_certificate_changes(self):
+        service = SoapServiceFactory.create(url=WSDL_URI)
+        session = build_client(service).transport.session
+
+        service.server_certificate = CertificateFactory.create(
+            public_certificate__filename="server.pem"
+        )
+        new_session = build_client(service).transport.session
+
+        self.assertIsNot(new_session, session)
+        self.assertEqual(
+            new_session.verify, service.server_certificate.public_certificate.path
+        )
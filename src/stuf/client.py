@@ -14,7 +14,7 @@ subclass the base class and implement your domain specific logic in your own cla
 
 import logging
 import uuid
-from typing import Any, Literal, Protocol
+from typing import Any, BinaryIO, Literal, Protocol
 
 from django.template import loader
 
@@ -22,6 +22,7 @@ from ape_pie import APIClient, InvalidURLError
 from ape_pie.client import is_base_url
 from requests.models import Response
 
+from openforms.utils.api_clients import Base64StreamingBody
 from soap.constants import SOAP_VERSION_CONTENT_TYPES, SOAPVersion
 
 from .constants import EndpointType
@@ -155,7 +156,7 @@ class BaseClient(APIClient):
     def soap_request(
         self,
         soap_action: str,
-        body: str,
+        body: str | Base64StreamingBody,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
     ) -> Response:
         normalized_url = self.to_absolute_url(endpoint_type)
@@ -163,7 +164,7 @@ class BaseClient(APIClient):
 
         response = self.post(
             normalized_url,
-            data=body.encode("utf-8"),
+            data=body.encode("utf-8") if isinstance(body, str) else body,
             # See https://docs.python-requests.org/en/latest/user/advanced/#session-objects,
             # both the session.headers and these run-time headers are sent.
             headers={
@@ -204,12 +205,18 @@ class BaseClient(APIClient):
         template: str,
         context: dict[str, Any] | None = None,
         endpoint_type: EndpointType = EndpointType.vrije_berichten,
+        base64_content: BinaryIO | None = None,
+        base64_placeholder: str = "",
     ) -> Response:
         """
         Make a request by templating out a template with the provided context.
 
         The context is merged with the base context and the resolved template is
         rendered into a string, suitable to be passed down to :meth:`request`.
+
+        If ``base64_content`` is provided, the file is base64 encoded while the request
+        is sent, in the place of the ``base64_placeholder`` in the rendered template -
+        see :func:`openforms.utils.api_clients.get_base64_placeholder`.
         """
         full_context = {**self.build_base_context(), **(context or {})}
         ref_nr = full_context["referentienummer"]
@@ -220,6 +227,8 @@ class BaseClient(APIClient):
             extra={"ref_nr": ref_nr, "sector_alias": self.sector_alias},
         )
         body = loader.render_to_string(template, full_context)
+        if base64_content is not None:
+            body = Base64StreamingBody(body, base64_content, base64_placeholder)
         response = self.soap_request(
             soap_action, body=body, endpoint_type=endpoint_type
         )
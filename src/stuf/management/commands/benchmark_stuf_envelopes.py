@@ -0,0 +1,137 @@
+"""
+Micro-benchmark of the StUF/SOAP envelope rendering.
+
+Renders the envelope of every StUF-BG and StUF-ZDS message type made by Open Forms
+with the configuration of a given StUF service, like
+:meth:`stuf.client.BaseClient.templated_request` does for every call.
+"""
+
+import base64
+import os
+import timeit
+
+from django.core.management import BaseCommand
+from django.template import loader
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from tabulate import tabulate
+
+from openforms.config.models import GlobalConfiguration
+
+from ...client import BaseClient
+from ...models import StufService
+from ...service_client_factory import ServiceClientFactory, get_client_init_kwargs
+from ...stuf_bg.constants import FieldChoices
+from ...stuf_zds.client import fmt_soap_date, fmt_soap_datetime
+
+
+def _get_message_types(document_size: int) -> list[tuple[str, str, dict]]:
+    now = timezone.now()
+    zaak = {
+        "tijdstip_registratie": fmt_soap_datetime(now),
+        "datum_vandaag": fmt_soap_date(now),
+        "zaak_identificatie": "ZAAK-0001",
+        "zaak_omschrijving": "Benchmark",
+    }
+    document = {
+        **zaak,
+        "document_identificatie": "DOC-0001",
+        "titel": "Attachment",
+        "formaat": "application/pdf",
+        "bestandsnaam": "attachment.pdf",
+        "inhoud": mark_safe(base64.b64encode(os.urandom(document_size)).decode()),
+    }
+    return [
+        (
+            "npsLv01",
+            "stuf_bg/StufBgRequest.xml",
+            {
+                **{attr.replace(".", "_"): True for attr in FieldChoices.values},
+                "bsn": "111222333",
+            },
+        ),
+        (
+            "genereerZaakIdentificatie",
+            "stuf_zds/soap/genereerZaakIdentificatie.xml",
+            {},
+        ),
+        (
+            "creeerZaak",
+            "stuf_zds/soap/creeerZaak.xml",
+            {
+                **zaak,
+                "zds_zaaktype_code": "ZT-001",
+                "initiator": {"bsn": "111222333", "voornamen": "Jan"},
+                "extra": {"key": "value"},
+                "global_config": GlobalConfiguration.get_solo(),
+            },
+        ),
+        ("updateZaak", "stuf_zds/soap/updateZaak.xml", zaak),
+        (
+            "genereerDocumentIdentificatie",
+            "stuf_zds/soap/genereerDocumentIdentificatie.xml",
+            {},
+        ),
+        ("voegZaakdocumentToe", "stuf_zds/soap/voegZaakdocumentToe.xml", document),
+    ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the rendering of the StUF/SOAP envelopes per message type."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "service_id",
+            type=int,
+            help="ID of the StUF service providing the envelope configuration.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=1000,
+            help="Number of renders per message type. Defaults to 1000.",
+        )
+        parser.add_argument(
+            "--document-size",
+            type=int,
+            default=1024 * 1024,
+            help=(
+                "Size (in bytes) of the document embedded in the voegZaakdocumentToe "
+                "message. Defaults to 1MiB."
+            ),
+        )
+
+    def handle(self, **options):
+        service = StufService.objects.select_related("soap_service").get(
+            pk=options["service_id"]
+        )
+        iterations = options["iterations"]
+
+        client = BaseClient.configure_from(
+            ServiceClientFactory(service), **get_client_init_kwargs(service)
+        )
+        client.soap_security_expires_minutes = 5
+
+        rows = []
+        for message_type, template, context in _get_message_types(
+            options["document_size"]
+        ):
+
+            def _render():
+                full_context = {**client.build_base_context(), **context}
+                return loader.render_to_string(template, full_context).encode("utf-8")
+
+            duration = timeit.timeit(_render, number=iterations)
+            rows.append(
+                [
+                    message_type,
+                    f"{duration * 1000 / iterations:.3f}",
+                    len(_render()) // 1024,
+                ]
+            )
+
+        self.stdout.write(f"Rendered each envelope {iterations} times.\n")
+        self.stdout.write(
+            tabulate(rows, headers=["message type", "ms per envelope", "size (KiB)"])
+        )
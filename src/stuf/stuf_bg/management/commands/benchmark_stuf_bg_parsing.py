@@ -0,0 +1,135 @@
+"""
+Micro-benchmark of the StUF-BG response parsing.
+
+Compares the conversion of the full response with ``xmltodict`` (followed by the removal
+of the nil values), which was used before, with the streaming parser extracting the
+answer object only.
+"""
+
+import timeit
+import tracemalloc
+from collections.abc import Mapping
+from pathlib import Path
+
+from django.core.management import BaseCommand
+
+import xmltodict
+from glom import glom
+from tabulate import tabulate
+
+from ...constants import NAMESPACE_REPLACEMENTS
+from ...parsing import FORCE_LIST, parse_response
+
+
+def _remove_nils(container):
+    def is_nil(value):
+        return isinstance(value, Mapping) and (
+            value.get("@http://www.w3.org/2001/XMLSchema-instance:nil") == "true"
+            or value.get("@noValue") == "geenWaarde"
+        )
+
+    if isinstance(container, Mapping):
+        return {
+            k: (_remove_nils(v) if isinstance(v, (Mapping, list)) else v)
+            for k, v in container.items()
+            if not is_nil(v)
+        }
+    return [
+        _remove_nils(v) if isinstance(v, (Mapping, list)) else v
+        for v in container
+        if not is_nil(v)
+    ]
+
+
+def _parse_xmltodict(content: bytes):
+    data = _remove_nils(
+        xmltodict.parse(
+            content,
+            process_namespaces=True,
+            namespaces=NAMESPACE_REPLACEMENTS,
+            force_list=list(FORCE_LIST),
+        )
+    )
+    return glom(data, "Envelope.Body.npsLa01.antwoord.object", default=None)
+
+
+def _get_peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the parsing of a StUF-BG (npsLa01) response, comparing xmltodict "
+        "with the streaming parser."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "response_file",
+            type=Path,
+            help="Path to a file with the XML of a StUF-BG response.",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=100,
+            help="Number of times the response is parsed. Defaults to 100.",
+        )
+
+    def handle(self, **options):
+        content = options["response_file"].read_bytes()
+        iterations = options["iterations"]
+
+        def _xmltodict():
+            return _parse_xmltodict(content)
+
+        def _streaming():
+            return parse_response(content)[0]
+
+        expected = _xmltodict()
+        if isinstance(expected, dict):
+            # the streaming parser doesn't report the namespace declarations
+            expected.pop("@xmlns", None)
+        if expected != _streaming():
+            self.stderr.write(
+                "The parsers produce different results, the response is probably "
+                "not supported."
+            )
+
+        xmltodict_time = timeit.timeit(_xmltodict, number=iterations)
+        streaming_time = timeit.timeit(_streaming, number=iterations)
+
+        self.stdout.write(
+            f"Parsed a response of {len(content)} bytes {iterations} times.\n"
+        )
+        self.stdout.write(
+            tabulate(
+                [
+                    [
+                        "xmltodict",
+                        f"{xmltodict_time * 1000 / iterations:.3f}",
+                        _get_peak_memory(_xmltodict) // 1024,
+                    ],
+                    [
+                        "streaming",
+                        f"{streaming_time * 1000 / iterations:.3f}",
+                        _get_peak_memory(_streaming) // 1024,
+                    ],
+                    [
+                        "speedup",
+                        (
+                            f"{xmltodict_time / streaming_time:.2f}x"
+                            if streaming_time
+                            else "-"
+                        ),
+                        "",
+                    ],
+                ],
+                headers=["", "ms per parse", "peak memory (KiB)"],
+            )
+        )
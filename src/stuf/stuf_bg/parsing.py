@@ -0,0 +1,107 @@
+"""
+Streaming parser for the StUF-BG ``npsLa01`` responses.
+
+Only the ``antwoord/object`` element (or the SOAP fault) of the response is converted
+into Python data structures, while the rest of the envelope is discarded as soon as it
+is parsed. The resulting data has the same shape as the ``xmltodict`` output we used
+before:
+
+* the namespaces of :const:`NAMESPACE_REPLACEMENTS` are stripped from the element and
+  attribute names
+* elements without children or attributes become their (stripped) text content
+* attributes are added as ``@<name>`` keys, and the text content of elements with
+  attributes as the ``#text`` key
+* repeated elements become a list, the elements of :const:`FORCE_LIST` always do
+
+Elements marked with ``xsi:nil="true"`` or ``StUF:noValue="geenWaarde"`` are skipped
+while parsing.
+"""
+
+from io import BytesIO
+from typing import Any
+
+from lxml import etree
+
+from .constants import NAMESPACE_REPLACEMENTS
+
+XSI_NIL = "{http://www.w3.org/2001/XMLSchema-instance}nil"
+STUF_NO_VALUE = "{http://www.egem.nl/StUF/StUF0301}noValue"
+
+BG_OBJECT = "{http://www.egem.nl/StUF/sector/bg/0310}object"
+BG_ANTWOORD = "{http://www.egem.nl/StUF/sector/bg/0310}antwoord"
+SOAP_FAULTS = (
+    "{http://schemas.xmlsoap.org/soap/envelope/}Fault",  # SOAP 1.1
+    "{http://www.w3.org/2003/05/soap-envelope}Fault",  # SOAP 1.2
+)
+
+# elements that can occur multiple times and are always returned as a list
+FORCE_LIST = {"inp.heeftAlsEchtgenootPartner", "inp.heeftAlsKinderen"}
+
+
+def _get_name(qname: str) -> str:
+    if not qname.startswith("{"):
+        return qname
+    namespace, name = qname[1:].split("}", 1)
+    if namespace in NAMESPACE_REPLACEMENTS:
+        return name
+    return f"{namespace}:{name}"
+
+
+def _is_nil(element: etree._Element) -> bool:
+    return element.get(XSI_NIL) == "true" or element.get(STUF_NO_VALUE) == "geenWaarde"
+
+
+def _to_python(element: etree._Element) -> Any:
+    data: dict[str, Any] = {
+        f"@{_get_name(name)}": value for name, value in element.attrib.items()
+    }
+    text = element.text.strip() if element.text else ""
+
+    for child in element.iterchildren(tag=etree.Element):
+        if _is_nil(child):
+            continue
+        name = _get_name(child.tag)
+        value = _to_python(child)
+        if name not in data:
+            data[name] = [value] if name in FORCE_LIST else value
+        elif isinstance(data[name], list):
+            data[name].append(value)
+        else:
+            data[name] = [data[name], value]
+
+    if not data:
+        return text or None
+    if text:
+        data["#text"] = text
+    return data
+
+
+def parse_response(content: str | bytes) -> tuple[dict | None, dict | None]:
+    """
+    Extract the answer object and the SOAP fault from a StUF-BG response.
+
+    :returns: A tuple of the (nil-free) answer object and the fault, either of which
+      is ``None`` if not present in the response.
+    :raises lxml.etree.XMLSyntaxError: if the content is not valid XML.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    events = etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=(BG_OBJECT, *SOAP_FAULTS),
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, element in events:
+        if element.tag in SOAP_FAULTS:
+            return None, _to_python(element)
+
+        parent = element.getparent()
+        if parent is None or parent.tag != BG_ANTWOORD:
+            continue
+        if _is_nil(element):
+            return None, None
+        return _to_python(element), None
+
+    return None, None
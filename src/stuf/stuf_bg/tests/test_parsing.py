@@ -0,0 +1,109 @@
+from django.test import SimpleTestCase
+
+from lxml.etree import XMLSyntaxError
+
+from ..parsing import parse_response
+
+ENVELOPE = """<?xml version="1.0" encoding="UTF-8"?>
+<soapenv:Envelope xmlns:soapenv="http://schemas.xmlsoap.org/soap/envelope/"
+    xmlns:BG="http://www.egem.nl/StUF/sector/bg/0310"
+    xmlns:StUF="http://www.egem.nl/StUF/StUF0301"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">
+    <soapenv:Body>{body}</soapenv:Body>
+</soapenv:Envelope>
+"""
+
+
+def _response(antwoord: str) -> bytes:
+    body = f"""
+    <BG:npsLa01>
+        <BG:stuurgegevens><StUF:berichtcode>La01</StUF:berichtcode></BG:stuurgegevens>
+        <BG:antwoord>{antwoord}</BG:antwoord>
+    </BG:npsLa01>
+    """
+    return ENVELOPE.format(body=body).encode("utf-8")
+
+
+class ParseResponseTests(SimpleTestCase):
+    def test_answer_object(self):
+        content = _response(
+            """
+            <BG:object StUF:entiteittype="NPS">
+                <BG:inp.bsn>111222333</BG:inp.bsn>
+                <BG:voorvoegselGeslachtsnaam xsi:nil="true" StUF:noValue="geenWaarde" />
+                <BG:voornamen StUF:noValue="geenWaarde" />
+                <BG:geboortedatum StUF:indOnvolledigeDatum="M">19600701</BG:geboortedatum>
+                <BG:huisletter />
+                <BG:verblijfsadres>
+                    <BG:gor.straatnaam>Keizersgracht</BG:gor.straatnaam>
+                    <BG:aoa.huisnummertoevoeging xsi:nil="true" />
+                </BG:verblijfsadres>
+            </BG:object>
+            """
+        )
+
+        antwoord_object, fault = parse_response(content)
+
+        self.assertIsNone(fault)
+        self.assertEqual(
+            antwoord_object,
+            {
+                "@entiteittype": "NPS",
+                "inp.bsn": "111222333",
+                "geboortedatum": {"@indOnvolledigeDatum": "M", "#text": "19600701"},
+                "huisletter": None,
+                "verblijfsadres": {"gor.straatnaam": "Keizersgracht"},
+            },
+        )
+
+    def test_repeated_elements(self):
+        content = _response(
+            """
+            <BG:object>
+                <BG:inp.heeftAlsKinderen>
+                    <BG:gerelateerde><BG:inp.bsn>1</BG:inp.bsn></BG:gerelateerde>
+                </BG:inp.heeftAlsKinderen>
+                <BG:inp.heeftAlsEchtgenootPartner xsi:nil="true" />
+                <BG:sub.telefoonnummer>1</BG:sub.telefoonnummer>
+                <BG:sub.telefoonnummer>2</BG:sub.telefoonnummer>
+            </BG:object>
+            """
+        )
+
+        antwoord_object, _ = parse_response(content)
+
+        self.assertEqual(
+            antwoord_object,
+            {
+                "inp.heeftAlsKinderen": [{"gerelateerde": {"inp.bsn": "1"}}],
+                "sub.telefoonnummer": ["1", "2"],
+            },
+        )
+
+    def test_empty_answer(self):
+        self.assertEqual(parse_response(_response("")), (None, None))
+
+    def test_fault(self):
+        content = ENVELOPE.format(
+            body="""
+            <soapenv:Fault>
+                <faultcode>soapenv:Server</faultcode>
+                <faultstring>Proces voor afhandelen bericht geeft fout</faultstring>
+            </soapenv:Fault>
+            """
+        ).encode("utf-8")
+
+        antwoord_object, fault = parse_response(content)
+
+        self.assertIsNone(antwoord_object)
+        self.assertEqual(
+            fault,
+            {
+                "faultcode": "soapenv:Server",
+                "faultstring": "Proces voor afhandelen bericht geeft fout",
+            },
+        )
+
+    def test_invalid_xml(self):
+        with self.assertRaises(XMLSyntaxError):
+            parse_response(b"I am not valid XML")
@@ -6,7 +6,9 @@ from datetime import datetime
 from functools import partial
 from typing import Callable, Literal, TypedDict
 
+from django.conf import settings
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from lxml import etree
@@ -18,6 +20,7 @@ from openforms.logging import logevent
 from openforms.plugins.exceptions import InvalidPluginConfiguration
 from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
+from openforms.utils.api_clients import get_base64_placeholder
 
 from ..client import BaseClient
 from ..constants import EndpointType
@@ -294,8 +297,16 @@ class Client(BaseClient):
         document: SubmissionReport | SubmissionFileAttachment,
         doc_data: dict,
     ) -> None:
-        document.content.seek(0)
-        base64_body = base64.b64encode(document.content.read()).decode()
+        # encode large documents while sending, instead of loading them in memory
+        stream = document.content.size > settings.DOCUMENT_STREAMING_THRESHOLD
+        placeholder = ""
+        if stream:
+            base64_body = placeholder = get_base64_placeholder()
+        else:
+            document.content.seek(0)
+            # the base64 alphabet never needs escaping - skip the (costly) autoescape of
+            # the template engine
+            base64_body = mark_safe(base64.b64encode(document.content.read()).decode())
 
         now = timezone.now()
         # TODO: vertrouwelijkAanduiding
@@ -322,6 +333,8 @@ class Client(BaseClient):
             template="stuf_zds/soap/voegZaakdocumentToe.xml",
             context=context,
             endpoint_type=EndpointType.ontvang_asynchroon,
+            base64_content=document.content if stream else None,
+            base64_placeholder=placeholder,
         )
 
     def create_zaak_document(
@@ -1,4 +1,6 @@
-from django.test import tag
+from base64 import b64encode
+
+from django.test import override_settings, tag
 
 import requests_mock
 from freezegun import freeze_time
@@ -451,6 +453,37 @@ class StufZDSClientTests(StUFZDSTestBase):
             1,
         )
 
+    @override_settings(DOCUMENT_STREAMING_THRESHOLD=10)
+    def test_create_large_zaak_attachment_is_streamed(self, m):
+        client = StufZDSClient(self.service, self.options)
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+        )
+        submission_attachment = SubmissionFileAttachmentFactory.create(
+            file_name="my-attachment.doc",
+            content_type="application/msword",
+            content__data=b"x" * 1000,
+        )
+
+        client.create_zaak_attachment(
+            zaak_id="foo", doc_id="bar", submission_attachment=submission_attachment
+        )
+
+        request = m.request_history[0]
+        body = b"".join(request.body)
+        self.assertEqual(request.headers["Content-Length"], str(len(body)))
+        xml_doc = etree.fromstring(body)
+        self.assertSoapXMLCommon(xml_doc)
+        self.assertXPathEqualDict(
+            xml_doc,
+            {
+                "//zkn:object/zkn:identificatie": "bar",
+                "//zkn:object/zkn:inhoud": b64encode(b"x" * 1000).decode(),
+                "//zkn:object/zkn:inhoud/@stuf:bestandsnaam": "my-attachment.doc",
+            },
+        )
+
     def test_client_wraps_network_error(self, m):
         client = StufZDSClient(self.service, self.options)
         m.post(self.service.soap_service.url, exc=RequestException)
@@ -1,16 +1,22 @@
 from datetime import timedelta
-from typing import Any
+from functools import lru_cache
 
 from django.template import Library
 from django.utils import dateformat, timezone
+from django.utils.html import format_html, format_html_join
+from django.utils.safestring import SafeString
 
 from ..client import StuurGegevens, WSSecurity
+from ..stuf import InvolvedParty
 
 register = Library()
 
+# The envelope headers are built for every StUF call - they are assembled from
+# pre-formatted markup rather than rendered through (included) templates.
 
-@register.inclusion_tag("stuf/includes/security.xml")
-def render_security(wss: WSSecurity, expiry_minutes: int) -> dict[str, Any]:
+
+@register.simple_tag
+def render_security(wss: WSSecurity, expiry_minutes: int) -> SafeString | str:
     """
     Provide the security headers block based on service configuration.
 
@@ -30,27 +36,70 @@ def render_security(wss: WSSecurity, expiry_minutes: int) -> dict[str, Any]:
     UTC. The datetime module does not support leap seconds, so we should be safe in that
     regard.
     """
+    if not wss.use_wss:
+        return ""
+
     # get 'now' in UTC
     now = timezone.localtime(timezone.now(), timezone=timezone.utc)
     expires_at = now + timedelta(minutes=expiry_minutes)
-    return {
-        "use_wss": wss.use_wss,
-        "wss_username": wss.wss_username,
-        "wss_password": wss.wss_password,
-        "wss_created": now.isoformat(timespec="seconds").replace("+00:00", "Z"),
-        "wss_expires": expires_at.isoformat(timespec="seconds").replace("+00:00", "Z"),
-    }
+    return format_html(
+        '<Security xmlns="http://docs.oasis-open.org/wss/2004/01/oasis-200401-wss-wssecurity-secext-1.0.xsd">'
+        "<Timestamp><Created>{created}</Created><Expires>{expires}</Expires></Timestamp>"
+        "{username_token}"
+        "</Security>",
+        created=now.isoformat(timespec="seconds").replace("+00:00", "Z"),
+        expires=expires_at.isoformat(timespec="seconds").replace("+00:00", "Z"),
+        username_token=_render_username_token(wss.wss_username, wss.wss_password),
+    )
+
+
+def _render_username_token(username: str, password: str) -> SafeString | str:
+    if not (username or password):
+        return ""
+    return format_html(
+        "<UsernameToken>{}{}</UsernameToken>",
+        format_html("<Username>{}</Username>", username) if username else "",
+        format_html("<Password>{}</Password>", password) if password else "",
+    )
+
+
+@lru_cache(maxsize=32)
+def _render_party(
+    organisatie: str, applicatie: str, administratie: str, gebruiker: str
+) -> SafeString:
+    elements = [
+        ("organisatie", organisatie),
+        ("applicatie", applicatie),
+        ("administratie", administratie),
+        ("gebruiker", gebruiker),
+    ]
+    return format_html_join(
+        "",
+        "<StUF:{0}>{1}</StUF:{0}>",
+        # the applicatie is required, the other elements are optional
+        ((name, value) for name, value in elements if value or name == "applicatie"),
+    )
+
+
+def render_involved_party(party: InvolvedParty) -> SafeString:
+    return _render_party(
+        party.organisatie, party.applicatie, party.administratie, party.gebruiker
+    )
 
 
-@register.inclusion_tag("stuf/includes/stuurgegevens.xml")
+@register.simple_tag
 def render_stuurgegevens(
     stuurgegevens: StuurGegevens, referentienummer: str
-) -> dict[str, Any]:
+) -> SafeString:
     tijdstip_bericht = timezone.now()
     tijdstip_bericht = dateformat.format(tijdstip_bericht, "YmdHis")
-    return {
-        "zender": stuurgegevens.zender,
-        "ontvanger": stuurgegevens.ontvanger,
-        "referentienummer": referentienummer,
-        "tijdstip_bericht": tijdstip_bericht,
-    }
+    return format_html(
+        "<StUF:zender>{zender}</StUF:zender>"
+        "<StUF:ontvanger>{ontvanger}</StUF:ontvanger>"
+        "<StUF:referentienummer>{referentienummer}</StUF:referentienummer>"
+        "<StUF:tijdstipBericht>{tijdstip_bericht}</StUF:tijdstipBericht>",
+        zender=render_involved_party(stuurgegevens.zender),
+        ontvanger=render_involved_party(stuurgegevens.ontvanger),
+        referentienummer=referentienummer,
+        tijdstip_bericht=tijdstip_bericht,
+    )
@@ -0,0 +1,72 @@
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from freezegun import freeze_time
+from lxml import etree
+
+from ..stuf import InvolvedParty, StuurGegevens, WSSecurity
+
+STUF_NS = "http://www.egem.nl/StUF/StUF0301"
+
+
+def _render(template: str, **context) -> etree._Element:
+    output = Template("{% load stuf %}" + template).render(Context(context))
+    return etree.fromstring(f'<root xmlns:StUF="{STUF_NS}">{output}</root>')
+
+
+class RenderStuurgegevensTests(SimpleTestCase):
+    @freeze_time("2023-02-03T15:09:27+01:00")
+    def test_render_stuurgegevens(self):
+        stuurgegevens = StuurGegevens(
+            zender=InvolvedParty(applicatie="Open Forms", organisatie="Maykin & co"),
+            ontvanger=InvolvedParty(applicatie="ZDS", gebruiker="<admin>"),
+        )
+
+        root = _render(
+            "{% render_stuurgegevens stuurgegevens referentienummer %}",
+            stuurgegevens=stuurgegevens,
+            referentienummer="abc-123",
+        )
+
+        values = {
+            etree.QName(element).localname: element.text for element in root.iter()
+        }
+        self.assertEqual(
+            [
+                etree.QName(element).localname
+                for element in root.find(f"{{{STUF_NS}}}zender")
+            ],
+            ["organisatie", "applicatie"],
+        )
+        self.assertEqual(
+            [
+                etree.QName(element).localname
+                for element in root.find(f"{{{STUF_NS}}}ontvanger")
+            ],
+            ["applicatie", "gebruiker"],
+        )
+        self.assertEqual(values["organisatie"], "Maykin & co")
+        self.assertEqual(values["gebruiker"], "<admin>")
+        self.assertEqual(values["referentienummer"], "abc-123")
+        self.assertEqual(values["tijdstipBericht"], "20230203140927")
+
+    def test_render_security_disabled(self):
+        root = _render(
+            "{% render_security wss 5 %}",
+            wss=WSSecurity(use_wss=False, wss_username="user", wss_password="secret"),
+        )
+
+        self.assertEqual(len(root), 0)
+
+    def test_render_security_without_credentials(self):
+        root = _render(
+            "{% render_security wss 5 %}",
+            wss=WSSecurity(use_wss=True, wss_username="", wss_password=""),
+        )
+
+        security = root[0]
+        self.assertEqual(etree.QName(security).localname, "Security")
+        self.assertEqual(
+            [etree.QName(element).localname for element in security],
+            ["Timestamp"],
+        )